@@ -1,5 +1,37 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .exceptions import ImproperlyConfiguredError
-from .fastapi_middleware import apply_translation
 from .translator import TranslationOptions, Translator
 
-__all__ = ["ImproperlyConfiguredError", "TranslationOptions", "Translator", "apply_translation"]
+if TYPE_CHECKING:
+    from .fastapi_middleware import TranslationMiddleware, apply_translation
+
+# web integrations are imported on first access, so that using the translator
+# with plain SQLModel doesn't import their frameworks
+_LAZY_ATTRIBUTES = {
+    "TranslationMiddleware": "fastapi_middleware",
+    "apply_translation": "fastapi_middleware",
+}
+
+__all__ = [
+    "ImproperlyConfiguredError",
+    "TranslationMiddleware",
+    "TranslationOptions",
+    "Translator",
+    "apply_translation",
+]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    if name not in _LAZY_ATTRIBUTES:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
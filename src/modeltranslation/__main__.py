@@ -0,0 +1,187 @@
+r"""Command line interface, run as `python -m modeltranslation`.
+
+Examples:
+    Print the statements adding the columns of a new language, then execute them:
+
+        $ python -m modeltranslation migrate app.models:translator --url sqlite:///app.db --dry-run
+        $ python -m modeltranslation migrate app.models:translator --url sqlite:///app.db
+
+    Fill the new language from its fallback chain, 5000 rows per transaction:
+
+        $ python -m modeltranslation backfill app.models:translator --url sqlite:///app.db \
+            --language de --batch-size 5000
+
+    Report how much of every model is translated, as CSV:
+
+        $ python -m modeltranslation coverage app.models:translator --url sqlite:///app.db --format csv
+
+"""
+
+import argparse
+import sys
+from collections.abc import Callable, Sequence
+from importlib import import_module
+from typing import Any
+
+from sqlalchemy import Engine, create_engine
+from sqlmodel import SQLModel
+
+from .coverage import to_csv, to_json
+from .exceptions import ImproperlyConfiguredError
+from .migration import DEFAULT_BATCH_SIZE
+from .translator import Translator
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line interface with `argv`, the arguments of the process if `None`.
+
+    Returns:
+        int: The exit status.
+
+    """
+    parser = _make_parser()
+    args = parser.parse_args(argv)
+    if args.after is not None and args.model is None:
+        parser.error("--after requires --model")
+
+    try:
+        translator = _import_translator(args.translator)
+    except (ImportError, AttributeError, TypeError) as error:
+        parser.error(str(error))
+
+    engine = create_engine(args.url)
+    try:
+        command: Callable[[Translator, Engine, argparse.Namespace], int] = args.command
+        return command(translator, engine, args)
+    finally:
+        engine.dispose()
+
+
+def _make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m modeltranslation", description="Migrate databases of translated SQLModel models."
+    )
+    commands = parser.add_subparsers(required=True)
+
+    migrate = commands.add_parser(
+        "migrate", help="create the missing tables and translation columns of the registered models"
+    )
+    migrate.add_argument(
+        "--dry-run", action="store_true", help="print the statements without executing them"
+    )
+    migrate.set_defaults(command=_migrate, after=None, model=None)
+
+    backfill = commands.add_parser("backfill", help="fill the empty translations of a language")
+    backfill.add_argument("--language", required=True, help="the language to fill")
+    backfill.add_argument(
+        "--source",
+        choices=("fallback", "default"),
+        default="fallback",
+        help="fill from the fallback chain of the language or from the default language",
+    )
+    backfill.add_argument("--model", help="the name of the model to fill, all models if omitted")
+    backfill.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="rows per transaction")
+    backfill.add_argument("--after", help="the primary key to resume after, printed by an interrupted run")
+    backfill.set_defaults(command=_backfill)
+
+    coverage = commands.add_parser(
+        "coverage", help="report how many rows are translated, per model, field and language"
+    )
+    coverage.add_argument("--format", choices=("json", "csv"), default="json", help="the report format")
+    coverage.add_argument("--workers", type=int, help="the number of models counted in parallel")
+    coverage.set_defaults(command=_coverage, after=None, model=None)
+
+    for command in (migrate, backfill, coverage):
+        command.add_argument(
+            "translator", help="import path of the translator, e.g. 'app.models:translator'"
+        )
+        command.add_argument("--url", required=True, help="the database URL, e.g. 'sqlite:///app.db'")
+    return parser
+
+
+def _import_translator(path: str) -> Translator:
+    """Import the translator at `module:attribute`, which registers the models of the module."""
+    module_name, _, attribute = path.partition(":")
+    translator = getattr(import_module(module_name), attribute or "translator")
+    if not isinstance(translator, Translator):
+        msg = f"'{path}' is not a Translator"
+        raise TypeError(msg)
+    return translator
+
+
+def _primary_key(model: type[SQLModel], value: str | None) -> Any:  # noqa: ANN401
+    """Convert `value` to the type of the primary key of `model`, e.g. `007` stays `"007"` for strings."""
+    columns = list(model.__table__.primary_key.columns)  # pyright: ignore[reportAttributeAccessIssue]
+    # backfill_language reports composite primary keys
+    if value is None or len(columns) != 1:
+        return value
+    try:
+        python_type = columns[0].type.python_type
+    except NotImplementedError:
+        return value
+    try:
+        return python_type(value)
+    except ValueError as error:
+        msg = f"--after {value!r} is not a valid {python_type.__name__} primary key of '{model.__name__}'"
+        raise ValueError(msg) from error
+
+
+def _migrate(translator: Translator, engine: Engine, args: argparse.Namespace) -> int:
+    with engine.begin() as connection:
+        if args.dry_run:
+            statements = translator.schema_changes(connection)
+        else:
+            statements = translator.migrate_schema(connection)
+        for statement in statements:
+            sys.stdout.write(f"{str(statement.compile(connection)).strip()};\n")
+    if not statements:
+        sys.stdout.write("-- the schema is up to date\n")
+    return 0
+
+
+def _backfill(translator: Translator, engine: Engine, args: argparse.Namespace) -> int:
+    models = translator.get_registered_models()
+    if args.model is not None:
+        models = tuple(model for model in models if model.__name__ == args.model)
+        if not models:
+            sys.stderr.write(f"'{args.model}' is not registered in the translator\n")
+            return 1
+
+    for model in models:
+
+        def progress(pk: Any, name: str = model.__name__) -> None:  # noqa: ANN401
+            sys.stdout.write(f"{name}: filled up to {pk}\n")
+
+        try:
+            rows = translator.backfill_language(
+                engine,
+                model,
+                args.language,
+                source=args.source,
+                batch_size=args.batch_size,
+                after=_primary_key(model, args.after),
+                progress=progress,
+            )
+        except ImproperlyConfiguredError as error:
+            # other storages don't need a backfill, their missing translations have no column
+            sys.stderr.write(f"{model.__name__}: skipped, {error}\n")
+            continue
+        except ValueError as error:
+            sys.stderr.write(f"{error}\n")
+            return 1
+        sys.stdout.write(f"{model.__name__}: {rows} rows\n")
+    return 0
+
+
+def _coverage(translator: Translator, engine: Engine, args: argparse.Namespace) -> int:
+    try:
+        report = translator.coverage_report(engine, max_workers=args.workers)
+    except ImproperlyConfiguredError as error:
+        sys.stderr.write(f"{error}\n")
+        return 1
+    sys.stdout.write(to_csv(report) if args.format == "csv" else to_json(report) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import csv
+import json
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from datetime import time as datetime_time
+from itertools import batched
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypedDict
+
+from sqlalchemy import Column, Connection, Table, bindparam, insert, select, update
+from sqlalchemy.orm import Session
+
+from .exceptions import ImproperlyConfiguredError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, Sequence
+
+    from sqlalchemy import Select
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+    from .plan import TranslationPlan
+
+
+class TranslationRecord(TypedDict):
+    """A single translated value, `value` of `field` in `language` for the row with primary key `pk`."""
+
+    pk: Any
+    field: str
+    language: str
+    value: Any
+
+
+@dataclass(frozen=True, slots=True)
+class BulkImportResult:
+    """Summary of a bulk import."""
+
+    rows: int
+    """Number of imported records."""
+
+    seconds: float
+    """Wall time of the import."""
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else float("inf")
+
+
+def read_csv(path: str | Path) -> Iterator[TranslationRecord]:
+    """Stream translation records from a CSV file with a `pk,field,language,value` header.
+
+    Every `pk` and `value` is read as text, importing converts them to the types of their columns.
+    """
+    with Path(path).open(newline="", encoding="utf-8") as file:
+        for row in csv.DictReader(file):
+            yield TranslationRecord(
+                pk=row["pk"], field=row["field"], language=row["language"], value=row["value"]
+            )
+
+
+def read_json_lines(path: str | Path) -> Iterator[TranslationRecord]:
+    """Stream translation records from a file with one JSON object per line."""
+    with Path(path).open(encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def write_csv(path: str | Path, records: Iterable[TranslationRecord]) -> int:
+    """Write translation records to a CSV file with a `pk,field,language,value` header.
+
+    Returns:
+        int: The number of written records.
+
+    """
+    rows = 0
+    with Path(path).open("w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=("pk", "field", "language", "value"))
+        writer.writeheader()
+        for record in records:
+            writer.writerow(record)
+            rows += 1
+    return rows
+
+
+def write_json_lines(path: str | Path, records: Iterable[TranslationRecord]) -> int:
+    """Write translation records to a file with one JSON object per line.
+
+    Returns:
+        int: The number of written records.
+
+    """
+    rows = 0
+    with Path(path).open("w", encoding="utf-8") as file:
+        for record in records:
+            file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            rows += 1
+    return rows
+
+
+def bulk_import(  # noqa: PLR0913
+    plan: TranslationPlan,
+    languages: tuple[str, ...],
+    bind: Session | Connection,
+    records: Iterable[TranslationRecord],
+    *,
+    batch_size: int = 1000,
+    upsert: bool = False,
+) -> BulkImportResult:
+    """Write translation records in batches, see `Translator.bulk_import`."""
+    connection = bind.connection() if isinstance(bind, Session) else bind
+    table, primary_key = _translation_table(plan, "import")
+    coerce_pk = _text_coercion(primary_key)
+    coercions: dict[str, Callable[[Any], Any]] = {}
+
+    fields = frozenset(plan.fields)
+    statements: dict[str, Any] = {}
+
+    rows = 0
+    start = time.perf_counter()
+    for batch in batched(records, batch_size):
+        # one executemany per translation column, later records for the same row win
+        columns: dict[str, dict[Any, Any]] = {}
+        for record in batch:
+            field, language = record["field"], record["language"]
+            if field not in fields or language not in languages:
+                msg = f"'{field}' in '{language}' is not a translation field of '{plan.model.__name__}'"
+                raise ValueError(msg)
+            column = f"{field}_{language}"
+            coerce = coercions.get(column)
+            if coerce is None:
+                coerce = coercions[column] = _text_coercion(table.columns[column])
+            columns.setdefault(column, {})[coerce_pk(record["pk"])] = coerce(record["value"])
+
+        inserted = _insert_missing_rows(connection, table, primary_key, columns) if upsert else set()
+        for column, values in columns.items():
+            parameters = [
+                {"b_pk": pk, "b_value": value} for pk, value in values.items() if pk not in inserted
+            ]
+            if not parameters:
+                continue
+            statement = statements.get(column)
+            if statement is None:
+                statement = statements[column] = (
+                    update(table)
+                    .where(primary_key == bindparam("b_pk"))
+                    .values({column: bindparam("b_value")})
+                )
+            connection.execute(statement, parameters)
+
+        rows += len(batch)
+
+    return BulkImportResult(rows=rows, seconds=time.perf_counter() - start)
+
+
+async def async_bulk_import(  # noqa: PLR0913
+    plan: TranslationPlan,
+    languages: tuple[str, ...],
+    bind: AsyncSession | AsyncConnection,
+    records: Iterable[TranslationRecord] | AsyncIterable[TranslationRecord],
+    *,
+    batch_size: int = 1000,
+    upsert: bool = False,
+) -> BulkImportResult:
+    """Write translation records in batches with an async session or connection, see `bulk_import`."""
+    if not hasattr(records, "__aiter__"):
+        # a single switch to the sync API for the whole import
+        return await bind.run_sync(
+            _bulk_import_with, plan, languages, records, batch_size=batch_size, upsert=upsert
+        )
+
+    rows = 0
+    start = time.perf_counter()
+    batch: list[TranslationRecord] = []
+    async for record in records:  # pyright: ignore[reportGeneralTypeIssues]
+        batch.append(record)
+        if len(batch) == batch_size:
+            await bind.run_sync(
+                _bulk_import_with, plan, languages, batch, batch_size=batch_size, upsert=upsert
+            )
+            rows += len(batch)
+            batch = []
+    if batch:
+        await bind.run_sync(_bulk_import_with, plan, languages, batch, batch_size=batch_size, upsert=upsert)
+        rows += len(batch)
+
+    return BulkImportResult(rows=rows, seconds=time.perf_counter() - start)
+
+
+def bulk_export(
+    plan: TranslationPlan,
+    languages: Sequence[str],
+    bind: Session | Connection,
+    *,
+    batch_size: int = 1000,
+) -> Iterator[TranslationRecord]:
+    """Stream the stored translations in `languages` as records, see `Translator.bulk_export`."""
+    statement, columns = _export_statement(plan, languages, batch_size)
+    connection = bind.connection() if isinstance(bind, Session) else bind
+    return _export_records(connection.execute(statement), columns)
+
+
+def async_bulk_export(
+    plan: TranslationPlan,
+    languages: Sequence[str],
+    bind: AsyncSession | AsyncConnection,
+    *,
+    batch_size: int = 1000,
+) -> AsyncIterator[TranslationRecord]:
+    """Stream the stored translations in `languages` as records with an async session or connection."""
+    statement, columns = _export_statement(plan, languages, batch_size)
+    return _async_export_records(bind, statement, columns)
+
+
+def _bulk_import_with(
+    bind: Session | Connection,
+    plan: TranslationPlan,
+    languages: tuple[str, ...],
+    records: Iterable[TranslationRecord],
+    **options: Any,  # noqa: ANN401
+) -> BulkImportResult:
+    """`bulk_import` with the bind first, as called by `run_sync`."""
+    return bulk_import(plan, languages, bind, records, **options)
+
+
+def _export_statement(
+    plan: TranslationPlan, languages: Sequence[str], batch_size: int
+) -> tuple[Select, list[tuple[str, str]]]:
+    """Return the query streaming the translation columns, and the `(field, language)` of each column."""
+    table, primary_key = _translation_table(plan, "export")
+    columns = [(field, language) for field in plan.fields for language in languages]
+    statement = select(primary_key, *(table.columns[f"{field}_{language}"] for field, language in columns))
+    # rows are fetched from the database in batches instead of all at once
+    return statement.order_by(primary_key).execution_options(yield_per=batch_size), columns
+
+
+def _export_records(rows: Iterable[Any], columns: list[tuple[str, str]]) -> Iterator[TranslationRecord]:
+    for pk, *values in rows:
+        for (field, language), value in zip(columns, values, strict=True):
+            if value is not None:
+                yield TranslationRecord(pk=pk, field=field, language=language, value=value)
+
+
+async def _async_export_records(
+    bind: AsyncSession | AsyncConnection, statement: Select, columns: list[tuple[str, str]]
+) -> AsyncIterator[TranslationRecord]:
+    result = await bind.stream(statement)
+    async for partition in result.partitions():
+        for record in _export_records(partition, columns):
+            yield record
+
+
+def _translation_table(plan: TranslationPlan, operation: str) -> tuple[Table, Column]:
+    """Return the table and the primary key of a model translated in columns, for bulk operations."""
+    if plan.storage != "columns":
+        msg = f"bulk {operation} requires 'columns' storage, '{plan.model.__name__}' uses '{plan.storage}'"
+        raise ImproperlyConfiguredError(msg)
+
+    table: Table = plan.model.__table__  # pyright: ignore[reportAttributeAccessIssue]
+    primary_keys = list(table.primary_key.columns)
+    if len(primary_keys) != 1:
+        msg = (
+            f"bulk {operation} requires a single column primary key, '{table.name}' has {len(primary_keys)}"
+        )
+        raise ImproperlyConfiguredError(msg)
+    return table, primary_keys[0]
+
+
+def _insert_missing_rows(
+    connection: Connection, table: Table, primary_key: Column, columns: dict[str, dict[Any, Any]]
+) -> set[Any]:
+    """Insert the rows of a batch that don't exist yet, with all their values, and return their keys.
+
+    Raises:
+        ImproperlyConfiguredError: If a `NOT NULL` column without a default has no value in the batch.
+
+    """
+    pks = {pk for values in columns.values() for pk in values}
+    existing = set(connection.scalars(select(primary_key).where(primary_key.in_(pks))))
+
+    rows: dict[Any, dict[str, Any]] = {}
+    for column, values in columns.items():
+        for pk, value in values.items():
+            if pk not in existing:
+                rows.setdefault(pk, {primary_key.name: pk})[column] = value
+
+    # rows with the same columns are inserted with a single executemany
+    groups: dict[frozenset[str], list[dict[str, Any]]] = {}
+    for row in rows.values():
+        groups.setdefault(frozenset(row), []).append(row)
+
+    required = {
+        column.name
+        for column in table.columns
+        if not column.nullable and column.default is None and column.server_default is None
+    }
+    for names, group in groups.items():
+        missing = required - names
+        if missing:
+            msg = (
+                f"upsert can't insert rows into '{table.name}' without a value for "
+                f"{', '.join(sorted(missing))}, which are NOT NULL without a default"
+            )
+            raise ImproperlyConfiguredError(msg)
+        connection.execute(insert(table), group)
+    return set(rows)
+
+
+def _text_coercion(column: Column) -> Callable[[Any], Any]:
+    """Return a function converting values read from text files to the type of `column`."""
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return lambda value: value
+
+    if python_type is str:
+        return lambda value: value
+    if python_type is bool:
+        return lambda value: (
+            value.strip().lower() in ("1", "true", "yes") if isinstance(value, str) else value
+        )
+    # `date("2024-01-01")` doesn't parse, the constructors of the other types do
+    convert = python_type.fromisoformat if python_type in (datetime, date, datetime_time) else python_type
+    return lambda value: convert(value) if isinstance(value, str) else value
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+CacheKey = tuple[str, Any, str]
+"""Key of a cached instance, `(table name, primary key, language)`, the table name includes its schema."""
+
+
+class TranslationCache(Protocol):
+    """Storage of resolved translations used by a `Translator` created with a `cache`.
+
+    Values are `{field: value}` dicts of the translated fields of one instance in one language.
+    The methods work on many keys at once, so that a shared cache, like Redis,
+    can answer a whole batch in one round trip (`MGET`, `MSET`, `DEL`).
+    Implementations decide on eviction, e.g. with a size limit or an expiry time.
+    """
+
+    def get_many(self, keys: Sequence[CacheKey]) -> list[dict[str, Any] | None]:
+        """Return the cached values of `keys`, in order, `None` where a key is missing."""
+        ...
+
+    def set_many(self, values: Mapping[CacheKey, dict[str, Any]]) -> None:
+        """Store `values`, replacing existing values of the same keys."""
+        ...
+
+    def delete_many(self, keys: Iterable[CacheKey]) -> None:
+        """Remove `keys`, missing keys are ignored."""
+        ...
+
+    def clear(self) -> None:
+        """Remove every value."""
+        ...
+
+
+class MemoryCache:
+    """In-process `TranslationCache` with least recently used and time to live eviction.
+
+    Values are shared by all threads of the process, and not copied, so don't modify them.
+
+    Examples:
+        >>> from modeltranslation.cache import MemoryCache
+        >>> translator = Translator("en", ("en", "pl"), cache=MemoryCache(maxsize=50_000, ttl=300))
+
+    """
+
+    __slots__ = ("_entries", "_lock", "maxsize", "ttl")
+
+    def __init__(self, maxsize: int = 10_000, ttl: float | None = None) -> None:
+        """Construct an empty cache.
+
+        Args:
+            maxsize (int): The number of values kept, the least recently used values are evicted first.
+            ttl (float | None): Seconds a value is kept after it was stored, forever if `None`.
+
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (expiry time, value), in order of use
+        self._entries: OrderedDict[CacheKey, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_many(self, keys: Sequence[CacheKey]) -> list[dict[str, Any] | None]:
+        now = monotonic()
+        values: list[dict[str, Any] | None] = []
+        with self._lock:
+            entries = self._entries
+            for key in keys:
+                entry = entries.get(key)
+                if entry is None:
+                    values.append(None)
+                elif entry[0] < now:
+                    del entries[key]
+                    values.append(None)
+                else:
+                    entries.move_to_end(key)
+                    values.append(entry[1])
+        return values
+
+    def set_many(self, values: Mapping[CacheKey, dict[str, Any]]) -> None:
+        expires = float("inf") if self.ttl is None else monotonic() + self.ttl
+        with self._lock:
+            entries = self._entries
+            for key, value in values.items():
+                entries[key] = (expires, value)
+                entries.move_to_end(key)
+            while len(entries) > self.maxsize:
+                entries.popitem(last=False)
+
+    def delete_many(self, keys: Iterable[CacheKey]) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
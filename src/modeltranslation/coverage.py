@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from dataclasses import asdict, dataclass
+from dataclasses import field as dataclass_field
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import and_, case, func, or_, select
+
+from .plan import NO_UNDEFINED_VALUE
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy import ColumnElement, Connection
+
+    from .plan import TranslationPlan
+
+CSV_HEADER = ("model", "field", "language", "rows", "translated", "coverage", "fallbacks", "fallback_values")
+"""Columns of the CSV coverage report, `fallbacks` is a JSON object of rows by fallback depth."""
+
+
+@dataclass(frozen=True, slots=True)
+class FieldCoverage:
+    """How the rows of a model resolve a translated field in one language."""
+
+    model: str
+    """Name of the registered model."""
+
+    field: str
+    """Name of the translated field."""
+
+    language: str
+    """The language the field is resolved in."""
+
+    rows: int
+    """Rows of the model."""
+
+    translated: int
+    """Rows with a value in the language itself."""
+
+    fallbacks: dict[int, int] = dataclass_field(default_factory=dict)
+    """Rows resolved by a fallback language, by its position in the fallback chain, starting at 1."""
+
+    fallback_values: int = 0
+    """Rows resolved by the fallback value, as no language of the chain has a value."""
+
+    @property
+    def coverage(self) -> float:
+        """The share of the rows translated in the language, 1 for a model without rows."""
+        return self.translated / self.rows if self.rows else 1.0
+
+
+def model_coverage(
+    connection: Connection, plan: TranslationPlan, languages: tuple[str, ...]
+) -> list[FieldCoverage]:
+    """Return the coverage of every translated field of a model in `languages`, with a single query.
+
+    Each field, language and position in the fallback chain is a `COUNT(CASE WHEN ...)` of the rows
+    it resolves, counting `NULL` and `fallback_undefined` values as missing, like reading the field.
+
+    Args:
+        connection (Connection): The connection to query with.
+        plan (TranslationPlan): The plan of a registered model.
+        languages (tuple[str, ...]): The languages to report.
+
+    Returns:
+        list[FieldCoverage]: The coverage by field and language, in the order of the fields and `languages`.
+
+    """
+    model = plan.model
+    keys: list[tuple[str, str, int]] = []
+    counts: list[ColumnElement] = []
+    for field in plan.fields:
+        undefined = plan.undefined_values[field]
+        for language in languages:
+            chain = [getattr(model, f"{field}_{lang}") for lang in plan.language_chains[language]]
+            for depth, column in enumerate(chain):
+                # resolved at `depth` when it's the first language of the chain with a value
+                resolved = and_(
+                    *(_is_missing(previous, undefined) for previous in chain[:depth]),
+                    ~_is_missing(column, undefined),
+                )
+                counts.append(func.count(case((resolved, 1))))
+                keys.append((field, language, depth))
+
+    rows, *values = connection.execute(select(func.count(), *counts).select_from(model)).one()
+
+    depths: dict[tuple[str, str], dict[int, int]] = {}
+    for (field, language, depth), value in zip(keys, values, strict=True):
+        depths.setdefault((field, language), {})[depth] = value
+
+    report = []
+    for (field, language), resolved in depths.items():
+        translated = resolved.pop(0)
+        report.append(
+            FieldCoverage(
+                model=model.__name__,
+                field=field,
+                language=language,
+                rows=rows,
+                translated=translated,
+                fallbacks=resolved,
+                fallback_values=rows - translated - sum(resolved.values()),
+            )
+        )
+    return report
+
+
+def to_json(report: Iterable[FieldCoverage]) -> str:
+    """Return the coverage report as a JSON array of objects, with the `coverage` of each entry.
+
+    Examples:
+        >>> from modeltranslation.coverage import to_json
+        >>> print(to_json(translator.coverage_report(engine)))
+        [{"model": "Book", "field": "title", "language": "pl", "rows": 120, "translated": 96, ...}]
+
+    """
+    return json.dumps(
+        [{**asdict(entry), "coverage": entry.coverage} for entry in report], ensure_ascii=False
+    )
+
+
+def to_csv(report: Iterable[FieldCoverage]) -> str:
+    """Return the coverage report as CSV with a header, see `CSV_HEADER`."""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(CSV_HEADER)
+    for entry in report:
+        writer.writerow(
+            (
+                entry.model,
+                entry.field,
+                entry.language,
+                entry.rows,
+                entry.translated,
+                round(entry.coverage, 4),
+                json.dumps(entry.fallbacks),
+                entry.fallback_values,
+            )
+        )
+    return output.getvalue()
+
+
+def _is_missing(column: Any, undefined: Any) -> ColumnElement:  # noqa: ANN401
+    if undefined is NO_UNDEFINED_VALUE:
+        return column.is_(None)
+    return or_(column.is_(None), column == undefined)
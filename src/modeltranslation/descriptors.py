@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from sqlmodel import SQLModel
+
+    from .plan import TranslationPlan
+    from .translator import Translator
+
+
+class TranslationDescriptor:
+    """Data descriptor installed on a registered model in place of a translated field.
+
+    Reading the field from an instance returns the value of the active language,
+    resolved through the fallback languages and fallback values.
+    Reading the field from the class (e.g. `Book.title` in a query) returns the
+    column of the active language, or the fallback expression with `sql_fallbacks`.
+    Assigning to the field writes the translation field of the active language, the registered
+    model's `__setattr__` calls `__set__`, as SQLModel would otherwise skip data descriptors of fields.
+
+    Only the translated fields of the registered model are routed through this descriptor,
+    so reading any other attribute, of this or any other model, costs exactly as much as on
+    a plain SQLModel, no matter how many models are registered.
+    """
+
+    __slots__ = ("_field", "_plan", "_translator")
+
+    def __init__(self, translator: Translator, field: str, plan: TranslationPlan) -> None:
+        self._translator = translator
+        self._field = field
+        self._plan = plan
+
+    def __get__(self, instance: SQLModel | None, owner: type[SQLModel]) -> Any:  # noqa: ANN401
+        translator = self._translator
+        if instance is None:
+            return translator._get_class_translation(owner, self._field, self._plan)  # noqa: SLF001
+        return translator._get_translation(instance, self._field, self._plan)  # noqa: SLF001
+
+    def __set__(self, instance: SQLModel, value: Any) -> None:  # noqa: ANN401
+        setattr(instance, self._translator._get_translation_field(self._field), value)  # noqa: SLF001
+
+
+class TranslationTableDescriptor(TranslationDescriptor):
+    """`TranslationDescriptor` of a model whose translations are stored in a companion table.
+
+    Reading the field from an instance resolves the translation rows of the fallback chain,
+    assigning to it writes the row of the active language, creating it if needed.
+    """
+
+    __slots__ = ()
+
+    def __get__(self, instance: SQLModel | None, owner: type[SQLModel]) -> Any:  # noqa: ANN401
+        translator = self._translator
+        if instance is None:
+            return translator._get_class_translation(owner, self._field, self._plan)  # noqa: SLF001
+        return translator._get_table_translation(  # noqa: SLF001
+            instance, self._field, self._plan, translator.get_active_language()
+        )
+
+    def __set__(self, instance: SQLModel, value: Any) -> None:  # noqa: ANN401
+        self._translator._set_table_translation(instance, self._field, value, self._plan)  # noqa: SLF001
+
+
+class TranslationJSONDescriptor(TranslationDescriptor):
+    """`TranslationDescriptor` of a model whose translations are stored in a JSON column per field.
+
+    Reading the field from an instance resolves the languages of the fallback chain
+    from the `{language: value}` object, assigning to it sets the key of the active language.
+    """
+
+    __slots__ = ()
+
+    def __get__(self, instance: SQLModel | None, owner: type[SQLModel]) -> Any:  # noqa: ANN401
+        translator = self._translator
+        if instance is None:
+            return translator._get_class_translation(owner, self._field, self._plan)  # noqa: SLF001
+        return translator._get_json_translation(  # noqa: SLF001
+            instance, self._field, self._plan, translator.get_active_language()
+        )
+
+    def __set__(self, instance: SQLModel, value: Any) -> None:  # noqa: ANN401
+        self._translator._set_json_translation(instance, self._field, value, self._plan)  # noqa: SLF001
@@ -1,13 +1,181 @@
-from fastapi import FastAPI, Request
+from functools import _CacheInfo, lru_cache
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from .translator import Translator
 
 
+class LanguageNegotiator:
+    """Picks the best supported language for an accept-language header.
+
+    Language ranges are tried in order of their quality value (RFC 9110), ranges with
+    `q=0` reject the language. A range matches a supported language either exactly,
+    after dropping its subtags (`pl-PL` matches `pl`) or as a prefix (`pt` matches `pt-BR`),
+    case-insensitively. The `*` wildcard matches the default language, or the first
+    supported language that was not rejected.
+
+    Results are memoized per raw header value in a bounded LRU cache,
+    as real traffic only uses a few hundred distinct headers.
+
+    Args:
+        languages (tuple[str, ...]): The supported languages.
+        default_language (str): The language matched by the `*` wildcard.
+        cache_size (int): The number of header values to memoize, 0 disables the cache.
+
+    Examples:
+        >>> negotiator = LanguageNegotiator(languages=("en", "pl"), default_language="en")
+        >>> negotiator("fr-FR,pl-PL;q=0.9,en;q=0.8")
+        'pl'
+        >>> negotiator("fr, *;q=0.5")
+        'en'
+
+    """
+
+    def __init__(self, languages: tuple[str, ...], default_language: str, cache_size: int = 1024) -> None:
+        self._languages = languages
+        self._default_language = default_language
+
+        # lowercase language range -> supported language, exact matches win over prefixes
+        self._lookup: dict[str, str] = {}
+        for language in languages:
+            self._lookup.setdefault(language.lower(), language)
+        for language in languages:
+            tag = language.lower()
+            while "-" in tag:
+                tag = tag.rpartition("-")[0]
+                self._lookup.setdefault(tag, language)
+
+        self._negotiate = lru_cache(maxsize=cache_size)(self._negotiate_uncached)
+
+    def __call__(self, header: str | bytes) -> str | None:
+        """Return the supported language to use for the header value, `None` if there is none."""
+        return self._negotiate(header)
+
+    def cache_info(self) -> _CacheInfo:
+        """Return the hit and miss statistics of the header cache."""
+        return self._negotiate.cache_info()
+
+    def _negotiate_uncached(self, header: str | bytes) -> str | None:
+        if isinstance(header, bytes):
+            header = header.decode("latin-1")
+
+        ranges = self._parse(header)
+        rejected = {self._lookup.get(tag) for quality, tag in ranges if quality == 0}
+
+        for quality, tag in ranges:
+            if quality == 0:
+                # ranges are sorted, nothing acceptable is left
+                break
+            if tag == "*":
+                candidates = (self._default_language, *self._languages)
+                return next((language for language in candidates if language not in rejected), None)
+
+            language = self._match(tag)
+            if language is not None and language not in rejected:
+                return language
+        return None
+
+    def _parse(self, header: str) -> list[tuple[float, str]]:
+        """Return `(quality, range)` pairs sorted by quality, keeping the header order for ties."""
+        ranges = []
+        for entry in header.split(","):
+            tag, *params = entry.split(";")
+            tag = tag.strip().lower()
+            if not tag:
+                continue
+
+            quality = 1.0
+            for param in params:
+                name, _, value = param.partition("=")
+                if name.strip().lower() == "q":
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = -1.0
+
+            # skip entries with malformed weights
+            if 0 <= quality <= 1:
+                ranges.append((quality, tag))
+
+        ranges.sort(key=lambda entry: entry[0], reverse=True)
+        return ranges
+
+    def _match(self, tag: str) -> str | None:
+        # drop subtags from the end until the range matches, e.g. zh-hant-tw -> zh-hant -> zh
+        while True:
+            language = self._lookup.get(tag)
+            if language is not None:
+                return language
+            tag, separator, _ = tag.rpartition("-")
+            if not separator:
+                return None
+
+
+class TranslationMiddleware:
+    """ASGI middleware that sets the active language from the accept-language header.
+
+    The language is set for the whole duration of an HTTP request or a websocket
+    connection and restored afterwards. Unlike `@app.middleware("http")` the
+    middleware does not wrap the request in a separate task and response stream.
+    The header is negotiated with
+    [`LanguageNegotiator`][modeltranslation.fastapi_middleware.LanguageNegotiator].
+
+    Args:
+        app (ASGIApp): The wrapped ASGI application.
+        translator (Translator): The translator used to register translations in this app.
+        cache_size (int): The number of distinct header values to memoize.
+
+    Examples:
+        >>> from fastapi import FastAPI
+        >>> from modeltranslation import TranslationMiddleware, Translator
+        ...
+        >>> translator = Translator(
+        ...     default_language="en",
+        ...     languages=("en", "pl"),
+        ... )
+        >>> app = FastAPI()
+        >>> app.add_middleware(TranslationMiddleware, translator=translator)
+
+    """
+
+    def __init__(self, app: ASGIApp, translator: Translator, cache_size: int = 1024) -> None:
+        self.app = app
+        self.translator = translator
+        self.negotiator = LanguageNegotiator(
+            translator.get_languages(), translator.get_default_language(), cache_size
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        language = self._get_language(scope)
+        if language is None:
+            await self.app(scope, receive, send)
+            return
+
+        token = self.translator.set_active_language(language)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.translator.reset_active_language(token)
+
+    def _get_language(self, scope: Scope) -> str | None:
+        for name, value in scope["headers"]:
+            if name == b"accept-language":
+                return self.negotiator(value)
+        return None
+
+
 def apply_translation(app: FastAPI, translator: Translator) -> None:
     """Configure the app set the current language as a context variable.
 
-    Applies middleware to FastAPI app which sets language based on the accept-language HTTP header.
+    Applies middleware to FastAPI app which sets language based on the accept-language HTTP header,
+    honoring quality values, region subtags and wildcards.
     The resolved language is stored in the translator per execution context.
+    Both HTTP requests and websocket connections are translated.
 
     Args:
         app (FastAPI): FastAPI application.
@@ -29,15 +197,4 @@ def apply_translation(app: FastAPI, translator: Translator) -> None:
         the translator before calling this function.
 
     """
-
-    @app.middleware("http")
-    async def set_locale_context(request: Request, call_next):
-        header = request.headers.get("accept-language")
-        locale = header.split(",") if header else None
-        if locale:
-            for entry in locale:
-                lang = entry.split(";")
-                if lang[0] in translator.get_languages():
-                    translator.set_active_language(str(lang[0]))
-                    break
-        return await call_next(request)
+    app.add_middleware(TranslationMiddleware, translator=translator)
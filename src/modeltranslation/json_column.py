@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import JSON, Boolean, Column, Float, Integer, Numeric, String, TypeDecorator
+
+if TYPE_CHECKING:
+    from sqlalchemy import ColumnElement
+    from sqlalchemy.types import TypeEngine
+
+JSON_SUFFIX = "_i18n"
+"""Suffix of the JSON column storing all translations of a field with `json` storage."""
+
+
+def make_json_column(field: str) -> Column:
+    """Return the nullable JSON column storing the translations of `field` as `{language: value}`."""
+    return Column(f"{field}{JSON_SUFFIX}", JSON(none_as_null=True), nullable=True)
+
+
+def extract_translation(column: Column, language: str, value_type: TypeEngine) -> ColumnElement:
+    """Return an expression selecting the translation in `language` from a JSON translation column.
+
+    The key is extracted in SQL, with `JSON_EXTRACT` on SQLite and MySQL and `->>` on PostgreSQL,
+    and cast back to the type of the translated field, so the expression can be compared
+    and ordered like a translation column.
+
+    Args:
+        column (Column): A JSON translation column, see `make_json_column`.
+        language (str): The language to extract.
+        value_type (TypeEngine): The column type of the translated field.
+
+    Returns:
+        ColumnElement: The value in `language`, `NULL` if it is missing.
+
+    """
+    element = column[language]
+    if isinstance(value_type, TypeDecorator):
+        # e.g. SQLModel's `AutoString` of `str` fields
+        value_type = value_type.impl_instance
+
+    # Boolean before Integer, as some dialects implement it as one
+    for extracted_type, extract in (
+        (Boolean, element.as_boolean),
+        (Integer, element.as_integer),
+        ((Float, Numeric), element.as_float),
+        (String, element.as_string),
+    ):
+        if isinstance(value_type, extracted_type):
+            return extract()
+    return element.as_json()
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import DDL, Column, and_, func, inspect, literal, select, true, update
+from sqlalchemy.schema import CreateColumn, CreateIndex, CreateTable
+
+from .exceptions import ImproperlyConfiguredError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+    from sqlalchemy import ColumnElement, Connection, Engine, Table
+    from sqlalchemy.sql.ddl import ExecutableDDLElement
+
+DEFAULT_BATCH_SIZE = 1000
+"""Rows updated per transaction by a backfill."""
+
+
+def schema_changes(connection: Connection, tables: Iterable[Table]) -> list[ExecutableDDLElement]:
+    """Return the statements creating what `tables` have and the database of `connection` doesn't.
+
+    Missing tables are created with their indexes. Missing columns of existing tables are added
+    with `ALTER TABLE ... ADD COLUMN`, always nullable, so that they can be added to tables with rows,
+    followed by the indexes on them. Make required columns `NOT NULL` after backfilling them.
+
+    Args:
+        connection (Connection): A connection to the database to compare with.
+        tables (Iterable[Table]): The tables as the models define them.
+
+    Returns:
+        list[ExecutableDDLElement]: The statements, in the order to execute them.
+
+    """
+    inspector = inspect(connection)
+    preparer = connection.dialect.identifier_preparer
+    statements: list[ExecutableDDLElement] = []
+    for table in tables:
+        if not inspector.has_table(table.name, schema=table.schema):
+            statements.append(CreateTable(table))
+            statements.extend(CreateIndex(index) for index in table.indexes)
+            continue
+
+        existing = {column["name"] for column in inspector.get_columns(table.name, schema=table.schema)}
+        missing = [column for column in table.columns if column.name not in existing]
+        for column in missing:
+            added = Column(column.name, column.type, nullable=True)
+            column_ddl = CreateColumn(added).compile(dialect=connection.dialect)
+            statements.append(DDL(f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {column_ddl}"))
+        missing_names = {column.name for column in missing}
+        statements.extend(
+            CreateIndex(index)
+            for index in table.indexes
+            if any(column.name in missing_names for column in index.columns)
+        )
+    return statements
+
+
+def backfill(  # noqa: PLR0913
+    engine: Engine,
+    table: Table,
+    values: dict[str, ColumnElement],
+    *,
+    undefined: Mapping[str, Any] | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    after: Any = None,  # noqa: ANN401
+    progress: Callable[[Any], None] | None = None,
+) -> int:
+    """Fill the empty `values` columns of `table`, in primary key ranges of `batch_size` rows.
+
+    Every range is updated and committed in its own transaction, so the table is never locked
+    for long. A column keeps its value if it has one, and gets its value expression otherwise,
+    a value in `undefined` counting as none.
+
+    Args:
+        engine (Engine): The engine to update the table with.
+        table (Table): A table with a single column primary key.
+        values (dict[str, ColumnElement]): The expression filling each column, by column name.
+        undefined (Mapping[str, Any] | None): The value meaning undefined of columns that have one,
+            like `fallback_undefined`, by column name.
+        batch_size (int): The number of rows updated per transaction.
+        after (Any): The primary key to resume after, from the first row if `None`.
+        progress (Callable[[Any], None] | None): Called with the last primary key of every
+            committed range, pass it as `after` to resume an interrupted backfill.
+
+    Returns:
+        int: The number of rows in the updated ranges.
+
+    Raises:
+        ImproperlyConfiguredError: If the table doesn't have a single column primary key.
+
+    """
+    primary_keys = list(table.primary_key.columns)
+    if len(primary_keys) != 1:
+        msg = f"backfill requires a single column primary key, '{table.name}' has {len(primary_keys)}"
+        raise ImproperlyConfiguredError(msg)
+    primary_key = primary_keys[0]
+    undefined = undefined or {}
+    assignments = {}
+    for name, value in values.items():
+        column = table.columns[name]
+        target = func.nullif(column, literal(undefined[name], column.type)) if name in undefined else column
+        assignments[name] = func.coalesce(target, value)
+
+    rows = 0
+    while True:
+        with engine.begin() as connection:
+            after_condition = true() if after is None else primary_key > after
+            statement = select(primary_key).where(after_condition).order_by(primary_key).limit(batch_size)
+            pks = connection.scalars(statement).all()
+            if not pks:
+                return rows
+
+            in_range = and_(after_condition, primary_key <= pks[-1])
+            connection.execute(update(table).where(in_range).values(assignments))
+        rows += len(pks)
+        after = pks[-1]
+        if progress is not None:
+            progress(after)
@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+from typing import Any
+
+from sqlmodel import SQLModel
+
+NO_UNDEFINED_VALUE: Any = object()
+"""Null sentinel of fields without a `fallback_undefined` value, it is not equal to any value."""
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class TranslationPlan:
+    """Compiled, read-only form of a `TranslationOptions` class registered on a model.
+
+    The plan is built once by `Translator.register`, after the options are validated.
+    Every per-access question about the configuration (is a translation required,
+    which value counts as missing, what to return when all fallbacks are missing)
+    is answered with a single lookup, no matter how the options were written.
+    """
+
+    model: type[SQLModel]
+    """The registered model."""
+
+    options: type[Any]
+    """The `TranslationOptions` class the plan was compiled from."""
+
+    fields: tuple[str, ...]
+    """Names of the translated fields."""
+
+    storage: str
+    """Where the translations are stored, `columns`, a companion `table` or a `json` column per field."""
+
+    sql_fallbacks: bool
+    """Whether `Model.field` in queries applies the fallbacks."""
+
+    defer_unused_languages: bool
+    """Whether queries selecting the model defer translation columns outside the fallback chain."""
+
+    chains: dict[str, dict[str, tuple[str, ...]]]
+    """Translation fields to read in order, by field and active language.
+
+    The chain for a language outside of the translator `languages` is stored under the `default` key.
+    """
+
+    language_chains: dict[str, tuple[str, ...]]
+    """Languages to read in order, by active language, with the same `default` key as `chains`."""
+
+    required: frozenset[tuple[str, str]]
+    """`(language, field)` pairs that must be translated."""
+
+    undefined_values: dict[str, Any]
+    """Value treated like `None` by field, `NO_UNDEFINED_VALUE` if there is none."""
+
+    fallback_values: dict[str, Any]
+    """Value returned by field when no language in the chain has a value."""
+
+    translation_model: type[SQLModel] | None = None
+    """Model of the companion translation table with `table` storage."""
+
+    partition_models: dict[str, type[SQLModel]] | None = None
+    """Models of the companion translation table of each language with partitioned `table` storage."""
+
+    indexed_fields: tuple[str, ...] = ()
+    """Translated fields with an index on each translation column."""
+
+    fallback_indexes: bool = False
+    """Whether the fallback expressions of the indexed fields are indexed, and inlined in queries."""
+
+    search_fields: tuple[str, ...] = ()
+    """Translated fields with a full-text search table per language."""
+
+    resolved_tables: bool = False
+    """Whether the translated fields resolved in each language are kept in a table per language."""
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import Column, Table, delete, select
+
+from .exceptions import ImproperlyConfiguredError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from sqlalchemy import ColumnElement, Connection
+
+
+def resolved_table_name(model_table: Table, language: str) -> str:
+    """Return the name of the resolved table of `model_table` in `language`, `<table>_<lang>_resolved`."""
+    return f"{model_table.name}_{language}_resolved"
+
+
+def make_resolved_tables(
+    model_table: Table, values: dict[str, Sequence[ColumnElement]], indexed_fields: tuple[str, ...]
+) -> dict[str, Table]:
+    """Create a table per language holding the translated fields of `model_table` resolved in that language.
+
+    Each table has the primary key column of the model and a column per translated field, named like
+    the field, with the fallback chain and the fallback value already applied. The tables are added
+    to the metadata of `model_table`, so they are created and dropped with it.
+    They have no foreign key, so that rows of deleted instances can be removed after the instances.
+
+    Args:
+        model_table (Table): The table of a model with a single column primary key.
+        values (dict[str, Sequence[ColumnElement]]): Labeled expressions resolving each translated
+            field, by language.
+        indexed_fields (tuple[str, ...]): Translated fields indexed in every resolved table.
+
+    Returns:
+        dict[str, Table]: The resolved tables by language.
+
+    Raises:
+        ImproperlyConfiguredError: If the model has a composite primary key.
+
+    """
+    primary_key = list(model_table.primary_key.columns)
+    if len(primary_key) != 1:
+        msg = f"resolved tables need a single column primary key on '{model_table.name}'"
+        raise ImproperlyConfiguredError(msg)
+
+    return {
+        language: Table(
+            resolved_table_name(model_table, language),
+            model_table.metadata,
+            Column(primary_key[0].name, primary_key[0].type, primary_key=True, autoincrement=False),
+            *(
+                Column(expression.name, expression.type, index=expression.name in indexed_fields)
+                for expression in expressions
+            ),
+        )
+        for language, expressions in values.items()
+    }
+
+
+def refresh_rows(
+    connection: Connection,
+    model_table: Table,
+    tables: dict[str, Table],
+    values: dict[str, Sequence[ColumnElement]],
+    pks: Iterable[Any] | None = None,
+) -> None:
+    """Write the resolved values of the rows with primary keys `pks`, or all rows, to the resolved tables.
+
+    Args:
+        connection (Connection): The connection to write with.
+        model_table (Table): The table of a model with resolved tables.
+        tables (dict[str, Table]): The resolved tables by language.
+        values (dict[str, Sequence[ColumnElement]]): Expressions resolving each translated field,
+            by language, in the order of the resolved table columns.
+        pks (Iterable[Any] | None): The primary keys of the rows to refresh, all rows if `None`.
+
+    """
+    primary_key = next(iter(model_table.primary_key.columns))
+    pks = None if pks is None else list(pks)
+    for language, resolved_table in tables.items():
+        source = select(primary_key, *values[language])
+        if pks is None:
+            connection.execute(delete(resolved_table))
+        else:
+            connection.execute(delete(resolved_table).where(resolved_table.c[primary_key.name].in_(pks)))
+            source = source.where(primary_key.in_(pks))
+        connection.execute(resolved_table.insert().from_select(list(resolved_table.c), source))
+
+
+def delete_rows(connection: Connection, tables: dict[str, Table], pks: Iterable[Any]) -> None:
+    """Remove the rows with primary keys `pks` from the resolved tables."""
+    pks = list(pks)
+    for resolved_table in tables.values():
+        primary_key = next(iter(resolved_table.primary_key.columns))
+        connection.execute(delete(resolved_table).where(primary_key.in_(pks)))
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import Integer, column, delete, event, literal_column, select, table
+from sqlalchemy.exc import OperationalError
+
+from .exceptions import ImproperlyConfiguredError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from sqlalchemy import ColumnElement, Connection, Table, TableClause
+
+SEARCH_DIALECT = "sqlite"
+"""The database the full-text search tables are created on, through its FTS5 extension."""
+
+SEARCH_TOKENIZER = "unicode61 remove_diacritics 2"
+"""FTS5 tokenizer of the search tables, matching words regardless of case and diacritics in any language."""
+
+
+def search_table_name(model_table: Table, language: str) -> str:
+    """Return the name of the search table of `model_table` in `language`, `<table>_search_<language>`."""
+    return f"{model_table.name}_search_{language}"
+
+
+def check_search_table(model_table: Table) -> None:
+    """Check that `model_table` can have search tables, which use its primary key as `rowid`.
+
+    Raises:
+        ImproperlyConfiguredError: If the table doesn't have a single integer primary key column.
+
+    """
+    primary_key = list(model_table.primary_key.columns)
+    if len(primary_key) != 1 or not isinstance(primary_key[0].type, Integer):
+        msg = f"full-text search needs a single integer primary key on '{model_table.name}'"
+        raise ImproperlyConfiguredError(msg)
+
+
+def add_search_tables(model_table: Table, fields: tuple[str, ...], languages: tuple[str, ...]) -> None:
+    """Create and drop an FTS5 search table per language with `model_table`, on SQLite.
+
+    Each search table has a column per searched field, holding its value resolved in the language,
+    and the primary key of the model as `rowid`.
+
+    Args:
+        model_table (Table): The table of a model with an integer primary key.
+        fields (tuple[str, ...]): Names of the searched fields.
+        languages (tuple[str, ...]): The languages of the translator.
+
+    Raises:
+        ImproperlyConfiguredError: If the model doesn't have a single integer primary key column.
+
+    """
+    check_search_table(model_table)
+
+    def create(target: Table, connection: Connection, **_: Any) -> None:  # noqa: ANN401
+        create_search_tables(connection, target, fields, languages)
+
+    def drop(target: Table, connection: Connection, **_: Any) -> None:  # noqa: ANN401
+        if connection.dialect.name != SEARCH_DIALECT:
+            return
+        quote = connection.dialect.identifier_preparer.quote
+        for language in languages:
+            connection.exec_driver_sql(f"DROP TABLE IF EXISTS {quote(search_table_name(target, language))}")
+
+    event.listen(model_table, "after_create", create)
+    event.listen(model_table, "before_drop", drop)
+
+
+def index_rows(
+    connection: Connection,
+    model_table: Table,
+    values: dict[str, Sequence[ColumnElement]],
+    pks: Iterable[Any] | None = None,
+) -> None:
+    """Write the resolved values of the rows with primary keys `pks`, or all rows, to the search tables.
+
+    Args:
+        connection (Connection): The connection to write with.
+        model_table (Table): The table of a model with search tables.
+        values (dict[str, Sequence[ColumnElement]]): Expressions resolving each searched field,
+            by language, in the order of the search table columns.
+        pks (Iterable[Any] | None): The primary keys of the rows to index, all rows if `None`.
+
+    """
+    if connection.dialect.name != SEARCH_DIALECT:
+        return
+
+    primary_key = next(iter(model_table.primary_key.columns))
+    pks = None if pks is None else list(pks)
+    for language, expressions in values.items():
+        search_table = _search_table(model_table, language, [expression.name for expression in expressions])
+        source = select(primary_key, *expressions)
+        if pks is None:
+            connection.execute(delete(search_table))
+        else:
+            connection.execute(delete(search_table).where(search_table.c.rowid.in_(pks)))
+            source = source.where(primary_key.in_(pks))
+        connection.execute(search_table.insert().from_select(list(search_table.c), source))
+
+
+def delete_rows(
+    connection: Connection, model_table: Table, languages: tuple[str, ...], pks: Iterable[Any]
+) -> None:
+    """Remove the rows with primary keys `pks` from the search tables."""
+    if connection.dialect.name != SEARCH_DIALECT:
+        return
+
+    pks = list(pks)
+    for language in languages:
+        search_table = _search_table(model_table, language, [])
+        connection.execute(delete(search_table).where(search_table.c.rowid.in_(pks)))
+
+
+def search(  # noqa: PLR0913
+    connection: Connection,
+    model_table: Table,
+    language: str,
+    query: str,
+    limit: int | None,
+    *,
+    raw: bool = False,
+) -> list[Any]:
+    """Return the primary keys of the rows matching `query` in `language`, best match first.
+
+    Raises:
+        ImproperlyConfiguredError: If the connection is not to SQLite.
+        ValueError: If a `raw` query is not valid FTS5 syntax.
+
+    """
+    if connection.dialect.name != SEARCH_DIALECT:
+        msg = f"full-text search requires SQLite, not '{connection.dialect.name}'"
+        raise ImproperlyConfiguredError(msg)
+
+    if not raw:
+        query = quote_terms(query)
+        if not query:
+            return []
+
+    name = search_table_name(model_table, language)
+    search_table = _search_table(model_table, language, [])
+    # the table name is the column matching every field of an FTS5 table
+    match_column = literal_column(connection.dialect.identifier_preparer.quote(name))
+    statement = (
+        select(search_table.c.rowid)
+        .where(match_column.op("MATCH")(query))
+        .order_by(literal_column("rank"))
+        .limit(limit)
+    )
+    try:
+        return list(connection.scalars(statement))
+    except OperationalError as error:
+        if not raw:
+            raise
+        msg = f"invalid full-text query {query!r}: {error.orig}"
+        raise ValueError(msg) from error
+
+
+def quote_terms(query: str) -> str:
+    """Return `query` as FTS5 strings matching each of its words, without any operator or prefix.
+
+    Examples:
+        >>> quote_terms("tale- AND")
+        '"tale-" "AND"'
+
+    """
+    return " ".join('"' + term.replace('"', '""') + '"' for term in query.split())
+
+
+def create_search_tables(
+    connection: Connection, model_table: Table, fields: tuple[str, ...], languages: tuple[str, ...]
+) -> None:
+    """Create the missing search tables of `model_table`, e.g. when search was enabled after creating it."""
+    if connection.dialect.name != SEARCH_DIALECT:
+        return
+
+    for language in languages:
+        connection.exec_driver_sql(_create_statement(connection, model_table, fields, language))
+
+
+def _create_statement(
+    connection: Connection, model_table: Table, fields: tuple[str, ...], language: str
+) -> str:
+    # names are quoted, languages like `pt-BR` aren't valid bare identifiers
+    quote = connection.dialect.identifier_preparer.quote
+    columns = ", ".join(quote(field) for field in fields)
+    return (
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {quote(search_table_name(model_table, language))} "
+        f"USING fts5({columns}, tokenize='{SEARCH_TOKENIZER}')"
+    )
+
+
+def _search_table(model_table: Table, language: str, fields: Iterable[str]) -> TableClause:
+    return table(
+        search_table_name(model_table, language), column("rowid"), *(column(field) for field in fields)
+    )
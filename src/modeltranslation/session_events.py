@@ -0,0 +1,59 @@
+"""Session events dispatched to the translators listening to them.
+
+Listeners of the `Session` class are never removed, so a listener per translator would keep
+every translator, e.g. one per app factory or test, alive and running on every session.
+Each event has a single listener instead, calling the bound methods translators listen with,
+which are weakly referenced and dropped with their translator.
+"""
+
+from __future__ import annotations
+
+from contextlib import suppress
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+from weakref import WeakMethod
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# event name -> the methods called on it, in the order they were added
+_methods: dict[str, list[WeakMethod]] = {}
+_lock = Lock()
+
+
+def listen(identifier: str, method: Callable[..., None]) -> None:
+    """Call `method`, a bound method, on the `identifier` event of every session, at most once per event.
+
+    Args:
+        identifier (str): The name of a `SessionEvents` event, e.g. `"after_flush"`.
+        method (Callable[..., None]): A bound method, called with the arguments of the event
+            until its instance is garbage collected.
+
+    """
+    with _lock:
+        methods = _methods.get(identifier)
+        if methods is None:
+            methods = _methods[identifier] = []
+            event.listen(Session, identifier, _make_dispatch(methods))
+        if any(reference() == method for reference in methods):
+            return
+
+        def forget(reference: WeakMethod) -> None:
+            with suppress(ValueError):
+                methods.remove(reference)
+
+        methods.append(WeakMethod(method, forget))
+
+
+def _make_dispatch(methods: list[WeakMethod]) -> Callable[..., None]:
+    def dispatch(*args: Any) -> None:  # noqa: ANN401
+        # a copy, methods are removed when their translator is collected
+        for reference in tuple(methods):
+            method = reference()
+            if method is not None:
+                method(*args)
+
+    return dispatch
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from dataclasses import field as dataclass_field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+FALLBACK_VALUE_DEPTH = -1
+"""Depth recorded when no language of the fallback chain had a value."""
+
+
+@dataclass(frozen=True, slots=True)
+class ResolutionStats:
+    """How the reads of a translated field in one language were resolved."""
+
+    model: str
+    """Name of the registered model."""
+
+    field: str
+    """Name of the translated field."""
+
+    language: str
+    """The language the field was read in."""
+
+    direct: int = 0
+    """Reads answered by the language itself."""
+
+    fallbacks: dict[int, int] = dataclass_field(default_factory=dict)
+    """Reads answered by a fallback language, by its position in the fallback chain, starting at 1."""
+
+    fallback_values: int = 0
+    """Reads answered by the fallback value, as no language had a value."""
+
+    @property
+    def total(self) -> int:
+        return self.direct + sum(self.fallbacks.values()) + self.fallback_values
+
+
+class TranslationStats:
+    """Counters of how translated fields are resolved, collected by a `Translator` with `collect_stats`.
+
+    Counting is not synchronized between threads, so under heavy concurrency
+    a few reads may be missed. It is meant for monitoring, not accounting.
+    """
+
+    __slots__ = ("_counts",)
+
+    def __init__(self) -> None:
+        # (model, field, language, depth) -> reads
+        self._counts: Counter[tuple[str, str, str, int]] = Counter()
+
+    def record(self, model: str, field: str, language: str, depth: int, reads: int = 1) -> None:
+        """Count reads resolved at `depth` of the fallback chain, 0 is the language itself."""
+        self._counts[model, field, language, depth] += reads
+
+    def snapshot(self) -> list[ResolutionStats]:
+        """Return the current counts, sorted by model, field and language."""
+        grouped: dict[tuple[str, str, str], dict[int, int]] = {}
+        # a copy, other threads may add keys while the snapshot is taken
+        for (model, field, language, depth), reads in dict(self._counts).items():
+            grouped.setdefault((model, field, language), {})[depth] = reads
+
+        return [
+            ResolutionStats(
+                model=model,
+                field=field,
+                language=language,
+                direct=depths.pop(0, 0),
+                fallback_values=depths.pop(FALLBACK_VALUE_DEPTH, 0),
+                fallbacks=dict(sorted(depths.items())),
+            )
+            for (model, field, language), depths in sorted(grouped.items())
+        ]
+
+    def reset(self) -> None:
+        """Set all counts to zero."""
+        self._counts.clear()
+
+
+def to_prometheus(stats: Iterable[ResolutionStats], prefix: str = "modeltranslation") -> str:
+    """Return the stats in the Prometheus text exposition format.
+
+    Two counters are exported: `<prefix>_reads_total` with the `outcome` of each read
+    (`direct`, `fallback` or `fallback_value`) and `<prefix>_fallback_reads_total`
+    with the `depth` of the fallback language that had the value.
+
+    Args:
+        stats (Iterable[ResolutionStats]): The stats to export, e.g. `translator.get_stats()`.
+        prefix (str): The prefix of the metric names.
+
+    Returns:
+        str: The metrics, ending with a newline.
+
+    Examples:
+        >>> from modeltranslation.stats import to_prometheus
+        >>> print(to_prometheus(translator.get_stats()))
+        # HELP modeltranslation_reads_total Reads of translated fields by how they were resolved.
+        # TYPE modeltranslation_reads_total counter
+        modeltranslation_reads_total{model="Book",field="title",language="pl",outcome="direct"} 12
+        ...
+
+    """
+    reads = [
+        f"# HELP {prefix}_reads_total Reads of translated fields by how they were resolved.",
+        f"# TYPE {prefix}_reads_total counter",
+    ]
+    fallback_reads = [
+        f"# HELP {prefix}_fallback_reads_total Reads of translated fields resolved by a fallback language.",
+        f"# TYPE {prefix}_fallback_reads_total counter",
+    ]
+
+    for entry in stats:
+        labels = ",".join(
+            f'{label}="{_escape(value)}"'
+            for label, value in (
+                ("model", entry.model),
+                ("field", entry.field),
+                ("language", entry.language),
+            )
+        )
+        reads.append(f'{prefix}_reads_total{{{labels},outcome="direct"}} {entry.direct}')
+        reads.append(f'{prefix}_reads_total{{{labels},outcome="fallback"}} {sum(entry.fallbacks.values())}')
+        reads.append(f'{prefix}_reads_total{{{labels},outcome="fallback_value"}} {entry.fallback_values}')
+        fallback_reads.extend(
+            f'{prefix}_fallback_reads_total{{{labels},depth="{depth}"}} {count}'
+            for depth, count in entry.fallbacks.items()
+        )
+
+    return "\n".join(reads + fallback_reads) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import Column, ForeignKey, String, case, select
+from sqlalchemy.orm import attribute_keyed_dict, column_property, foreign, relationship
+from sqlmodel import Field, SQLModel
+
+from .exceptions import ImproperlyConfiguredError
+
+TRANSLATIONS = "translations"
+"""Relationship from a model with `table` storage to its translation rows, keyed by language."""
+
+LANGUAGE_LENGTH = 35
+"""Length of the language column, enough for any language tag in common use (RFC 5646)."""
+
+
+def check_translated_model(model: type[SQLModel], languages: tuple[str, ...], *, partitioned: bool) -> None:
+    """Check that `model` can get the companion translation tables of the `table` storage.
+
+    Raises:
+        ImproperlyConfiguredError: If the model has a composite primary key, or an attribute
+            named like its translation relationships.
+
+    """
+    _parent_key(model, _relationship_names(languages, partitioned=partitioned))
+
+
+def make_translation_model(
+    model: type[SQLModel], fields: tuple[str, ...], languages: tuple[str, ...]
+) -> type[SQLModel]:
+    """Create the companion table model storing the translations of `model`, one row per language.
+
+    The table is named `<table>_translation` and has the columns `parent_id`, `language`
+    and one nullable column per translated field, with `(parent_id, language)` as the primary key.
+    The rows are loaded with their parent model in a single `SELECT ... IN` per query,
+    and deleted with it.
+
+    For queries, `model` gets a deferred, read-only `<field>_<language>` attribute per translation,
+    a subquery selecting it from the translation table.
+
+    Args:
+        model (SQLModel): The model to translate, with a single column primary key.
+        fields (tuple[str, ...]): Names of the translated fields.
+        languages (tuple[str, ...]): The languages of the translator.
+
+    Returns:
+        type[SQLModel]: The model of the translation table.
+
+    Raises:
+        ImproperlyConfiguredError: If the model has a composite primary key or a `translations` attribute.
+
+    """
+    table = model.__table__  # pyright: ignore[reportAttributeAccessIssue]
+    parent_key = _parent_key(model, _relationship_names(languages, partitioned=False))
+    annotations: dict[str, Any] = {"parent_id": Any, "language": str}
+    namespace: dict[str, Any] = {
+        "__tablename__": f"{table.name}_translation",
+        "parent_id": Field(
+            sa_column=Column(
+                "parent_id", parent_key.type, ForeignKey(parent_key, ondelete="CASCADE"), primary_key=True
+            )
+        ),
+        "language": Field(sa_column=Column("language", String(LANGUAGE_LENGTH), primary_key=True)),
+    }
+    _add_field_columns(model, fields, annotations, namespace)
+
+    translation_model: Any = type(f"{model.__name__}Translation", (SQLModel,), namespace, table=True)
+    mapper = model.__mapper__  # pyright: ignore[reportAttributeAccessIssue]
+    mapper.add_property(
+        TRANSLATIONS,
+        relationship(
+            translation_model,
+            collection_class=attribute_keyed_dict("language"),
+            cascade="all, delete-orphan",
+            lazy="selectin",
+        ),
+    )
+    for field in fields:
+        for language in languages:
+            subquery = (
+                select(getattr(translation_model, field))
+                .where(translation_model.parent_id == parent_key, translation_model.language == language)
+                .correlate_except(translation_model)
+                .scalar_subquery()
+            )
+            # the parent key outside of the subquery puts the parent table in the FROM clause of
+            # queries selecting nothing else, like `select(Book.title)`
+            expression = case((parent_key.is_not(None), subquery))
+            mapper.add_property(f"{field}_{language}", column_property(expression, deferred=True))
+    return translation_model
+
+
+def make_partition_models(
+    model: type[SQLModel], fields: tuple[str, ...], languages: tuple[str, ...]
+) -> dict[str, type[SQLModel]]:
+    """Create a companion table model per language, so that each language can live on its own database.
+
+    The tables are named `<table>_translation_<language>` and have the primary key column `parent_id`
+    and one nullable column per translated field. They have no foreign key, as the parent table
+    may be in another database, and are not part of the metadata of `model`, so `create_all`
+    on the database of the model doesn't create them, see
+    [`Translator.create_partitions`][modeltranslation.Translator.create_partitions].
+
+    `model` gets a `translations_<language>` relationship per language, loaded when it is first
+    accessed, so that reading a field only queries the partitions of its fallback chain.
+    Translation rows are deleted with their parent model.
+
+    Args:
+        model (SQLModel): The model to translate, with a single column primary key.
+        fields (tuple[str, ...]): Names of the translated fields.
+        languages (tuple[str, ...]): The languages of the translator.
+
+    Returns:
+        dict[str, type[SQLModel]]: The models of the translation tables by language.
+
+    Raises:
+        ImproperlyConfiguredError: If the model has a composite primary key or a `translations_<language>`
+            attribute.
+
+    """
+    table = model.__table__  # pyright: ignore[reportAttributeAccessIssue]
+    parent_key = _parent_key(model, _relationship_names(languages, partitioned=True))
+    mapper = model.__mapper__  # pyright: ignore[reportAttributeAccessIssue]
+
+    partition_models: dict[str, type[SQLModel]] = {}
+    for language in languages:
+        annotations: dict[str, Any] = {"parent_id": Any}
+        namespace: dict[str, Any] = {
+            "__tablename__": f"{table.name}_translation_{language}",
+            "parent_id": Field(sa_column=Column("parent_id", parent_key.type, primary_key=True)),
+        }
+        _add_field_columns(model, fields, annotations, namespace)
+
+        partition_model: Any = type(
+            f"{model.__name__}Translation{language.title()}", (SQLModel,), namespace, table=True
+        )
+        table.metadata.remove(partition_model.__table__)
+        mapper.add_property(
+            f"{TRANSLATIONS}_{language}",
+            relationship(
+                partition_model,
+                primaryjoin=parent_key == foreign(partition_model.parent_id),
+                uselist=False,
+                cascade="all, delete-orphan",
+            ),
+        )
+        partition_models[language] = partition_model
+    return partition_models
+
+
+def _relationship_names(languages: tuple[str, ...], *, partitioned: bool) -> tuple[str, ...]:
+    if partitioned:
+        return tuple(f"{TRANSLATIONS}_{language}" for language in languages)
+    return (TRANSLATIONS,)
+
+
+def _parent_key(model: type[SQLModel], attributes: tuple[str, ...]) -> Column:
+    """Return the primary key column of `model`, checking that the relationship `attributes` are free."""
+    primary_key = list(model.__table__.primary_key.columns)  # pyright: ignore[reportAttributeAccessIssue]
+    if len(primary_key) != 1:
+        msg = f"'table' storage needs a single column primary key on '{model.__name__}'"
+        raise ImproperlyConfiguredError(msg)
+    for attribute in attributes:
+        if hasattr(model, attribute):
+            msg = f"'table' storage needs the '{attribute}' attribute of '{model.__name__}'"
+            raise ImproperlyConfiguredError(msg)
+    return primary_key[0]
+
+
+def _add_field_columns(
+    model: type[SQLModel], fields: tuple[str, ...], annotations: dict[str, Any], namespace: dict[str, Any]
+) -> None:
+    """Add a nullable column per translated field, of the type of the field, to a translation model."""
+    table = model.__table__  # pyright: ignore[reportAttributeAccessIssue]
+    for field in fields:
+        annotations[field] = model.model_fields[field].annotation | None
+        namespace[field] = Field(default=None, sa_column=Column(field, table.columns[field].type))
+    namespace["__annotations__"] = annotations
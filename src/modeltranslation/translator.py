@@ -1,16 +1,84 @@
-from collections.abc import Callable, Iterator
-from contextvars import ContextVar
-from copy import deepcopy
-from functools import wraps
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, Token
+from copy import copy
+from dataclasses import replace
+from functools import partial, wraps
 from types import UnionType
-from typing import Any, get_args, get_origin
+from typing import TYPE_CHECKING, Any, get_args, get_origin
 
 from pydantic import field_serializer
-from sqlalchemy import Column
-from sqlalchemy.orm import column_property
+from sqlalchemy import (
+    Column,
+    ColumnElement,
+    Connection,
+    Engine,
+    Index,
+    Select,
+    Table,
+    func,
+    inspect,
+    literal,
+    select,
+)
+from sqlalchemy.orm import (
+    Load,
+    ORMExecuteState,
+    RelationshipProperty,
+    Session,
+    SessionTransaction,
+    column_property,
+    defaultload,
+    selectinload,
+)
+from sqlalchemy.orm.attributes import set_attribute
+from sqlalchemy.types import TypeEngine
 from sqlmodel import SQLModel
 
+from .bulk import (
+    BulkImportResult,
+    TranslationRecord,
+    async_bulk_export,
+    async_bulk_import,
+    bulk_export,
+    bulk_import,
+)
+from .cache import CacheKey, TranslationCache
+from .coverage import FieldCoverage, model_coverage
+from .descriptors import TranslationDescriptor, TranslationJSONDescriptor, TranslationTableDescriptor
 from .exceptions import ImproperlyConfiguredError
+from .json_column import JSON_SUFFIX, extract_translation, make_json_column
+from .migration import DEFAULT_BATCH_SIZE, backfill, schema_changes
+from .plan import NO_UNDEFINED_VALUE, TranslationPlan
+from .resolved_table import delete_rows as delete_resolved_rows
+from .resolved_table import make_resolved_tables, refresh_rows
+from .search import (
+    add_search_tables,
+    check_search_table,
+    create_search_tables,
+    delete_rows,
+    index_rows,
+    search,
+)
+from .session_events import listen
+from .stats import FALLBACK_VALUE_DEPTH, ResolutionStats, TranslationStats
+from .translation_table import (
+    TRANSLATIONS,
+    check_translated_model,
+    make_partition_models,
+    make_translation_model,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+    from sqlalchemy.orm.strategy_options import _AbstractLoad
+    from sqlalchemy.sql.ddl import ExecutableDDLElement
+
+FALLBACK_INDEX_DIALECTS = ("sqlite", "postgresql")
+"""Databases the fallback expression indexes are created on, those supporting expression indexes."""
 
 
 class TranslationOptions:
@@ -93,6 +161,108 @@ class TranslationOptions:
 
     """
 
+    sql_fallbacks: bool = False
+    """Apply fallback languages and fallback values when the field is used in queries.
+
+    By default `Book.title` refers to the column of the active language only.
+    With `sql_fallbacks = True` it is a `COALESCE` over the columns of the fallback chain
+    and the fallback value, so `select`, `where` and `order_by` see the same values
+    as reading `book.title`, without loading the other language columns.
+
+    Such an expression can't be assigned, use a translation field in `update().values()`,
+    for example `values(title_en="...")`.
+    """
+
+    storage: str = "columns"
+    """Where the translations are stored.
+
+    With `"columns"` every translation is a `<field>_<language>` column of the model table.
+    With `"table"` the translations are rows of a companion `<table>_translation` table,
+    one row per instance and language with a column per translated field, see
+    [`make_translation_model`][modeltranslation.translation_table.make_translation_model].
+    Rows of the model table stay narrow and adding a language is not a schema change.
+    The translations are loaded with one extra query per query selecting the model,
+    and `book.title` reads and writes them like the columns.
+
+    The `table` storage needs a single column primary key and doesn't support
+    `required_languages`, `defer_unused_languages` or `Translator.bulk_import`.
+
+    With `"json"` all translations of a field are stored in one `<field>_i18n` JSON column
+    as `{language: value}`, only the present translations take space.
+    In queries the languages are extracted in SQL, with `JSON_EXTRACT` on SQLite and MySQL
+    and `->>` on PostgreSQL, and `defer_unused_languages` loads only the extracted languages
+    of the fallback chain instead of the whole column.
+    The `json` storage doesn't support `required_languages` or `Translator.bulk_import`.
+    """
+
+    partitioned: bool = False
+    """Store the translations of each language in its own companion table, with `table` storage.
+
+    The tables are named `<table>_translation_<language>`, see
+    [`make_partition_models`][modeltranslation.translation_table.make_partition_models],
+    and each language can be bound to its own database with
+    [`Translator.partition_binds`][modeltranslation.Translator.partition_binds].
+    Reading a field only queries the partitions of its fallback chain.
+
+    Translated fields can't be used in queries, as the translations may be in another database,
+    so partitioned translations don't support `sql_fallbacks`.
+    """
+
+    indexed_fields: tuple[str, ...] | None = None
+    """Translated fields with an index on each of their translation columns.
+
+    By default the fields declared with `Field(index=True)` on the model are indexed,
+    so `where(Book.title == ...)` uses an index in every language.
+
+    Example:
+        `('title',)`
+
+    Indexes are supported with the `columns` storage only.
+    """
+
+    fallback_indexes: bool = False
+    """Also index the fallback expression of every language of the indexed fields.
+
+    With `sql_fallbacks` the lookups in queries go through a `COALESCE` over the columns
+    of the fallback chain, which the column indexes don't cover. These are expression indexes,
+    created on SQLite and PostgreSQL only, other databases skip them.
+    The fallback values are then inlined in queries, as the database only uses an expression
+    index for the exact expression.
+    """
+
+    search_fields: tuple[str, ...] = ()
+    """Translated fields searchable with [`Translator.search`][modeltranslation.Translator.search].
+
+    Every language gets an SQLite FTS5 table holding the values of these fields
+    resolved through the fallback chain, kept in sync when the session flushes.
+
+    Example:
+        `('title', 'description')`
+
+    Full-text search needs the `columns` storage and a single integer primary key.
+    """
+
+    resolved_tables: bool = False
+    """Keep a `<table>_<language>_resolved` table per language with the translated fields resolved.
+
+    Each resolved table has the primary key and one column per translated field, with the fallback
+    chain and the fallback value applied, kept in sync when the session flushes. Reads in a language
+    can then query [`Translator.resolved_table`][modeltranslation.Translator.resolved_table]
+    without any `COALESCE` or fallback in Python. The `indexed_fields` are indexed in every table.
+
+    Resolved tables need the `columns` storage and a single column primary key.
+    """
+
+    defer_unused_languages: bool = False
+    """Load only the translation columns the active language can read.
+
+    The translation columns are deferred by the mapper and every ORM query selecting the model
+    loads only the columns of the fallback chain of the active language, as if it used
+    [`Translator.defer_unused_languages`][modeltranslation.Translator.defer_unused_languages].
+    So do the queries loading the model through a relationship of a model they select.
+    Deferred columns are loaded lazily when they are accessed.
+    """
+
 
 class Translator:
     """A translator object that manages translations for registered SQLModel classes."""
@@ -102,6 +272,9 @@ class Translator:
         default_language: str,
         languages: tuple[str, ...],
         fallback_languages: dict[str, tuple[str, ...]] | None = None,
+        *,
+        collect_stats: bool = False,
+        cache: TranslationCache | None = None,
     ) -> None:
         """Construct a translator object.
 
@@ -118,6 +291,14 @@ class Translator:
                 }`.
                 The default key is required.
 
+            collect_stats (bool): Whether to count how translated fields are resolved,
+                see [`Translator.get_stats`][modeltranslation.Translator.get_stats].
+                Reads are not counted, and cost nothing extra, unless enabled.
+
+            cache (TranslationCache | None): Where to keep the translations resolved by
+                [`Translator.resolve_pks`][modeltranslation.Translator.resolve_pks],
+                e.g. a [`MemoryCache`][modeltranslation.cache.MemoryCache]. Nothing is cached if `None`.
+
         Raises:
             ImproperlyConfiguredError: If the configuration is internally inconsistent.
 
@@ -133,6 +314,50 @@ class Translator:
         if fallback_languages:
             self._fallback_languages = fallback_languages
 
+        # compiled translation options of registered models
+        self._registry: dict[type[SQLModel], TranslationPlan] = {}
+
+        # tables of registered models and their companion translation tables -> plan
+        self._tables: dict[Table, TranslationPlan] = {}
+
+        # (model, field, language) -> fallback expression, see `fallback_expression`
+        self._fallback_expressions: dict[tuple[type[SQLModel], str, str], ColumnElement] = {}
+
+        # (model, language) -> loader option, see `defer_unused_languages`
+        self._loader_options: dict[tuple[type[SQLModel], str], _AbstractLoad] = {}
+
+        # (model, relationships it is loaded through, language) -> loader options of the model
+        # and its related models, see `_apply_loader_options`
+        self._path_loader_options: dict[
+            tuple[type[SQLModel], tuple[RelationshipProperty, ...], str], tuple[_AbstractLoad, ...]
+        ] = {}
+
+        # model -> searched field expressions by language, see `search`
+        self._search_values: dict[type[SQLModel], dict[str, list[ColumnElement]]] = {}
+
+        # model -> resolved tables by language, see `resolved_table`
+        self._resolved_tables: dict[type[SQLModel], dict[str, Table]] = {}
+
+        # model -> resolved field expressions by language, see `resolved_table`
+        self._resolved_values: dict[type[SQLModel], dict[str, list[ColumnElement]]] = {}
+
+        # counted resolution shadows the getters of each storage on this instance only, so that
+        # without stats the descriptors and serializers run the plain methods
+        self._stats: TranslationStats | None = None
+        if collect_stats:
+            self._stats = TranslationStats()
+            self._get_translation = self._get_counted_translation
+            self._get_table_translation = self._get_counted_table_translation
+            self._get_json_translation = self._get_counted_json_translation
+
+        # changed instances are invalidated once their outermost transaction ends, before that
+        # other sessions still read the committed values
+        self._cache = cache
+        if cache is not None:
+            listen("after_flush", self._collect_cache_invalidations)
+            listen("do_orm_execute", self._collect_statement_invalidations)
+            listen("after_transaction_end", self._apply_cache_invalidations)
+
         self._validate_translator_object()
 
     def get_languages(self) -> tuple[str, ...]:
@@ -141,12 +366,232 @@ class Translator:
     def get_active_language(self) -> str:
         return self._active_language.get()
 
-    def set_active_language(self, locale: str) -> None:
-        self._active_language.set(locale)
+    def set_active_language(self, locale: str) -> Token[str]:
+        return self._active_language.set(locale)
+
+    def reset_active_language(self, token: Token[str]) -> None:
+        """Restore the active language from before the `set_active_language` call that returned `token`."""
+        self._active_language.reset(token)
 
     def get_default_language(self) -> str:
         return self._default_language
 
+    def get_registered_models(self) -> tuple[type[SQLModel], ...]:
+        return tuple(self._registry)
+
+    def get_stats(self) -> list[ResolutionStats]:
+        """Return how the translated fields were resolved since the translator was created or reset.
+
+        Reads of instance attributes, json serialization and
+        [`Translator.resolve_many`][modeltranslation.Translator.resolve_many] are counted,
+        per model, field and language: the reads answered by the language itself,
+        by each fallback language of the chain and by the fallback value.
+        Export them with [`to_prometheus`][modeltranslation.stats.to_prometheus].
+
+        Returns:
+            list[ResolutionStats]: A snapshot of the counts, sorted by model, field and language.
+
+        Raises:
+            ImproperlyConfiguredError: If the translator was created without `collect_stats`.
+
+        Examples:
+            >>> translator = Translator(default_language="en", languages=("en", "pl"), collect_stats=True)
+            ...
+            >>> translator.get_stats()
+            [ResolutionStats(model='Book', field='title', language='pl', direct=2, fallbacks={1: 1}, ...)]
+
+        """
+        return self._require_stats().snapshot()
+
+    def reset_stats(self) -> None:
+        """Set the counts returned by `get_stats` to zero.
+
+        Raises:
+            ImproperlyConfiguredError: If the translator was created without `collect_stats`.
+
+        """
+        self._require_stats().reset()
+
+    def _require_stats(self) -> TranslationStats:
+        if self._stats is None:
+            msg = "the translator does not collect stats, create it with 'collect_stats=True'"
+            raise ImproperlyConfiguredError(msg)
+        return self._stats
+
+    def resolve_pks(
+        self,
+        session: Session,
+        model: type[SQLModel],
+        pks: Iterable[Any],
+        language: str | None = None,
+    ) -> dict[Any, dict[str, Any]]:
+        """Return the resolved translated fields of instances by primary key, through the cache.
+
+        Cached instances cost no query and no fallback resolution, the others are loaded
+        with a single query, resolved like `resolve_many` and cached.
+        Flushed changes of instances, and `update()` or `delete()` statements executed by a session,
+        invalidate the cache when their transaction commits or rolls back.
+        Invalidate other changes, e.g. from `bulk_import` or another process,
+        with [`Translator.invalidate`][modeltranslation.Translator.invalidate].
+
+        Args:
+            session (Session): The session to load the instances missing from the cache with.
+            model (SQLModel): A registered SQLModel class with a single column primary key.
+            pks (Iterable[Any]): The primary keys of the instances.
+            language (str | None): The language to resolve, the active language if `None`.
+
+        Returns:
+            dict[Any, dict[str, Any]]: The `{field: value}` dict of the translated fields of each
+                existing instance by primary key, in the order of `pks`. Don't modify the dicts,
+                they are shared through the cache.
+
+        Raises:
+            ImproperlyConfiguredError: If the translator has no cache, or the model is not registered
+                in the translator or has a composite primary key.
+
+        Examples:
+            >>> translator.resolve_pks(session, Book, [1, 2], language="pl")
+            {1: {'title': 'Hobbit'}, 2: {'title': 'Rok 1984'}}
+
+        """
+        cache = self._require_cache()
+        plan = self._get_plan(model)
+        if language is None:
+            language = self._active_language.get()
+        # languages outside of `languages` resolve the same `default` chain
+        cached_language = language if language in self._languages else "default"
+
+        # the table name, unlike the class name, is unique in the metadata
+        name = model.__table__.fullname  # pyright: ignore[reportAttributeAccessIssue]
+        pks = list(pks)
+        cached = cache.get_many([(name, pk, cached_language) for pk in pks])
+        values = {pk: value for pk, value in zip(pks, cached, strict=True) if value is not None}
+
+        missing = [pk for pk, value in zip(pks, cached, strict=True) if value is None]
+        if missing:
+            primary_key = self._single_primary_key(model)
+            statement = (
+                select(model)
+                .where(primary_key.in_(missing))
+                .options(self.defer_unused_languages(model, language))
+            )
+            instances = session.scalars(statement).all()
+            mapper = model.__mapper__  # pyright: ignore[reportAttributeAccessIssue]
+            loaded = {
+                mapper.primary_key_from_instance(instance)[0]: value
+                for instance, value in zip(
+                    instances, self.resolve_many(instances, plan.fields, language), strict=True
+                )
+            }
+            cache.set_many({(name, pk, cached_language): value for pk, value in loaded.items()})
+            values.update(loaded)
+
+        return {pk: values[pk] for pk in pks if pk in values}
+
+    def resolve_pk(
+        self,
+        session: Session,
+        model: type[SQLModel],
+        pk: Any,  # noqa: ANN401
+        language: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Return the resolved translated fields of one instance, see `resolve_pks`.
+
+        Returns:
+            dict[str, Any] | None: The `{field: value}` dict of the translated fields,
+                `None` if there is no instance with the primary key.
+
+        """
+        return self.resolve_pks(session, model, (pk,), language).get(pk)
+
+    def invalidate(self, model: type[SQLModel], pks: Iterable[Any] | None = None) -> None:
+        """Remove instances of a model from the cache, in every language.
+
+        Args:
+            model (SQLModel): A registered SQLModel class.
+            pks (Iterable[Any] | None): The primary keys of the instances.
+                Everything is removed from the cache if `None`.
+
+        Raises:
+            ImproperlyConfiguredError: If the translator has no cache.
+
+        """
+        cache = self._require_cache()
+        if pks is None:
+            cache.clear()
+        else:
+            cache.delete_many(self._cache_keys(model, pks))
+
+    def _require_cache(self) -> TranslationCache:
+        if self._cache is None:
+            msg = "the translator has no cache, create it with 'cache=MemoryCache()'"
+            raise ImproperlyConfiguredError(msg)
+        return self._cache
+
+    def _single_primary_key(self, model: type[SQLModel]) -> Column:
+        primary_keys = list(model.__table__.primary_key.columns)  # pyright: ignore[reportAttributeAccessIssue]
+        if len(primary_keys) != 1:
+            msg = f"'{model.__name__}' needs a single column primary key, it has {len(primary_keys)}"
+            raise ImproperlyConfiguredError(msg)
+        return primary_keys[0]
+
+    def _cache_keys(self, model: type[SQLModel], pks: Iterable[Any]) -> list[CacheKey]:
+        name = model.__table__.fullname  # pyright: ignore[reportAttributeAccessIssue]
+        return [(name, pk, language) for pk in pks for language in (*self._languages, "default")]
+
+    def _pending_invalidations(self, session: Session) -> set[tuple[type[SQLModel], Any] | None]:
+        """Return the `(model, pk)` pairs to invalidate when the transaction of `session` ends.
+
+        `None` stands for everything, when rows were changed by a statement.
+        """
+        return session.info.setdefault(self, set())
+
+    def _collect_cache_invalidations(self, session: Session, _: Any) -> None:  # noqa: ANN401
+        pending = None
+        for instances in (session.new, session.dirty, session.deleted):
+            for instance in instances:
+                mapper = inspect(instance).mapper
+                plan = self._tables.get(mapper.local_table)
+                if plan is None:
+                    continue
+
+                if mapper.class_ is plan.model:
+                    pk = mapper.primary_key_from_instance(instance)[0]
+                else:
+                    # rows of companion translation tables belong to their parent instance
+                    pk = instance.parent_id  # pyright: ignore[reportAttributeAccessIssue]
+
+                if pending is None:
+                    pending = self._pending_invalidations(session)
+                pending.add((plan.model, pk))
+
+    def _collect_statement_invalidations(self, orm_execute_state: ORMExecuteState) -> None:
+        if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+            return
+
+        if orm_execute_state.statement.table in self._tables:  # pyright: ignore[reportAttributeAccessIssue]
+            self._pending_invalidations(orm_execute_state.session).add(None)
+
+    def _apply_cache_invalidations(self, session: Session, transaction: SessionTransaction) -> None:
+        # a savepoint ends inside its transaction, which still commits or rolls back
+        # the rows flushed before and after it
+        if transaction.parent is not None:
+            return
+
+        pending = session.info.pop(self, None)
+        if not pending:
+            return
+
+        cache = self._cache
+        if None in pending:
+            cache.clear()  # pyright: ignore[reportOptionalMemberAccess]
+            return
+        cache.delete_many(  # pyright: ignore[reportOptionalMemberAccess]
+            key
+            for model, pk in pending
+            for key in self._cache_keys(model, (pk,))  # pyright: ignore[reportOptionalIterable, reportGeneralTypeIssues]
+        )
+
     def register(self, model: type[SQLModel]) -> Callable:
         """Register a SQLModel class for translations.
 
@@ -178,91 +623,1512 @@ class Translator:
         """
 
         def decorator(options: TranslationOptions) -> None:
-            self._replace_accessors(model, options)
-            self._rebuild_model(model, options)
+            self.register_many({model: options})
 
         return decorator
 
-    def _replace_accessors(  # noqa: C901
-        self, model: type[SQLModel], options: TranslationOptions
-    ) -> type[SQLModel]:
-        # check if TranslationOptions are valid before modifing model
-        self._validate_translation_options(options)
+    def register_many(self, options: Mapping[type[SQLModel], TranslationOptions]) -> None:
+        """Register many SQLModel classes for translations at once.
 
-        def locale_get_decorator(original_get_function: Callable) -> Callable:
-            @wraps(original_get_function)
-            def locale_function(
-                model_self: type[SQLModel] | SQLModel, name: str, *args: tuple[Any, ...]
-            ) -> Callable:
-                # ignore private and not translated functions
-                if name.startswith("_") or name not in options.fields:
-                    return original_get_function(model_self, name, *args)
+        Works like applying [`Translator.register`][modeltranslation.Translator.register]
+        to each model, but all options are validated and compiled before any model is changed,
+        so a mistake in one of them leaves every model untouched. Each model is rebuilt once.
 
-                active_language = self.get_active_language()
+        Args:
+            options (Mapping[type[SQLModel], TranslationOptions]): The `TranslationOptions` of each model.
 
-                if active_language in self._languages:
-                    value = original_get_function(model_self, f"{name}_{active_language}")
-                    if not self._is_null_value(name, value, options):
-                        return value
+        Raises:
+            ImproperlyConfiguredError: If the translation options are inconsistent with the Translator.
 
-                for fallback_language in self._fallbacks_generator(active_language, options):
-                    value = original_get_function(model_self, f"{name}_{fallback_language}")
-                    if not self._is_null_value(name, value, options):
-                        return value
+        Examples:
+            >>> class BookTranslationOptions(TranslationOptions):
+            ...     fields = ("title",)
+            ...
+            >>> class AuthorTranslationOptions(TranslationOptions):
+            ...     fields = ("biography",)
+            ...
+            >>> translator.register_many({Book: BookTranslationOptions, Author: AuthorTranslationOptions})
 
-                # no fallback language yielded a value, try fallback values
-                return self._fallback_value(name, options)
+        """
+        # check if TranslationOptions are valid before modifing any model
+        for model, model_options in options.items():
+            self._validate_translation_options(model, model_options)
+        plans = [self._compile_plan(model, model_options) for model, model_options in options.items()]
+        # companion tables and search tables are only added once every option is known to be valid
+        plans = [self._add_translation_models(plan) if plan.storage == "table" else plan for plan in plans]
+
+        for plan in plans:
+            if plan.search_fields:
+                add_search_tables(plan.model.__table__, plan.search_fields, self._languages)  # pyright: ignore[reportAttributeAccessIssue]
+
+        for plan in plans:
+            self._registry[plan.model] = plan
+            self._tables[plan.model.__table__] = plan  # pyright: ignore[reportAttributeAccessIssue]
+            if plan.translation_model is not None:
+                self._tables[plan.translation_model.__table__] = plan  # pyright: ignore[reportAttributeAccessIssue]
+            for partition_model in (plan.partition_models or {}).values():
+                self._tables[partition_model.__table__] = plan  # pyright: ignore[reportAttributeAccessIssue]
+        self._fallback_expressions.clear()
+        self._loader_options.clear()
+        self._path_loader_options.clear()
+        self._search_values.clear()
+        self._resolved_values.clear()
+
+        self._listen_to_sessions(plans)
+
+        for plan in plans:
+            self._replace_accessors(plan.model, plan)
+            self._rebuild_model(plan.model, plan)
+
+        # the resolved tables are made from the translation columns added by `_rebuild_model`
+        for plan in plans:
+            if plan.resolved_tables:
+                self._resolved_tables[plan.model] = make_resolved_tables(
+                    plan.model.__table__,  # pyright: ignore[reportAttributeAccessIssue]
+                    self._get_resolved_values(plan),
+                    plan.indexed_fields,
+                )
 
-            return locale_function
+    def _add_translation_models(self, plan: TranslationPlan) -> TranslationPlan:
+        """Return `plan` with the companion translation models of the `table` storage."""
+        if plan.options.partitioned:
+            return replace(
+                plan, partition_models=make_partition_models(plan.model, plan.fields, self._languages)
+            )
+        return replace(
+            plan, translation_model=make_translation_model(plan.model, plan.fields, self._languages)
+        )
+
+    def _listen_to_sessions(self, plans: list[TranslationPlan]) -> None:
+        """Add the session listeners the options of `plans` need, once per translator."""
+        listeners = (
+            ("do_orm_execute", self._apply_loader_options, lambda plan: plan.defer_unused_languages),
+            ("after_flush", self._sync_search_tables, lambda plan: plan.search_fields),
+            ("after_flush", self._sync_resolved_tables, lambda plan: plan.resolved_tables),
+        )
+        for identifier, listener, needed in listeners:
+            if any(needed(plan) for plan in plans):
+                listen(identifier, listener)
+
+    def fallback_expression(
+        self, model: type[SQLModel], field: str, language: str | None = None
+    ) -> ColumnElement:
+        """Return a SQL expression for a translated field with the fallbacks applied.
+
+        The expression reads the columns of the fallback chain of `language` in order,
+        skipping `NULL` and `fallback_undefined` values, and ends with the fallback value.
+        It's what `Model.field` returns for options with `sql_fallbacks = True`.
 
-        def locale_set_decorator(original_set_function: Callable) -> Callable:
-            @wraps(original_set_function)
-            def locale_function(model_self: type[SQLModel], name: str, value: Any) -> Callable:  # noqa: ANN401
-                if name.startswith("_") or name not in options.fields:
-                    return original_set_function(model_self, name, value)
+        Args:
+            model (SQLModel): A registered SQLModel class.
+            field (str): The name of a translated field.
+            language (str | None): The language to resolve, the active language if `None`.
 
-                active_language = self.get_active_language()
-                # if language is in translation use it, else use the default translator language
-                if active_language in self._languages:
-                    return original_set_function(model_self, f"{name}_{active_language}", value)
-                return original_set_function(model_self, f"{name}_{self._default_language}", value)
+        Raises:
+            ImproperlyConfiguredError: If the field is not translated in the translator.
 
-            return locale_function
+        Examples:
+            >>> from sqlmodel import select
+            >>> select(Book.id).order_by(translator.fallback_expression(Book, "title", "pl"))
+
+        """
+        if language is None:
+            language = self._active_language.get()
+        # languages outside of `languages` resolve the same `default` chain
+        if language not in self._languages:
+            language = "default"
+
+        key = (model, field, language)
+        expression = self._fallback_expressions.get(key)
+        if expression is None:
+            plan = self._get_plan(model)
+            if field not in plan.fields:
+                msg = f"'{field}' is not a translated field of '{model.__name__}'"
+                raise ImproperlyConfiguredError(msg)
+            expression = self._fallback_expressions[key] = self._build_fallback_expression(
+                model, field, plan, language
+            )
+        return expression
+
+    def _build_fallback_expression(
+        self, model: type[SQLModel], field: str, plan: TranslationPlan, language: str
+    ) -> ColumnElement:
+        columns = [getattr(model, name) for name in self._get_chain(field, plan, language)]
+        return self._coalesce_chain(columns, field, plan).label(field)
+
+    def _coalesce_chain(
+        self, columns: list[Any], field: str, plan: TranslationPlan, *, with_fallback_value: bool = True
+    ) -> ColumnElement:
+        """Return the `COALESCE` over the columns of a fallback chain, as in `fallback_expression`."""
+        column_type = columns[0].type
+        # an expression index is only used for the same expression, with the values inlined
+        inline = plan.fallback_indexes
+
+        undefined = plan.undefined_values[field]
+        if undefined is not NO_UNDEFINED_VALUE:
+            undefined_value = literal(undefined, column_type, literal_execute=inline)
+            columns = [func.nullif(column, undefined_value) for column in columns]
+
+        fallback_value = plan.fallback_values[field]
+        if fallback_value is not None and with_fallback_value:
+            columns.append(literal(fallback_value, column_type, literal_execute=inline))
+
+        # coalesce needs at least 2 arguments in some databases (e.g. SQLite)
+        return func.coalesce(*columns) if len(columns) > 1 else columns[0]
+
+    def defer_unused_languages(self, model: type[SQLModel], language: str | None = None) -> "_AbstractLoad":
+        """Return a loader option deferring translation columns that `language` never reads.
+
+        Only the columns of the fallback chain of the language are loaded with the model,
+        other translation columns are loaded lazily if they are accessed.
+        Set `defer_unused_languages` in the translation options to apply it to every query.
+        With partitioned translations it loads the translation rows of the languages of the chain,
+        with a query per partition.
 
-        def locale_class_get_decorator(original_get_function: Callable) -> Callable:
-            @wraps(original_get_function)
-            def locale_function(
-                model_self: type[SQLModel] | SQLModel, name: str, *args: tuple[Any, ...]
-            ) -> Callable:
-                if name.startswith("_") or name not in options.fields:
-                    return original_get_function(model_self, name, *args)
+        Args:
+            model (SQLModel): A registered SQLModel class.
+            language (str | None): The language to load, the active language if `None`.
 
-                active_language = self.get_active_language()
+        Raises:
+            ImproperlyConfiguredError: If the model is not registered in the translator.
 
-                if active_language in self._languages:
-                    return original_get_function(model_self, f"{name}_{active_language}")
+        Examples:
+            >>> from sqlmodel import select
+            >>> select(Book).options(translator.defer_unused_languages(Book))
 
-                for fallback_language in self._fallbacks_generator(active_language, options):
-                    return original_get_function(model_self, f"{name}_{fallback_language}")
+        """
+        if language is None:
+            language = self._active_language.get()
+        # languages outside of `languages` load the same `default` chain
+        if language not in self._languages:
+            language = "default"
+
+        key = (model, language)
+        option = self._loader_options.get(key)
+        if option is None:
+            plan = self._get_plan(model)
+            option = self._loader_options[key] = (
+                # partitions outside of the chain are never queried
+                self._load_partitions(model, self._get_languages(plan, language))
+                if plan.partition_models is not None
+                else self._build_loader_option(model, plan, language)
+            )
+        return option
+
+    def load_languages(
+        self,
+        model: type[SQLModel],
+        languages: Sequence[str] | None = None,
+        loader: "_AbstractLoad | None" = None,
+    ) -> "_AbstractLoad":
+        """Return a loader option loading everything reading the translated fields in `languages` needs.
 
-                return original_get_function(model_self, f"{name}_{self._default_language}")
+        Reading `instance.field` in any of the languages, with their fallbacks, then never loads
+        a deferred column or relationship lazily. With an `AsyncSession` such lazy loads are
+        implicit IO and raise `MissingGreenlet`, so use it for instances read in other languages
+        than the one loaded by `defer_unused_languages`, e.g. when serializing a response per language.
+
+        Args:
+            model (SQLModel): A registered SQLModel class.
+            languages (Sequence[str] | None): The languages to load, all languages if `None`.
+            loader (_AbstractLoad | None): The loader option of the relationship `model` is loaded
+                through, e.g. `selectinload(Author.books)`, which the returned option extends.
+                The instances selected by the statement are loaded if `None`.
+
+        Raises:
+            ImproperlyConfiguredError: If the model is not registered in the translator.
+
+        Examples:
+            >>> books = (await session.scalars(select(Book).options(translator.load_languages(Book)))).all()
+            >>> select(Author).options(translator.load_languages(Book, loader=selectinload(Author.books)))
+
+        """
+        plan = self._get_plan(model)
+        if languages is None:
+            languages = self._languages
+
+        option = Load(model) if loader is None else loader
+        if plan.partition_models is not None:
+            return self._load_partitions(
+                model,
+                dict.fromkeys(
+                    lang for language in languages for lang in self._get_languages(plan, language)
+                ),
+                option,
+            )
+        if plan.storage == "table":
+            return option.selectinload(getattr(model, TRANSLATIONS))
+
+        for field in plan.fields:
+            if plan.storage == "json":
+                option = option.undefer(getattr(model, f"{field}{JSON_SUFFIX}"))
+                continue
+            names = dict.fromkeys(name for lang in languages for name in self._get_chain(field, plan, lang))
+            for name in names:
+                option = option.undefer(getattr(model, name))
+        return option
+
+    def _build_loader_option(
+        self,
+        model: type[SQLModel],
+        plan: TranslationPlan,
+        language: str,
+        loader: "_AbstractLoad | None" = None,
+    ) -> "_AbstractLoad":
+        option = Load(model) if loader is None else loader
+        if plan.storage == "json":
+            # the languages of the chain are extracted from the JSON columns in SQL
+            for field in plan.fields:
+                if not plan.defer_unused_languages:
+                    option = option.defer(getattr(model, f"{field}{JSON_SUFFIX}"))
+                for translation_field in self._get_chain(field, plan, language):
+                    option = option.undefer(getattr(model, translation_field))
+            return option
+
+        for field in plan.fields:
+            chain = self._get_chain(field, plan, language)
+            if plan.defer_unused_languages:
+                # translation columns are deferred by the mapper, which is cheaper than deferring
+                # them per query, as no loader has to be attached to every loaded instance
+                for translation_field in chain:
+                    option = option.undefer(getattr(model, translation_field))
+            else:
+                for lang in self._languages:
+                    translation_field = f"{field}_{lang}"
+                    if translation_field not in chain:
+                        option = option.defer(getattr(model, translation_field))
+        return option
+
+    def _apply_loader_options(self, orm_execute_state: ORMExecuteState) -> None:
+        # refreshes and lazy loads of deferred columns load exactly what was asked for
+        if not orm_execute_state.is_select or orm_execute_state.is_column_load:
+            return
+
+        statement = orm_execute_state.statement
+        if orm_execute_state.is_relationship_load:
+            # lazy and selectin loads of relationships query the related model on their own,
+            # options only apply to them on the path of the relationships they are loaded through
+            path = orm_execute_state.loader_strategy_path
+            models = [(path[-1].mapper.class_, tuple(path.path[1::2]))]
+        else:
+            models = [
+                (description["entity"], ())
+                for description in statement.column_descriptions  # pyright: ignore[reportAttributeAccessIssue]
+                # loader options only apply to whole entities, not to columns or Core selects of tables
+                if description["expr"] is description.get("entity")
+                and isinstance(description["entity"], type)
+            ]
+
+        language = self._active_language.get()
+        if language not in self._languages:
+            language = "default"
+        options = [
+            option
+            for model, relationships in models
+            for option in self._get_path_loader_options(model, relationships, language)
+        ]
+        if options:
+            orm_execute_state.statement = statement.options(*options)
+
+    def _get_path_loader_options(
+        self, model: type[SQLModel], relationships: tuple[RelationshipProperty, ...], language: str
+    ) -> tuple["_AbstractLoad", ...]:
+        """Return the `defer_unused_languages` options of `model` and of the models it is related to.
+
+        `model` is loaded through `relationships`, the options of its related models load them
+        with it when they are joined, and with their own relationship load otherwise.
+        """
+        key = (model, relationships, language)
+        options = self._path_loader_options.get(key)
+        if options is not None:
+            return options
+
+        attributes = [relationship.class_attribute for relationship in relationships]
+        targets = [(model, attributes)] + [
+            (relationship.mapper.class_, [*attributes, relationship.class_attribute])
+            for relationship in inspect(model).relationships
+        ]
+        # `defer_unused_languages` is not supported by partitioned translations
+        options = self._path_loader_options[key] = tuple(
+            self._build_loader_option(target, plan, language, defaultload(*path) if path else None)
+            for target, path in targets
+            if (plan := self._registry.get(target)) is not None and plan.defer_unused_languages
+        )
+        return options
+
+    def resolve_many(
+        self,
+        instances: Iterable[SQLModel],
+        fields: Sequence[str] | None = None,
+        language: str | None = None,
+        *,
+        as_tuples: bool = False,
+    ) -> list[dict[str, Any]] | list[tuple[Any, ...]]:
+        """Return the values of the fields of many instances of a model in one language.
+
+        Works like reading `instance.field` on every instance, but the language and the
+        fallback chain of each field are looked up once for the whole batch, and each
+        fallback language is only read for the instances still missing a value.
+
+        Args:
+            instances (Iterable[SQLModel]): Instances of a single registered model.
+            fields (Sequence[str] | None): The fields to read, translated or not.
+                All translated fields of the model if `None`.
+            language (str | None): The language to resolve, the active language if `None`.
+            as_tuples (bool): Whether to return a tuple per instance instead of a dict.
+
+        Returns:
+            list[dict[str, Any]] | list[tuple[Any, ...]]: The values per instance, in order.
+
+        Raises:
+            ImproperlyConfiguredError: If the model is not registered in the translator,
+                or a field does not exist on the model.
+            ValueError: If the instances are not all of the same model.
+
+        Examples:
+            >>> books = session.exec(select(Book)).all()
+            >>> translator.resolve_many(books, fields=("id", "title"), language="pl")
+            [{'id': 1, 'title': 'Hobbit'}, {'id': 2, 'title': 'Rok 1984'}]
+
+        """
+        instances = list(instances)
+        if not instances:
+            return []
+
+        model = type(instances[0])
+        if any(type(instance) is not model for instance in instances):
+            msg = f"all instances must be of the same model, expected '{model.__name__}'"
+            raise ValueError(msg)
+
+        plan = self._get_plan(model)
+        if fields is None:
+            fields = plan.fields
+        if language is None:
+            language = self._active_language.get()
+
+        rows = [(instance, instance.__dict__) for instance in instances]
+        columns = [self._resolve_column(rows, field, plan, language) for field in fields]
+
+        if as_tuples:
+            return list(zip(*columns))  # noqa: B905
+
+        # filling the dicts a column at a time is faster than building each from a row
+        rows_as_dicts: list[dict[str, Any]] = [{} for _ in rows]
+        for field, column in zip(fields, columns):  # noqa: B905
+            for row, value in zip(rows_as_dicts, column):  # noqa: B905
+                row[field] = value
+        return rows_as_dicts
+
+    def resolve_query(
+        self,
+        session: Session,
+        statement: Select,
+        fields: Sequence[str] | None = None,
+        language: str | None = None,
+        *,
+        as_tuples: bool = False,
+    ) -> list[dict[str, Any]] | list[tuple[Any, ...]]:
+        """Execute a query selecting a registered model and return the values of its fields.
+
+        Only the translation columns `language` can read are loaded, see
+        [`Translator.defer_unused_languages`][modeltranslation.Translator.defer_unused_languages],
+        and the instances are resolved with
+        [`Translator.resolve_many`][modeltranslation.Translator.resolve_many].
+
+        Args:
+            session (Session): The session executing the query.
+            statement (Select): A query selecting a single registered model, e.g. `select(Book)`.
+            fields (Sequence[str] | None): The fields to read, translated or not.
+                All translated fields of the model if `None`.
+            language (str | None): The language to resolve, the active language if `None`.
+            as_tuples (bool): Whether to return a tuple per instance instead of a dict.
+
+        Returns:
+            list[dict[str, Any]] | list[tuple[Any, ...]]: The values per selected instance, in order.
+
+        Raises:
+            ImproperlyConfiguredError: If the model is not registered in the translator,
+                or a field does not exist on the model.
+
+        Examples:
+            >>> translator.resolve_query(session, select(Book).where(Book.id < 3), fields=("id", "title"))
+            [{'id': 1, 'title': 'Hobbit'}, {'id': 2, 'title': 'Rok 1984'}]
+
+        """
+        model = statement.column_descriptions[0]["entity"]
+        if language is None:
+            language = self._active_language.get()
+
+        statement = statement.options(self.defer_unused_languages(model, language))
+        return self.resolve_many(session.scalars(statement).all(), fields, language, as_tuples=as_tuples)
+
+    async def async_resolve_query(
+        self,
+        session: "AsyncSession",
+        statement: Select,
+        fields: Sequence[str] | None = None,
+        language: str | None = None,
+        *,
+        as_tuples: bool = False,
+    ) -> list[dict[str, Any]] | list[tuple[Any, ...]]:
+        """Execute a query selecting a registered model with an `AsyncSession`, like `resolve_query`.
+
+        The translation columns `language` reads are loaded with the query,
+        so resolving the instances does no IO.
+
+        Args:
+            session (AsyncSession): The async session executing the query.
+            statement (Select): A query selecting a single registered model, e.g. `select(Book)`.
+            fields (Sequence[str] | None): The fields to read, translated or not.
+                All translated fields of the model if `None`.
+            language (str | None): The language to resolve, the active language if `None`.
+            as_tuples (bool): Whether to return a tuple per instance instead of a dict.
+
+        Returns:
+            list[dict[str, Any]] | list[tuple[Any, ...]]: The values per selected instance, in order.
+
+        Raises:
+            ImproperlyConfiguredError: If the model is not registered in the translator,
+                or a field does not exist on the model.
+
+        Examples:
+            >>> await translator.async_resolve_query(session, select(Book), fields=("id", "title"))
+            [{'id': 1, 'title': 'Hobbit'}, {'id': 2, 'title': 'Rok 1984'}]
+
+        """
+        model = statement.column_descriptions[0]["entity"]
+        if language is None:
+            language = self._active_language.get()
+
+        statement = statement.options(self.defer_unused_languages(model, language))
+        instances = (await session.scalars(statement)).all()
+        return self.resolve_many(instances, fields, language, as_tuples=as_tuples)
+
+    def _load_partitions(
+        self, model: type[SQLModel], languages: Iterable[str], loader: "_AbstractLoad | None" = None
+    ) -> "_AbstractLoad":
+        """Return a loader option loading the translation rows of `languages`, a query per partition.
+
+        The rows are loaded for the instances on the path of `loader`, the selected ones if `None`.
+        """
+        return (Load(model) if loader is None else loader).options(
+            *(selectinload(getattr(model, f"{TRANSLATIONS}_{language}")) for language in languages)
+        )
+
+    def _get_languages(self, plan: TranslationPlan, language: str) -> tuple[str, ...]:
+        """Return the languages read for `language`, in order, like `_get_chain` for translation fields."""
+        chains = plan.language_chains
+        return chains.get(language) or chains["default"] or (self._default_language,)
+
+    def _resolve_column(
+        self, rows: list[tuple[SQLModel, dict[str, Any]]], field: str, plan: TranslationPlan, language: str
+    ) -> list[Any]:
+        """Return the values of `field` for all rows, reading each language of the chain once."""
+        if field not in plan.fields:
+            if field not in plan.model.model_fields:
+                msg = f"'{field}' is not a field of '{plan.model.__name__}'"
+                raise ImproperlyConfiguredError(msg)
+            return [
+                values[field] if field in values else getattr(instance, field) for instance, values in rows
+            ]
+
+        if plan.storage != "columns":
+            resolve = self._get_table_translation if plan.storage == "table" else self._get_json_translation
+            return [resolve(instance, field, plan, language) for instance, _ in rows]
+
+        chains = plan.chains[field]
+        chain = chains.get(language) or chains["default"]
+        undefined = plan.undefined_values[field]
+        column: list[Any] = [None] * len(rows)
+        missing = range(len(rows))
+
+        stats = self._stats
+        for depth, name in enumerate(chain, self._first_depth(language)):
+            for i in missing:
+                instance, values = rows[i]
+                column[i] = values[name] if name in values else getattr(instance, name)
+            # most rows are resolved by the first language, the next ones only read the rest
+            resolved = len(missing)
+            missing = [i for i in missing if column[i] is None or column[i] == undefined]
+            if stats is not None and resolved > len(missing):
+                stats.record(plan.model.__name__, field, language, depth, resolved - len(missing))
+            if not missing:
+                return column
+
+        if stats is not None:
+            stats.record(plan.model.__name__, field, language, FALLBACK_VALUE_DEPTH, len(missing))
+        fallback_value = plan.fallback_values[field]
+        for i in missing:
+            column[i] = fallback_value
+        return column
+
+    def bulk_import(
+        self,
+        bind: Session | Connection,
+        model: type[SQLModel],
+        records: Iterable[TranslationRecord],
+        *,
+        batch_size: int = 1000,
+        upsert: bool = False,
+    ) -> BulkImportResult:
+        """Write translations straight to the translation columns, bypassing the ORM.
+
+        Records are consumed lazily in batches of `batch_size`, so memory use does not
+        depend on the number of records. Each batch is written with one executemany
+        statement per translation column, an `UPDATE` of existing rows. With `upsert`, the rows
+        of the batch that don't exist yet are first inserted with all their values in the batch.
+        Text values, e.g. from `read_csv`, are converted to the types of their columns.
+        The statements run in the transaction of `bind`, committing is up to the caller.
+
+        Args:
+            bind (Session | Connection): The session or connection to write with.
+            model (SQLModel): A registered SQLModel class with a single column primary key.
+            records (Iterable[TranslationRecord]): `{pk, field, language, value}` mappings,
+                e.g. from `read_csv` or `read_json_lines`.
+            batch_size (int): The number of records written per round of statements.
+            upsert (bool): Whether to insert rows that do not exist yet.
+
+        Returns:
+            BulkImportResult: The number of imported records and the import speed.
+
+        Raises:
+            ImproperlyConfiguredError: If the model is not registered in the translator, has a composite
+                primary key or a storage other than `columns`, or `upsert` inserts a row without a value
+                for a `NOT NULL` column without a default.
+            ValueError: If a record is not a translation of the model.
+
+        Examples:
+            >>> from modeltranslation.bulk import read_csv
+            >>> with Session(engine) as session:
+            ...     result = translator.bulk_import(session, Book, read_csv("titles.csv"))
+            ...     session.commit()
+
+        """
+        return bulk_import(
+            self._get_plan(model), self._languages, bind, records, batch_size=batch_size, upsert=upsert
+        )
+
+    async def async_bulk_import(
+        self,
+        bind: "AsyncSession | AsyncConnection",
+        model: type[SQLModel],
+        records: "Iterable[TranslationRecord] | AsyncIterable[TranslationRecord]",
+        *,
+        batch_size: int = 1000,
+        upsert: bool = False,
+    ) -> BulkImportResult:
+        """Write translations straight to the translation columns with an async session or connection.
+
+        Works like [`Translator.bulk_import`][modeltranslation.Translator.bulk_import],
+        `records` can also be an async iterable, which is consumed in batches of `batch_size`.
+
+        Args:
+            bind (AsyncSession | AsyncConnection): The async session or connection to write with.
+            model (SQLModel): A registered SQLModel class with a single column primary key.
+            records (Iterable[TranslationRecord] | AsyncIterable[TranslationRecord]):
+                `{pk, field, language, value}` mappings.
+            batch_size (int): The number of records written per round of statements.
+            upsert (bool): Whether to insert rows that do not exist yet.
+
+        Returns:
+            BulkImportResult: The number of imported records and the import speed.
+
+        Raises:
+            ImproperlyConfiguredError: If the model is not registered in the translator, has a composite
+                primary key or a storage other than `columns`, or `upsert` inserts a row without a value
+                for a `NOT NULL` column without a default.
+            ValueError: If a record is not a translation of the model.
+
+        Examples:
+            >>> async with AsyncSession(engine) as session:
+            ...     await translator.async_bulk_import(session, Book, read_csv("titles.csv"))
+            ...     await session.commit()
+
+        """
+        return await async_bulk_import(
+            self._get_plan(model), self._languages, bind, records, batch_size=batch_size, upsert=upsert
+        )
+
+    def bulk_export(
+        self,
+        bind: Session | Connection,
+        model: type[SQLModel],
+        *,
+        languages: Sequence[str] | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[TranslationRecord]:
+        """Stream the stored translations of a model as `{pk, field, language, value}` records.
+
+        The translation columns are read straight from the table, `batch_size` rows at a time,
+        so memory use does not depend on the size of the table. Missing translations are skipped
+        and no fallbacks are applied, the records can be imported back with `bulk_import`.
+
+        Args:
+            bind (Session | Connection): The session or connection to read with.
+            model (SQLModel): A registered SQLModel class with a single column primary key.
+            languages (Sequence[str] | None): The languages to export, all languages if `None`.
+            batch_size (int): The number of rows fetched at a time.
+
+        Returns:
+            Iterator[TranslationRecord]: The translations, ordered by primary key.
+
+        Raises:
+            ImproperlyConfiguredError: If the model is not registered in the translator, has a composite
+                primary key or a storage other than `columns`.
+            ValueError: If a language is not one of the translator languages.
+
+        Examples:
+            >>> from modeltranslation.bulk import write_csv
+            >>> with Session(engine) as session:
+            ...     write_csv("titles.csv", translator.bulk_export(session, Book, languages=("pl",)))
+
+        """
+        return bulk_export(
+            self._get_plan(model), self._export_languages(languages), bind, batch_size=batch_size
+        )
+
+    def async_bulk_export(
+        self,
+        bind: "AsyncSession | AsyncConnection",
+        model: type[SQLModel],
+        *,
+        languages: Sequence[str] | None = None,
+        batch_size: int = 1000,
+    ) -> "AsyncIterator[TranslationRecord]":
+        """Stream the stored translations of a model with an async session or connection.
+
+        Works like [`Translator.bulk_export`][modeltranslation.Translator.bulk_export],
+        the rows are streamed from the database with a server side cursor where supported.
+
+        Args:
+            bind (AsyncSession | AsyncConnection): The async session or connection to read with.
+            model (SQLModel): A registered SQLModel class with a single column primary key.
+            languages (Sequence[str] | None): The languages to export, all languages if `None`.
+            batch_size (int): The number of rows fetched at a time.
+
+        Returns:
+            AsyncIterator[TranslationRecord]: The translations, ordered by primary key.
+
+        Raises:
+            ImproperlyConfiguredError: If the model is not registered in the translator, has a composite
+                primary key or a storage other than `columns`.
+            ValueError: If a language is not one of the translator languages.
+
+        Examples:
+            >>> async for record in translator.async_bulk_export(session, Book):
+            ...     print(record)
+
+        """
+        return async_bulk_export(
+            self._get_plan(model), self._export_languages(languages), bind, batch_size=batch_size
+        )
+
+    def _export_languages(self, languages: Sequence[str] | None) -> Sequence[str]:
+        if languages is None:
+            return self._languages
+
+        for language in languages:
+            if language not in self._languages:
+                msg = f"'{language}' is not one of the translator languages {self._languages}"
+                raise ValueError(msg)
+        return languages
+
+    def partition_binds(
+        self, partitions: Mapping[str, Engine | Connection]
+    ) -> dict[type[SQLModel], Engine | Connection]:
+        """Return the binds routing the partitioned translations of every language to their database.
+
+        Pass them as the `binds` of a `Session` or `AsyncSession`, which then reaches the database
+        of a language only to read or write its translations, and the `bind` of the session
+        for everything else. Several languages can share a database.
+        Without `twophase=True` the session commits each database separately.
+
+        Args:
+            partitions (Mapping[str, Engine | Connection]): The engine or connection of each language.
+
+        Returns:
+            dict[type[SQLModel], Engine | Connection]: The bind of each partition model.
+
+        Raises:
+            ImproperlyConfiguredError: If a language of the translator has no partition.
+
+        Examples:
+            >>> partitions = {"en": create_engine("sqlite:///en.db"), "pl": create_engine("sqlite:///pl.db")}
+            >>> translator.create_partitions(partitions)
+            >>> session = Session(engine, binds=translator.partition_binds(partitions))
+
+        """
+        missing = [language for language in self._languages if language not in partitions]
+        if missing:
+            msg = f"no partition for the languages {tuple(missing)}"
+            raise ImproperlyConfiguredError(msg)
+
+        return {
+            partition_model: partitions[language]
+            for plan in self._registry.values()
+            if plan.partition_models is not None
+            for language, partition_model in plan.partition_models.items()
+        }
+
+    def create_partitions(self, partitions: Mapping[str, Engine | Connection]) -> None:
+        """Create the missing partitioned translation tables of every language in its database.
+
+        Args:
+            partitions (Mapping[str, Engine | Connection]): The engine or connection of each language.
+
+        Raises:
+            ImproperlyConfiguredError: If a language of the translator has no partition.
+
+        """
+        for partition_model, bind in self.partition_binds(partitions).items():
+            partition_model.__table__.create(bind, checkfirst=True)  # pyright: ignore[reportAttributeAccessIssue]
+
+    def search(  # noqa: PLR0913
+        self,
+        session: Session,
+        model: type[SQLModel],
+        query: str,
+        language: str | None = None,
+        *,
+        limit: int | None = None,
+        raw: bool = False,
+    ) -> list[Any]:
+        """Return the primary keys of the instances matching a full-text query, best match first.
+
+        The query is matched against the `search_fields` resolved in `language` through its
+        fallback chain, so an instance is found by the value `instance.field` reads in that language.
+        The instances must contain every word of the query, punctuation and operators included
+        are matched as text, so user input can be passed as is. With `raw`, the query uses the
+        [FTS5 query syntax](https://sqlite.org/fts5.html#full_text_query_syntax) instead,
+        e.g. `"the hobbit"`, `hob*` or `hobbit OR doll`. The results are ranked with BM25.
+
+        Args:
+            session (Session): The session to search with, on SQLite.
+            model (SQLModel): A registered SQLModel class with `search_fields`.
+            query (str): The words to search for, or an FTS5 query with `raw`.
+            language (str | None): The language to search, the active language if `None`.
+                A language outside of `languages` searches the default language.
+            limit (int | None): The maximum number of primary keys to return, all if `None`.
+            raw (bool): Whether `query` is in the FTS5 query syntax.
+
+        Returns:
+            list[Any]: The primary keys of the matching instances.
+
+        Raises:
+            ImproperlyConfiguredError: If the model is not registered with `search_fields`,
+                or the session is not bound to SQLite.
+            ValueError: If a `raw` query is not valid FTS5 syntax.
+
+        Examples:
+            >>> ids = translator.search(session, Book, "hobbit", language="pl", limit=10)
+            >>> books = session.exec(select(Book).where(Book.id.in_(ids))).all()
+
+        """
+        plan = self._get_search_plan(model)
+        if language is None:
+            language = self._active_language.get()
+        if language not in self._languages:
+            language = self._default_language
+
+        connection = session.connection(bind_arguments={"mapper": model.__mapper__})  # pyright: ignore[reportAttributeAccessIssue]
+        return search(connection, plan.model.__table__, language, query, limit, raw=raw)  # pyright: ignore[reportAttributeAccessIssue]
+
+    def rebuild_search_index(self, bind: Session | Connection, model: type[SQLModel]) -> None:
+        """Rebuild the full-text search tables of a model from its table.
+
+        The search tables follow the changes flushed by sessions, but not the statements
+        bypassing the ORM, like `update()` or `Translator.bulk_import`; rebuild them after those.
+        Missing search tables, e.g. of a table created before `search_fields` were set, are created.
+
+        Args:
+            bind (Session | Connection): The session or connection to write with.
+            model (SQLModel): A registered SQLModel class with `search_fields`.
+
+        Raises:
+            ImproperlyConfiguredError: If the model is not registered with `search_fields`.
+
+        """
+        plan = self._get_search_plan(model)
+        connection = (
+            bind.connection(bind_arguments={"mapper": model.__mapper__})  # pyright: ignore[reportAttributeAccessIssue]
+            if isinstance(bind, Session)
+            else bind
+        )
+        create_search_tables(connection, model.__table__, plan.search_fields, self._languages)  # pyright: ignore[reportAttributeAccessIssue]
+        index_rows(connection, model.__table__, self._get_search_values(plan))  # pyright: ignore[reportAttributeAccessIssue]
+
+    def _get_search_plan(self, model: type[SQLModel]) -> TranslationPlan:
+        plan = self._get_plan(model)
+        if not plan.search_fields:
+            msg = f"'{model.__name__}' has no 'search_fields'"
+            raise ImproperlyConfiguredError(msg)
+        return plan
+
+    def _get_search_values(self, plan: TranslationPlan) -> dict[str, list[ColumnElement]]:
+        """Return the expressions of the searched fields in each language, without fallback values."""
+        values = self._search_values.get(plan.model)
+        if values is None:
+            table = plan.model.__table__  # pyright: ignore[reportAttributeAccessIssue]
+            values = self._search_values[plan.model] = {
+                lang: [
+                    self._coalesce_chain(
+                        [table.columns[name] for name in self._get_chain(field, plan, lang)],
+                        field,
+                        plan,
+                        with_fallback_value=False,
+                    ).label(field)
+                    for field in plan.search_fields
+                ]
+                for lang in self._languages
+            }
+        return values
+
+    def _sync_search_tables(self, session: Session, _: Any) -> None:  # noqa: ANN401
+        """Index the flushed instances of models with `search_fields`, and remove the deleted ones."""
+        changed, deleted = self._flushed_pks(session, lambda plan: bool(plan.search_fields))
+        for plan, pks in changed.items():
+            connection = session.connection(bind_arguments={"mapper": plan.model.__mapper__})  # pyright: ignore[reportAttributeAccessIssue]
+            index_rows(connection, plan.model.__table__, self._get_search_values(plan), pks)  # pyright: ignore[reportAttributeAccessIssue]
+        for plan, pks in deleted.items():
+            connection = session.connection(bind_arguments={"mapper": plan.model.__mapper__})  # pyright: ignore[reportAttributeAccessIssue]
+            delete_rows(connection, plan.model.__table__, self._languages, pks)  # pyright: ignore[reportAttributeAccessIssue]
+
+    def _flushed_pks(
+        self, session: Session, predicate: Callable[[TranslationPlan], bool]
+    ) -> tuple[dict[TranslationPlan, list[Any]], dict[TranslationPlan, list[Any]]]:
+        """Return the primary keys of changed and deleted flushed instances of plans matching `predicate`."""
+        changed: defaultdict[TranslationPlan, list[Any]] = defaultdict(list)
+        deleted: defaultdict[TranslationPlan, list[Any]] = defaultdict(list)
+        for instances, pks in ((session.new, changed), (session.dirty, changed), (session.deleted, deleted)):
+            for instance in instances:
+                plan = self._registry.get(type(instance))
+                if plan is not None and predicate(plan):
+                    pks[plan].append(plan.model.__mapper__.primary_key_from_instance(instance)[0])  # pyright: ignore[reportAttributeAccessIssue]
+        return changed, deleted
+
+    def resolved_table(self, model: type[SQLModel], language: str | None = None) -> Table:
+        """Return the table of a model with the translated fields resolved in a language.
+
+        Its columns are the primary key of the model and the translated fields, holding the value
+        `instance.field` reads in the language. Join it to the model table for the other columns.
+
+        Args:
+            model (SQLModel): A registered SQLModel class with `resolved_tables`.
+            language (str | None): The language of the table, the active language if `None`.
+                A language outside of `languages` reads the table of the default language.
+
+        Returns:
+            Table: The resolved table.
+
+        Raises:
+            ImproperlyConfiguredError: If the model is not registered with `resolved_tables`.
+
+        Examples:
+            >>> from sqlalchemy import select
+            >>> books = translator.resolved_table(Book, "pl")
+            >>> session.execute(select(books).where(books.c.title == "Lalka")).all()
+
+        """
+        tables = self._get_resolved_tables(model)
+        if language is None:
+            language = self._active_language.get()
+        if language not in self._languages:
+            language = self._default_language
+        return tables[language]
+
+    def rebuild_resolved_tables(self, bind: Session | Connection, model: type[SQLModel]) -> None:
+        """Rebuild the resolved tables of a model from its table.
+
+        The resolved tables follow the changes flushed by sessions, but not the statements
+        bypassing the ORM, like `update()` or `Translator.bulk_import`; rebuild them after those,
+        or to recover from writes of another application. Missing resolved tables are created.
+
+        Args:
+            bind (Session | Connection): The session or connection to write with.
+            model (SQLModel): A registered SQLModel class with `resolved_tables`.
+
+        Raises:
+            ImproperlyConfiguredError: If the model is not registered with `resolved_tables`.
+
+        """
+        tables = self._get_resolved_tables(model)
+        connection = (
+            bind.connection(bind_arguments={"mapper": model.__mapper__})  # pyright: ignore[reportAttributeAccessIssue]
+            if isinstance(bind, Session)
+            else bind
+        )
+        for resolved_table in tables.values():
+            resolved_table.create(connection, checkfirst=True)
+        values = self._get_resolved_values(self._get_plan(model))
+        refresh_rows(connection, model.__table__, tables, values)  # pyright: ignore[reportAttributeAccessIssue]
+
+    def _get_resolved_tables(self, model: type[SQLModel]) -> dict[str, Table]:
+        if not self._get_plan(model).resolved_tables:
+            msg = f"'{model.__name__}' has no 'resolved_tables'"
+            raise ImproperlyConfiguredError(msg)
+        return self._resolved_tables[model]
+
+    def _get_resolved_values(self, plan: TranslationPlan) -> dict[str, list[ColumnElement]]:
+        """Return the expressions of the translated fields in each language, with fallback values."""
+        values = self._resolved_values.get(plan.model)
+        if values is None:
+            table = plan.model.__table__  # pyright: ignore[reportAttributeAccessIssue]
+            values = self._resolved_values[plan.model] = {
+                lang: [
+                    self._coalesce_chain(
+                        [table.columns[name] for name in self._get_chain(field, plan, lang)], field, plan
+                    ).label(field)
+                    for field in plan.fields
+                ]
+                for lang in self._languages
+            }
+        return values
+
+    def _sync_resolved_tables(self, session: Session, _: Any) -> None:  # noqa: ANN401
+        """Refresh the flushed instances of models with `resolved_tables`, and remove the deleted ones."""
+        changed, deleted = self._flushed_pks(session, lambda plan: bool(plan.resolved_tables))
+        for plan, pks in changed.items():
+            connection = session.connection(bind_arguments={"mapper": plan.model.__mapper__})  # pyright: ignore[reportAttributeAccessIssue]
+            refresh_rows(
+                connection,
+                plan.model.__table__,  # pyright: ignore[reportAttributeAccessIssue]
+                self._resolved_tables[plan.model],
+                self._get_resolved_values(plan),
+                pks,
+            )
+        for plan, pks in deleted.items():
+            connection = session.connection(bind_arguments={"mapper": plan.model.__mapper__})  # pyright: ignore[reportAttributeAccessIssue]
+            delete_resolved_rows(connection, self._resolved_tables[plan.model], pks)
+
+    def coverage_report(
+        self,
+        engine: Engine,
+        models: Iterable[type[SQLModel]] | None = None,
+        *,
+        max_workers: int | None = None,
+    ) -> list[FieldCoverage]:
+        """Return how many rows of each model are translated, per field and language, computed in SQL.
+
+        Every model is counted with a single aggregate query, run in parallel on a thread pool,
+        without loading any row. The rows resolved by each fallback language and by the fallback
+        value are counted too, honoring `fallback_undefined` like reading the field.
+        Export the report with [`to_json`][modeltranslation.coverage.to_json] or
+        [`to_csv`][modeltranslation.coverage.to_csv].
+
+        Args:
+            engine (Engine): The engine to query with, a connection per thread.
+            models (Iterable[SQLModel] | None): Registered SQLModel classes, all registered models if `None`.
+            max_workers (int | None): The number of threads, see `ThreadPoolExecutor`.
+
+        Returns:
+            list[FieldCoverage]: The coverage sorted by model, field and language.
+
+        Raises:
+            ImproperlyConfiguredError: If a model is not registered in the translator,
+                or has partitioned translations.
+
+        Examples:
+            >>> translator.coverage_report(engine)
+            [FieldCoverage(model='Book', field='title', language='de', rows=120, translated=30, ...), ...]
+
+        """
+        plans = [self._get_plan(model) for model in (self._registry if models is None else models)]
+        for plan in plans:
+            if plan.partition_models is not None:
+                msg = (
+                    f"coverage of '{plan.model.__name__}' isn't supported, its translations are partitioned"
+                )
+                raise ImproperlyConfiguredError(msg)
+
+        def report(plan: TranslationPlan) -> list[FieldCoverage]:
+            with engine.connect() as connection:
+                return model_coverage(connection, plan, self._languages)
+
+        with ThreadPoolExecutor(max_workers) as executor:
+            reports = list(executor.map(report, plans))
+        return sorted(
+            (entry for model_report in reports for entry in model_report),
+            key=lambda entry: (entry.model, entry.field, entry.language),
+        )
+
+    def schema_changes(self, connection: Connection) -> list["ExecutableDDLElement"]:
+        """Return the statements bringing a database up to date with the registered models.
+
+        E.g. after adding a language to `languages`, the `<field>_<language>` columns of the models
+        don't exist in a database created before. The tables of the models, their companion translation
+        tables and resolved tables are compared with the database, missing tables are created
+        and missing columns added, nullable, with their indexes. Partitions are created by
+        [`Translator.create_partitions`][modeltranslation.Translator.create_partitions].
+
+        Args:
+            connection (Connection): A connection to the database to compare with.
+
+        Returns:
+            list[ExecutableDDLElement]: The statements, in the order to execute them.
+
+        Examples:
+            >>> with engine.connect() as connection:
+            ...     for statement in translator.schema_changes(connection):
+            ...         print(statement.compile(connection))
+            ALTER TABLE book ADD COLUMN title_de VARCHAR
+
+        """
+        tables = []
+        for plan in self._registry.values():
+            tables.append(plan.model.__table__)  # pyright: ignore[reportAttributeAccessIssue]
+            if plan.translation_model is not None:
+                tables.append(plan.translation_model.__table__)  # pyright: ignore[reportAttributeAccessIssue]
+            tables.extend(self._resolved_tables.get(plan.model, {}).values())
+        return schema_changes(connection, tables)
+
+    def migrate_schema(self, connection: Connection) -> list["ExecutableDDLElement"]:
+        """Bring a database up to date with the registered models, see `Translator.schema_changes`.
+
+        Args:
+            connection (Connection): A connection to the database to migrate, committed by the caller.
+
+        Returns:
+            list[ExecutableDDLElement]: The executed statements.
+
+        """
+        statements = self.schema_changes(connection)
+        for statement in statements:
+            connection.execute(statement)
+        return statements
+
+    def backfill_language(  # noqa: PLR0913
+        self,
+        engine: Engine,
+        model: type[SQLModel],
+        language: str,
+        *,
+        source: str = "fallback",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        after: Any = None,  # noqa: ANN401
+        progress: Callable[[Any], None] | None = None,
+    ) -> int:
+        """Fill the empty translations of a language, e.g. added to `languages`, from other languages.
+
+        The rows are updated in primary key ranges of `batch_size` rows, each in its own transaction,
+        so the table is never locked for long. Translations with a value, other than the
+        `fallback_undefined` one, are kept.
+        Rebuild the resolved and search tables of the model afterwards, the cache is cleared.
+
+        Args:
+            engine (Engine): The engine to update the model table with.
+            model (SQLModel): A registered SQLModel class with `columns` storage.
+            language (str): The language to fill, one of `languages`.
+            source (str): Where the values come from, `"fallback"` for the first value of the
+                fallback chain of the language, `"default"` for the default language.
+            batch_size (int): The number of rows updated per transaction.
+            after (Any): The primary key to resume after, from the first row if `None`.
+            progress (Callable[[Any], None] | None): Called with the last primary key of every
+                committed range, pass it as `after` to resume an interrupted backfill.
+
+        Returns:
+            int: The number of rows in the updated ranges.
+
+        Raises:
+            ImproperlyConfiguredError: If the model is not registered with `columns` storage,
+                or has a composite primary key.
+            ValueError: If the language is not one of `languages`, or `source` is unknown.
+
+        Examples:
+            >>> translator.backfill_language(engine, Book, "de", batch_size=5000, progress=print)
+            5000
+            10000
+            12345
+
+        """
+        plan = self._get_plan(model)
+        if plan.storage != "columns":
+            msg = f"backfill requires the 'columns' storage, '{model.__name__}' uses '{plan.storage}'"
+            raise ImproperlyConfiguredError(msg)
+        if language not in self._languages:
+            msg = f"'{language}' is not one of the translator languages {self._languages}"
+            raise ValueError(msg)
+        if source not in ("fallback", "default"):
+            msg = f"'source' must be 'fallback' or 'default', not {source!r}"
+            raise ValueError(msg)
+
+        chain = plan.language_chains[language] if source == "fallback" else (self._default_language,)
+        source_languages = [lang for lang in chain if lang != language]
+        if not source_languages:
+            return 0
+
+        table = model.__table__  # pyright: ignore[reportAttributeAccessIssue]
+        values = {
+            f"{field}_{language}": self._coalesce_chain(
+                [table.columns[f"{field}_{lang}"] for lang in source_languages],
+                field,
+                plan,
+                with_fallback_value=False,
+            )
+            for field in plan.fields
+        }
+        undefined = {
+            f"{field}_{language}": plan.undefined_values[field]
+            for field in plan.fields
+            if plan.undefined_values[field] is not NO_UNDEFINED_VALUE
+        }
+        rows = backfill(
+            engine, table, values, undefined=undefined, batch_size=batch_size, after=after, progress=progress
+        )
+        if self._cache is not None:
+            self._cache.clear()
+        return rows
+
+    def _get_plan(self, model: type[SQLModel]) -> TranslationPlan:
+        plan = self._registry.get(model)
+        if plan is None:
+            msg = f"'{model.__name__}' is not registered in the translator"
+            raise ImproperlyConfiguredError(msg)
+        return plan
+
+    def _compile_plan(self, model: type[SQLModel], options: TranslationOptions) -> TranslationPlan:
+        """Compile validated options into the plan used on every access to the model."""
+        fields = tuple(options.fields)
+
+        undefined_values = dict.fromkeys(fields, NO_UNDEFINED_VALUE)
+        if options.fallback_undefined is not None:
+            undefined_values.update(
+                (field, value) for field, value in options.fallback_undefined.items() if field in fields
+            )
+
+        if type(options.fallback_values) is dict:
+            fallback_values = {field: options.fallback_values.get(field) for field in fields}
+        else:
+            fallback_values = dict.fromkeys(fields, options.fallback_values)
+
+        if options.indexed_fields is None:
+            table = model.__table__  # pyright: ignore[reportAttributeAccessIssue]
+            indexed_fields = (
+                tuple(field for field in fields if table.columns[field].index)
+                if options.storage == "columns"
+                else ()
+            )
+        else:
+            indexed_fields = tuple(options.indexed_fields)
+
+        language_chains = self._compile_language_chains(options)
+        return TranslationPlan(
+            model=model,
+            options=options,
+            fields=fields,
+            storage=options.storage,
+            sql_fallbacks=options.sql_fallbacks,
+            defer_unused_languages=options.defer_unused_languages,
+            chains={field: self._compile_fallback_chains(field, language_chains) for field in fields},
+            language_chains=language_chains,
+            required=frozenset(
+                (language, field)
+                for language in self._languages
+                for field in fields
+                if self._options_require(language, field, options)
+            ),
+            undefined_values=undefined_values,
+            fallback_values=fallback_values,
+            indexed_fields=indexed_fields,
+            fallback_indexes=options.fallback_indexes,
+            search_fields=tuple(options.search_fields),
+            resolved_tables=options.resolved_tables,
+        )
+
+    def _compile_language_chains(self, options: TranslationOptions) -> dict[str, tuple[str, ...]]:
+        """Resolve the languages to read, in order, for every language.
+
+        The chains are computed once per registered options, so reading a translated field
+        only walks a tuple. The chain used when the active language is not one of `languages`
+        is stored under the `default` key, like in `fallback_languages`.
+        """
+        chains = {
+            language: (language, *self._fallbacks_generator(language, options))
+            for language in self._languages
+        }
+        chains["default"] = tuple(self._fallbacks_generator("default", options))
+        return chains
+
+    def _compile_fallback_chains(
+        self, field: str, language_chains: dict[str, tuple[str, ...]]
+    ) -> dict[str, tuple[str, ...]]:
+        """Resolve the translation fields of `field` to read, in order, for every language."""
+        return {
+            language: tuple(f"{field}_{lang}" for lang in chain)
+            for language, chain in language_chains.items()
+        }
+
+    def _replace_accessors(self, model: type[SQLModel], plan: TranslationPlan) -> type[SQLModel]:
+        # translated fields are routed by per-field descriptors installed on the model itself,
+        # every other attribute of this or any other model keeps the plain SQLModel access path
+        descriptor = {
+            "columns": TranslationDescriptor,
+            "table": TranslationTableDescriptor,
+            "json": TranslationJSONDescriptor,
+        }[plan.storage]
+        descriptors = {field: descriptor(self, field, plan) for field in plan.fields}
+        for field, field_descriptor in descriptors.items():
+            setattr(model, field, field_descriptor)
+
+        def locale_set_decorator(original_set_function: Callable) -> Callable:
+            @wraps(original_set_function)
+            def locale_function(model_self: type[SQLModel], name: str, value: Any) -> Callable:  # noqa: ANN401
+                # SQLModel assigns fields to the instance without calling data descriptors
+                field_descriptor = descriptors.get(name)
+                if field_descriptor is None:
+                    return original_set_function(model_self, name, value)
+                return field_descriptor.__set__(model_self, value)
 
             return locale_function
 
-        model.__class__.__getattribute__ = locale_class_get_decorator(model.__class__.__getattribute__)
-        model.__getattribute__ = locale_get_decorator(model.__getattribute__)
         model.__setattr__ = locale_set_decorator(model.__setattr__)
         return model
 
-    def _rebuild_model(self, model: type[SQLModel], options: TranslationOptions) -> None:
-        def make_serializer(field_name: str) -> Callable:
-            @field_serializer(field_name, when_used="json")
-            def serial(self: type[SQLModel], _: Any) -> Any:  # noqa: ANN401
-                return getattr(self, field_name)
+    def _get_translation(self, instance: SQLModel, field: str, plan: TranslationPlan) -> Any:  # noqa: ANN401
+        """Return the value of `field` in the active language, applying fallbacks."""
+        values = instance.__dict__
+        chains = plan.chains[field]
+
+        # chains of languages in `languages` are never empty, they start with the language itself
+        for name in chains.get(self._active_language.get()) or chains["default"]:
+            # loaded columns live in the instance dict, anything else (expired or deferred
+            # columns) goes through SQLAlchemy so that it can be loaded
+            value = values[name] if name in values else getattr(instance, name)
+            if not self._is_null_value(field, value, plan):
+                return value
+
+        # no fallback language yielded a value, try fallback values
+        return self._fallback_value(field, plan)
+
+    def _get_counted_translation(self, instance: SQLModel, field: str, plan: TranslationPlan) -> Any:  # noqa: ANN401
+        """Return what `_get_translation` does and count how the value was resolved."""
+        values = instance.__dict__
+        chains = plan.chains[field]
+        language = self._active_language.get()
+        chain_values = (
+            values[name] if name in values else getattr(instance, name)
+            for name in chains.get(language) or chains["default"]
+        )
+        return self._first_counted_value(chain_values, field, plan, language)
+
+    def _first_value(self, values: Iterable[Any], field: str, plan: TranslationPlan) -> Any:  # noqa: ANN401
+        """Return the first of the values of a fallback chain that is set, or the fallback value."""
+        for value in values:
+            if not self._is_null_value(field, value, plan):
+                return value
+        return self._fallback_value(field, plan)
+
+    def _first_counted_value(
+        self, values: Iterable[Any], field: str, plan: TranslationPlan, language: str
+    ) -> Any:  # noqa: ANN401
+        """Return what `_first_value` does and count the depth of the chain of `language` it was found at."""
+        stats = self._require_stats()
+        for depth, value in enumerate(values, self._first_depth(language)):
+            if not self._is_null_value(field, value, plan):
+                stats.record(plan.model.__name__, field, language, depth)
+                return value
+
+        stats.record(plan.model.__name__, field, language, FALLBACK_VALUE_DEPTH)
+        return self._fallback_value(field, plan)
+
+    def _first_depth(self, language: str) -> int:
+        """Return the depth counted for the first language read when resolving `language`."""
+        # a language outside `languages` has no value of its own, its chain starts with a fallback
+        return 0 if language in self._languages else 1
+
+    def _get_table_translation(
+        self, instance: SQLModel, field: str, plan: TranslationPlan, language: str
+    ) -> Any:  # noqa: ANN401
+        """Return the value of `field` in `language` from the translation rows, applying fallbacks."""
+        return self._first_value(self._table_values(instance, field, plan, language), field, plan)
+
+    def _get_counted_table_translation(
+        self, instance: SQLModel, field: str, plan: TranslationPlan, language: str
+    ) -> Any:  # noqa: ANN401
+        """Return what `_get_table_translation` does and count how the value was resolved."""
+        values = self._table_values(instance, field, plan, language)
+        return self._first_counted_value(values, field, plan, language)
+
+    def _table_values(
+        self, instance: SQLModel, field: str, plan: TranslationPlan, language: str
+    ) -> Iterator[Any]:
+        """Yield the values of `field` along the fallback chain of `language`, `None` for missing rows.
+
+        Rows are only fetched when reached, so partitions after the resolved language aren't loaded.
+        """
+        if plan.partition_models is not None:
+            get_row = partial(self._get_partition_row, instance)
+        else:
+            rows = instance.__dict__.get(TRANSLATIONS)
+            if rows is None:
+                # new instances and expired relationships go through SQLAlchemy
+                rows = getattr(instance, TRANSLATIONS)
+            get_row = rows.get
+
+        chains = plan.language_chains
+        for lang in chains.get(language) or chains["default"]:
+            row = get_row(lang)
+            yield None if row is None else getattr(row, field)
+
+    def _set_table_translation(
+        self,
+        instance: SQLModel,
+        field: str,
+        value: Any,  # noqa: ANN401
+        plan: TranslationPlan,
+    ) -> None:
+        """Write `value` to the translation row of the active language, like `_get_translation_field`."""
+        language = self.get_active_language()
+        if language not in self._languages:
+            language = self._default_language
+
+        if plan.partition_models is not None:
+            row = self._get_partition_row(instance, language)
+            if row is None:
+                if value is None:
+                    return
+                row = plan.partition_models[language]()
+                # the relationship is not a pydantic field, set it on the SQLAlchemy attribute
+                set_attribute(instance, f"{TRANSLATIONS}_{language}", row)
+            setattr(row, field, value)
+            return
 
-            return serial
+        rows = getattr(instance, TRANSLATIONS)
+        row = rows.get(language)
+        if row is None:
+            # a missing row reads like a row of `None` values
+            if value is None:
+                return
+            row = rows[language] = plan.translation_model(language=language)  # pyright: ignore[reportOptionalCall]
+        setattr(row, field, value)
+
+    def _get_partition_row(self, instance: SQLModel, language: str) -> SQLModel | None:
+        """Return the translation row of `language` of an instance with partitioned translations."""
+        name = f"{TRANSLATIONS}_{language}"
+        values = instance.__dict__
+        # rows not loaded yet are loaded from their partition only now
+        return values[name] if name in values else getattr(instance, name)
+
+    def _get_json_translation(
+        self, instance: SQLModel, field: str, plan: TranslationPlan, language: str
+    ) -> Any:  # noqa: ANN401
+        """Return the value of `field` in `language` from its JSON column, applying fallbacks."""
+        return self._first_value(self._json_values(instance, field, plan, language), field, plan)
+
+    def _get_counted_json_translation(
+        self, instance: SQLModel, field: str, plan: TranslationPlan, language: str
+    ) -> Any:  # noqa: ANN401
+        """Return what `_get_json_translation` does and count how the value was resolved."""
+        values = self._json_values(instance, field, plan, language)
+        return self._first_counted_value(values, field, plan, language)
+
+    def _json_values(
+        self, instance: SQLModel, field: str, plan: TranslationPlan, language: str
+    ) -> list[Any]:
+        """Return the values of `field` along the fallback chain of `language` from its JSON column."""
+        values = instance.__dict__
+        column = f"{field}{JSON_SUFFIX}"
+        chains = plan.language_chains
+        languages = chains.get(language) or chains["default"]
+
+        if column in values:
+            translations = values[column] or {}
+        elif all(f"{field}_{lang}" in values for lang in languages):
+            # only the languages of the chain were extracted by `defer_unused_languages`
+            return [values[f"{field}_{lang}"] for lang in languages]
+        else:
+            translations = getattr(instance, column) or {}
+        return [translations.get(lang) for lang in languages]
 
-        for field in options.fields:
+    def _set_json_translation(
+        self,
+        instance: SQLModel,
+        field: str,
+        value: Any,  # noqa: ANN401
+        plan: TranslationPlan,  # noqa: ARG002
+    ) -> None:
+        """Set the key of the active language in the JSON column of `field`."""
+        language = self.get_active_language()
+        if language not in self._languages:
+            language = self._default_language
+
+        column = f"{field}{JSON_SUFFIX}"
+        # a new object, as changes inside of a JSON value are not tracked
+        translations = dict(getattr(instance, column) or {})
+        if value is None:
+            # missing keys read like `None`, so only present translations take space
+            translations.pop(language, None)
+        else:
+            translations[language] = value
+        setattr(instance, column, translations or None)
+
+    def _get_class_translation(self, model: type[SQLModel], field: str, plan: TranslationPlan) -> Any:  # noqa: ANN401
+        """Return what `Model.field` refers to in queries in the active language."""
+        if plan.partition_models is not None:
+            msg = f"'{model.__name__}.{field}' can't be used in queries, its translations are partitioned"
+            raise ImproperlyConfiguredError(msg)
+        if plan.sql_fallbacks:
+            return self.fallback_expression(model, field)
+        return getattr(model, self._get_class_translation_field(field, plan))
+
+    def _get_class_translation_field(self, field: str, plan: TranslationPlan) -> str:
+        """Return the name of the translation field `Model.field` refers to in the active language."""
+        return self._get_chain(field, plan, self._active_language.get())[0]
+
+    def _get_chain(self, field: str, plan: TranslationPlan, language: str) -> tuple[str, ...]:
+        """Return the non-empty chain of translation fields of `field` read for `language` in queries."""
+        chains = plan.chains[field]
+        return chains.get(language) or chains["default"] or (f"{field}_{self._default_language}",)
+
+    def _get_translation_field(self, field: str) -> str:
+        """Return the name of the translation field `field` is written to in the active language."""
+        active_language = self.get_active_language()
+        # if language is in translation use it, else use the default translator language
+        if active_language in self._languages:
+            return f"{field}_{active_language}"
+        return f"{field}_{self._default_language}"
+
+    def _make_serializer(self, field: str, plan: TranslationPlan) -> Callable:
+        """Return the json serializer of `field`, resolving it like reading `instance.field`."""
+        active_language = self._active_language
+
+        if plan.storage != "columns":
+            resolve = self._get_table_translation if plan.storage == "table" else self._get_json_translation
+
+            @field_serializer(field, when_used="json")
+            def stored_serial(self: SQLModel, _: Any) -> Any:  # noqa: ANN401
+                return resolve(self, field, plan, active_language.get())
+
+            return stored_serial
+
+        if self._stats is not None:
+            get_counted_translation = self._get_counted_translation
+
+            @field_serializer(field, when_used="json")
+            def counted_serial(self: SQLModel, _: Any) -> Any:  # noqa: ANN401
+                return get_counted_translation(self, field, plan)
+
+            return counted_serial
+
+        # the resolution of `_get_translation` with everything but the active language bound
+        # once, serializing skips the descriptor and the lookups in the plan
+        chains = plan.chains[field]
+        default_chain = chains["default"]
+        undefined = plan.undefined_values[field]
+        fallback_value = plan.fallback_values[field]
+
+        @field_serializer(field, when_used="json")
+        def serial(self: SQLModel, _: Any) -> Any:  # noqa: ANN401
+            values = self.__dict__
+            for name in chains.get(active_language.get()) or default_chain:
+                value = values[name] if name in values else getattr(self, name)
+                if value is not None and value != undefined:
+                    return value
+            return fallback_value
+
+        return serial
+
+    def _rebuild_model(self, model: type[SQLModel], plan: TranslationPlan) -> None:
+        for field in plan.fields:
             orig_type = model.__table__.columns[field].type  # pyright: ignore[reportAttributeAccessIssue]
             orig_annotation = model.__annotations__[field]
 
@@ -272,38 +2138,97 @@ class Translator:
             model.model_fields[field].annotation = model.__annotations__[field]
 
             # add custom json serialization
-            setattr(model, f"_serialize_{field}", make_serializer(field))
+            setattr(model, f"_serialize_{field}", self._make_serializer(field, plan))
 
-            for lang in self._languages:
-                translation_field = f"{field}_{lang}"
+            if plan.storage == "table":
+                continue
+            if plan.storage == "json":
+                self._add_json_column(model, field, plan, orig_type)
+                continue
 
+            for lang in self._languages:
                 translation_annotation = (
                     orig_annotation
-                    if self._is_required(lang, field, options)
+                    if self._is_required(lang, field, plan)
                     else self._make_optional(orig_annotation)
                 )
-
-                # change model SQL Alchemy table
                 column = Column(
-                    translation_field, orig_type, nullable=(not self._is_required(lang, field, options))
+                    f"{field}_{lang}",
+                    orig_type,
+                    nullable=(not self._is_required(lang, field, plan)),
+                    index=field in plan.indexed_fields,
+                )
+                self._add_translation_field(
+                    model, field, column, translation_annotation, deferred=plan.defer_unused_languages
                 )
 
-                model.__table__.append_column(column)  # pyright: ignore[reportAttributeAccessIssue]
-
-                # change model Pydantic field
-                pydantic_field = deepcopy(model.model_fields[field])
-                pydantic_field.exclude = True
-                pydantic_field.alias = translation_field
-                pydantic_field.annotation = translation_annotation
-
-                model.model_fields[translation_field] = pydantic_field
-                model.__annotations__[translation_field] = translation_annotation
-
-                setattr(model, translation_field, column_property(column))
+            if plan.fallback_indexes and field in plan.indexed_fields:
+                self._add_fallback_indexes(model, field, plan)
 
-        model.__pydantic_decorators__.build(model)
+        # `build` only collects decorators added since the class was created, keep the model's own
+        decorators = model.__pydantic_decorators__
+        added_decorators = decorators.build(model)
+        decorators.field_serializers.update(added_decorators.field_serializers)
+        model.__pydantic_decorators__ = decorators
         model.model_rebuild(force=True)
 
+    def _add_translation_field(
+        self,
+        model: type[SQLModel],
+        field: str,
+        column: Column,
+        annotation: Any,  # noqa: ANN401
+        *,
+        deferred: bool,
+    ) -> None:
+        """Add `column` to the table of `model`, and as a pydantic field excluded from serialization."""
+        # change model SQL Alchemy table
+        model.__table__.append_column(column)  # pyright: ignore[reportAttributeAccessIssue]
+
+        # change model Pydantic field
+        # a shallow copy is enough as only these attributes differ from the base field,
+        # deep copies were most of the registration time
+        pydantic_field = copy(model.model_fields[field])
+        pydantic_field.metadata = list(pydantic_field.metadata)
+        pydantic_field.exclude = True
+        pydantic_field.alias = column.name
+        pydantic_field.annotation = annotation
+
+        model.model_fields[column.name] = pydantic_field
+        model.__annotations__[column.name] = annotation
+
+        setattr(model, column.name, column_property(column, deferred=deferred))
+
+    def _add_fallback_indexes(self, model: type[SQLModel], field: str, plan: TranslationPlan) -> None:
+        """Index the fallback expression of `field` in every language, where it's not a single column."""
+        table = model.__table__  # pyright: ignore[reportAttributeAccessIssue]
+        for lang in self._languages:
+            expression = self._coalesce_chain(
+                [table.columns[name] for name in self._get_chain(field, plan, lang)], field, plan
+            )
+            if isinstance(expression, Column):
+                continue
+            # the index is bound to the table through its columns
+            Index(f"ix_{table.name}_{field}_{lang}_fallback", expression).ddl_if(
+                dialect=FALLBACK_INDEX_DIALECTS
+            )
+
+    def _add_json_column(
+        self, model: type[SQLModel], field: str, plan: TranslationPlan, value_type: TypeEngine
+    ) -> None:
+        column = make_json_column(field)
+        self._add_translation_field(
+            model, field, column, dict[str, Any] | None, deferred=plan.defer_unused_languages
+        )
+
+        # read-only translations extracted in SQL, used in queries and by `defer_unused_languages`
+        for lang in self._languages:
+            setattr(
+                model,
+                f"{field}_{lang}",
+                column_property(extract_translation(column, lang, value_type), deferred=True),
+            )
+
     def _make_optional(self, typehint: Any) -> Any:  # noqa: ANN401
         """Wrap a type in Optional[] unless it's already optional."""
         origin = get_origin(typehint)
@@ -312,7 +2237,10 @@ class Translator:
             return typehint
         return typehint | None
 
-    def _is_required(self, language: str, field: str, options: TranslationOptions) -> bool:
+    def _is_required(self, language: str, field: str, plan: TranslationPlan) -> bool:
+        return (language, field) in plan.required
+
+    def _options_require(self, language: str, field: str, options: TranslationOptions) -> bool:
         if type(options.required_languages) is tuple:
             return language in options.required_languages
 
@@ -324,12 +2252,9 @@ class Translator:
         # required_languages in TranslationOptions is None
         return False
 
-    def _is_null_value(self, field: str, value: Any, options: TranslationOptions) -> bool:  # noqa: ANN401
-        # if translation defines custom fallback undefined value then check if value is eq to it
-        if options.fallback_undefined is not None and field in options.fallback_undefined:
-            return value is None or value == options.fallback_undefined[field]
-        # else check if value is eq None
-        return value is None
+    def _is_null_value(self, field: str, value: Any, plan: TranslationPlan) -> bool:  # noqa: ANN401
+        # fields without a custom fallback undefined value compare unequal to everything
+        return value is None or value == plan.undefined_values[field]
 
     def _fallbacks_generator(self, language: str, options: TranslationOptions) -> Iterator[str]:
         if options.fallback_languages is not None:
@@ -350,14 +2275,8 @@ class Translator:
                 seen.add(fallback)
                 yield fallback
 
-    def _fallback_value(self, field: str, options: TranslationOptions) -> Any:  # noqa: ANN401
-        if options.fallback_values is None:
-            return None
-        if type(options.fallback_values) is not dict:
-            return options.fallback_values
-        if field in options.fallback_values:
-            return options.fallback_values[field]
-        return None
+    def _fallback_value(self, field: str, plan: TranslationPlan) -> Any:  # noqa: ANN401
+        return plan.fallback_values[field]
 
     def _validate_translator_object(self) -> None:
         if self._languages is None:
@@ -377,8 +2296,16 @@ class Translator:
 
         self._validate_fallback_languages(self._fallback_languages)
 
-    def _validate_translation_options(self, options: TranslationOptions) -> None:
+    def _validate_translation_options(self, model: type[SQLModel], options: TranslationOptions) -> None:
         self._validate_fallback_languages(options.fallback_languages)
+        self._validate_storage(options)
+        self._validate_partitioning(options)
+        self._validate_field_subsets(options)
+        # what depends on the model itself, checked here so a later model can't fail after changes
+        if options.storage == "table":
+            check_translated_model(model, self._languages, partitioned=options.partitioned)
+        if options.search_fields:
+            check_search_table(model.__table__)  # pyright: ignore[reportAttributeAccessIssue]
 
         if options.required_languages is None:
             return
@@ -397,6 +2324,45 @@ class Translator:
             msg = f"'required_languages' type is invalid {type(options.required_languages)}"
             raise ImproperlyConfiguredError(msg)
 
+    def _validate_storage(self, options: TranslationOptions) -> None:
+        if options.storage not in ("columns", "table", "json"):
+            msg = f"'storage' must be 'columns', 'table' or 'json', not {options.storage!r}"
+            raise ImproperlyConfiguredError(msg)
+
+        unsupported = {
+            "columns": (),
+            "table": ("required_languages", "defer_unused_languages"),
+            "json": ("required_languages",),
+        }
+        if options.storage != "columns":
+            unsupported[options.storage] += (
+                "indexed_fields",
+                "fallback_indexes",
+                "search_fields",
+                "resolved_tables",
+            )
+        for option in unsupported[options.storage]:
+            if getattr(options, option):
+                msg = f"'{option}' is not supported with '{options.storage}' storage"
+                raise ImproperlyConfiguredError(msg)
+
+    def _validate_partitioning(self, options: TranslationOptions) -> None:
+        if not options.partitioned:
+            return
+        if options.storage != "table":
+            msg = f"'partitioned' is only supported with 'table' storage, not {options.storage!r}"
+            raise ImproperlyConfiguredError(msg)
+        if options.sql_fallbacks:
+            msg = "'sql_fallbacks' is not supported with partitioned translations"
+            raise ImproperlyConfiguredError(msg)
+
+    def _validate_field_subsets(self, options: TranslationOptions) -> None:
+        for option in ("indexed_fields", "search_fields"):
+            for field in getattr(options, option) or ():
+                if field not in options.fields:
+                    msg = f"'{field}' used in '{option}' is not a translated field"
+                    raise ImproperlyConfiguredError(msg)
+
     def _validate_fallback_languages(self, fallback_languages: dict[str, tuple[str, ...]] | None) -> None:
         if fallback_languages is None:
             return
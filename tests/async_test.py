@@ -0,0 +1,206 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable, Coroutine
+from pathlib import Path
+from typing import Any
+
+import pytest
+from sqlalchemy.exc import MissingGreenlet
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import selectinload
+from sqlmodel import Field, Relationship, SQLModel, select, update
+from sqlmodel.pool import StaticPool
+
+from src.modeltranslation.bulk import TranslationRecord, read_csv, write_csv
+from src.modeltranslation.translator import Translator
+
+ASYNC_OPTIONS: dict[str, Any] = {"columns": {"title": str}, "defer_unused_languages": True}
+
+
+def run(test: Callable[[AsyncEngine], Coroutine[Any, Any, None]]) -> None:
+    async def main() -> None:
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+        try:
+            await test(engine)
+        finally:
+            await engine.dispose()
+
+    asyncio.run(main())
+
+
+async def seed(engine: AsyncEngine, translator: Translator, book_cls: type[SQLModel]) -> None:
+    async with AsyncSession(engine) as session:
+        hobbit = book_cls(title="The Hobbit")
+        token = translator.set_active_language("pl")
+        hobbit.title = "Hobbit"
+        translator.reset_active_language(token)
+        session.add_all([hobbit, book_cls(title="Dune")])
+        await session.commit()
+
+
+@pytest.mark.parametrize("storage", ["columns", "json"])
+def test_async_deferred_languages(
+    translator: Translator, storage: str, register_book: Callable[..., type[SQLModel]]
+) -> None:
+    book_cls = register_book(**ASYNC_OPTIONS, storage=storage)
+
+    async def test(engine: AsyncEngine) -> None:
+        await seed(engine, translator, book_cls)
+
+        async with AsyncSession(engine) as session:
+            books = (await session.scalars(select(book_cls).order_by(book_cls.id))).all()
+            assert [book.title for book in books] == ["The Hobbit", "Dune"]  # pyright: ignore[reportAttributeAccessIssue]
+            translator.set_active_language("pl")
+            # the polish translations were deferred, loading them is implicit IO
+            with pytest.raises(MissingGreenlet):
+                _ = books[0].title  # pyright: ignore[reportAttributeAccessIssue]
+
+        async with AsyncSession(engine) as session:
+            statement = select(book_cls).order_by(book_cls.id).options(translator.load_languages(book_cls))
+            books = (await session.scalars(statement)).all()
+            for language, titles in (("pl", ["Hobbit", "Dune"]), ("de", ["The Hobbit", "Dune"])):
+                translator.set_active_language(language)
+                assert [book.title for book in books] == titles  # pyright: ignore[reportAttributeAccessIssue]
+                assert [book.model_dump_json() for book in books]
+
+    run(test)
+
+
+@pytest.mark.parametrize("storage", ["columns", "json"])
+def test_async_load_languages_relationship(
+    translator: Translator, storage: str, register_book: Callable[..., type[SQLModel]]
+) -> None:
+    book_cls = register_book(
+        columns={"title": str, "author_id": (int | None, Field(default=None, foreign_key="author.id"))},
+        defer_unused_languages=True,
+        storage=storage,
+    )
+
+    class Author(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        books: list[book_cls] = Relationship()  # type: ignore[valid-type]
+
+    async def test(engine: AsyncEngine) -> None:
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+        await seed(engine, translator, book_cls)
+        async with AsyncSession(engine) as session:
+            session.add(Author(id=1, name="Various"))
+            await session.execute(update(book_cls).values(author_id=1))
+            await session.commit()
+
+        async with AsyncSession(engine) as session:
+            books = selectinload(Author.books)
+            statement = select(Author).options(books)
+            author = (await session.scalars(statement)).one()
+            translator.set_active_language("de")
+            # the related books were loaded without their other translations, loading them is implicit IO
+            with pytest.raises(MissingGreenlet):
+                _ = author.books[0].title  # pyright: ignore[reportAttributeAccessIssue]
+
+        async with AsyncSession(engine) as session:
+            statement = select(Author).options(translator.load_languages(book_cls, loader=books))
+            author = (await session.scalars(statement)).one()
+            for language, titles in (("pl", ["Hobbit", "Dune"]), ("de", ["The Hobbit", "Dune"])):
+                translator.set_active_language(language)
+                assert [book.title for book in author.books] == titles  # pyright: ignore[reportAttributeAccessIssue]
+
+    run(test)
+
+
+def test_async_translation_table(
+    translator: Translator, register_book: Callable[..., type[SQLModel]]
+) -> None:
+    book_cls = register_book(columns={"title": str}, storage="table")
+
+    async def test(engine: AsyncEngine) -> None:
+        await seed(engine, translator, book_cls)
+
+        async with AsyncSession(engine) as session:
+            statement = select(book_cls).order_by(book_cls.id).options(translator.load_languages(book_cls))
+            books = (await session.scalars(statement)).all()
+            translator.set_active_language("pl")
+            assert [book.title for book in books] == ["Hobbit", "Dune"]  # pyright: ignore[reportAttributeAccessIssue]
+
+    run(test)
+
+
+def test_async_resolve_query(translator: Translator, register_book: Callable[..., type[SQLModel]]) -> None:
+    book_cls = register_book(**ASYNC_OPTIONS)
+
+    async def test(engine: AsyncEngine) -> None:
+        await seed(engine, translator, book_cls)
+
+        async with AsyncSession(engine) as session:
+            rows = await translator.async_resolve_query(
+                session, select(book_cls).order_by(book_cls.id), fields=("id", "title"), language="pl"
+            )
+        assert rows == [{"id": 1, "title": "Hobbit"}, {"id": 2, "title": "Dune"}]
+
+    run(test)
+
+
+def test_async_bulk_import(translator: Translator, register_book: Callable[..., type[SQLModel]]) -> None:
+    book_cls = register_book(**ASYNC_OPTIONS)
+
+    async def records() -> AsyncIterator[TranslationRecord]:
+        for pk in range(1, 6):
+            yield TranslationRecord(pk=pk, field="title", language="de", value=f"Buch {pk}")
+
+    async def test(engine: AsyncEngine) -> None:
+        async with AsyncSession(engine) as session:
+            imported = [
+                TranslationRecord(pk=pk, field="title", language="en", value=f"Book {pk}")
+                for pk in range(1, 6)
+            ]
+            result = await translator.async_bulk_import(session, book_cls, imported, upsert=True)
+            assert result.rows == 5
+            result = await translator.async_bulk_import(session, book_cls, records(), batch_size=2)
+            assert result.rows == 5
+            await session.commit()
+
+        async with AsyncSession(engine) as session:
+            rows = await translator.async_resolve_query(
+                session, select(book_cls), fields=("title",), language="de"
+            )
+        assert rows[-1] == {"title": "Buch 5"}
+
+    run(test)
+
+
+def test_bulk_export(
+    translator: Translator, tmp_path: Path, register_book: Callable[..., type[SQLModel]]
+) -> None:
+    book_cls = register_book(**ASYNC_OPTIONS)
+
+    async def test(engine: AsyncEngine) -> None:
+        await seed(engine, translator, book_cls)
+
+        async with AsyncSession(engine) as session:
+            records = [
+                record async for record in translator.async_bulk_export(session, book_cls, batch_size=1)
+            ]
+            assert records == [
+                {"pk": 1, "field": "title", "language": "en", "value": "The Hobbit"},
+                {"pk": 1, "field": "title", "language": "pl", "value": "Hobbit"},
+                {"pk": 2, "field": "title", "language": "en", "value": "Dune"},
+            ]
+
+            # the sync export, through the sync connection of the async session
+            path = tmp_path / "titles.csv"
+            exported = await session.run_sync(
+                lambda sync_session: write_csv(
+                    path, translator.bulk_export(sync_session, book_cls, languages=("pl",))
+                )
+            )
+            assert exported == 1
+            assert list(read_csv(path)) == [
+                {"pk": "1", "field": "title", "language": "pl", "value": "Hobbit"}
+            ]
+
+            with pytest.raises(ValueError, match="'fr'"):
+                translator.async_bulk_export(session, book_cls, languages=("fr",))
+
+    run(test)
@@ -0,0 +1,33 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from .factories import make_field_names, make_translated_model
+
+
+@pytest.mark.benchmark(group="assign-translated-fields")
+def test_assign_translated_fields(
+    benchmark: BenchmarkFixture, language_count: int, field_count: int
+) -> None:
+    translator, model = make_translated_model(language_count, field_count)
+    instance = model(id=1)
+    fields = make_field_names(field_count)
+
+    def assign() -> None:
+        for field in fields:
+            setattr(instance, field, "value")
+
+    benchmark(assign)
+
+    assert getattr(instance, f"{fields[0]}_{translator.get_active_language()}") == "value"
+
+
+@pytest.mark.benchmark(group="assign-untranslated-field")
+def test_assign_untranslated_field(
+    benchmark: BenchmarkFixture, language_count: int, field_count: int
+) -> None:
+    _, model = make_translated_model(language_count, field_count)
+    instance = model(id=1)
+
+    benchmark(setattr, instance, "id", 2)
+
+    assert instance.id == 2
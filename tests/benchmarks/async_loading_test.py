@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlmodel import Field, SQLModel, select
+from sqlmodel.pool import StaticPool
+
+from src.modeltranslation.translator import TranslationOptions, Translator
+
+LANGUAGES = ("en", "pl", "de", "fr", "es", "it", "pt", "nl", "sv", "cs", "uk", "ja")
+ROWS = 1000
+
+
+@pytest.mark.benchmark(group="async-load-rows-12-languages")
+@pytest.mark.parametrize("mode", ["active-language", "load-languages", "resolve-query"])
+def test_async_load_rows(benchmark: BenchmarkFixture, mode: str) -> None:
+    """Load 1000 rows with an `AsyncSession` on aiosqlite and read their titles without implicit IO."""
+
+    class Book(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+        description: str
+
+    translator = Translator(default_language="en", languages=LANGUAGES)
+
+    @translator.register(Book)
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title", "description")
+        defer_unused_languages = True
+
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    rows = []
+    for i in range(ROWS):
+        row = {"id": i}
+        for lang in LANGUAGES:
+            row[f"title_{lang}"] = f"{lang} title {i}"
+            row[f"description_{lang}"] = f"{lang} description {i}" * 10
+        rows.append(row)
+
+    async def setup() -> None:
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+            await connection.execute(Book.__table__.insert(), rows)
+
+    translator.set_active_language("pl")
+    statement = select(Book)
+    if mode == "load-languages":
+        statement = statement.options(translator.load_languages(Book, ("pl", "de")))
+
+    async def load() -> list[str]:
+        async with AsyncSession(engine) as session:
+            if mode == "resolve-query":
+                return [row["title"] for row in await translator.async_resolve_query(session, statement)]
+            return [book.title for book in (await session.scalars(statement)).all()]
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(setup())
+        assert len(benchmark(lambda: loop.run_until_complete(load()))) == ROWS
+        loop.run_until_complete(engine.dispose())
+    finally:
+        loop.close()
@@ -0,0 +1,107 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlmodel import Field, SQLModel
+
+from src.modeltranslation.translator import TranslationOptions, Translator
+
+UNTRANSLATED_COLUMNS = (
+    "id",
+    "author",
+    "isbn",
+    "publisher",
+    "year",
+    "pages",
+    "price",
+    "currency",
+    "format",
+    "edition",
+    "series",
+    "volume",
+    "genre",
+    "audience",
+    "rating",
+    "reviews",
+    "stock",
+    "warehouse",
+    "shelf",
+)
+
+
+def make_wide_book_cls() -> type[SQLModel]:
+    """Return a model with 20 columns, `title` is the only one that gets translated."""
+
+    class WideBook(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+        author: str = "J.R.R. Tolkien"
+        isbn: str = "978-0-261-10221-7"
+        publisher: str = "Allen & Unwin"
+        year: int = 1937
+        pages: int = 310
+        price: float = 9.99
+        currency: str = "EUR"
+        format: str = "paperback"
+        edition: int = 1
+        series: str = "Middle-earth"
+        volume: int = 1
+        genre: str = "fantasy"
+        audience: str = "children"
+        rating: float = 4.8
+        reviews: int = 1000
+        stock: int = 12
+        warehouse: str = "A"
+        shelf: str = "7"
+
+    return WideBook
+
+
+def make_wide_book(*, translated: bool) -> SQLModel:
+    book_cls = make_wide_book_cls()
+
+    if translated:
+        translator = Translator(default_language="en", languages=("en", "pl"))
+
+        @translator.register(book_cls)
+        class WideBookTranslationOptions(TranslationOptions):
+            fields = ("title",)
+
+    return book_cls(id=1, title="The Hobbit")
+
+
+def read_untranslated_columns(book: SQLModel) -> None:
+    for name in UNTRANSLATED_COLUMNS:
+        getattr(book, name)
+
+
+@pytest.mark.benchmark(group="untranslated-attribute-read")
+@pytest.mark.parametrize("translated", [False, True], ids=["plain", "registered"])
+def test_untranslated_attribute_read(benchmark: BenchmarkFixture, *, translated: bool) -> None:
+    book = make_wide_book(translated=translated)
+
+    benchmark(read_untranslated_columns, book)
+
+
+@pytest.mark.benchmark(group="translated-attribute-read")
+def test_translated_attribute_read(benchmark: BenchmarkFixture) -> None:
+    book = make_wide_book(translated=True)
+
+    assert benchmark(getattr, book, "title") == "The Hobbit"
+
+
+@pytest.mark.benchmark(group="translated-attribute-fallback-read")
+def test_translated_attribute_fallback_read(benchmark: BenchmarkFixture) -> None:
+    book_cls = make_wide_book_cls()
+    translator = Translator(
+        default_language="en",
+        languages=("en", "pl", "de", "fr"),
+        fallback_languages={"pl": ("de", "fr"), "default": ("en",)},
+    )
+
+    @translator.register(book_cls)
+    class WideBookTranslationOptions(TranslationOptions):
+        fields = ("title",)
+
+    book = book_cls(id=1, title_en="The Hobbit")
+    translator.set_active_language("pl")
+
+    assert benchmark(getattr, book, "title") == "The Hobbit"
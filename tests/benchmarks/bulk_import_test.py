@@ -0,0 +1,52 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlalchemy.engine import Engine
+from sqlmodel import Field, Session, SQLModel
+
+from src.modeltranslation.translator import TranslationOptions, Translator
+
+LANGUAGES = ("en", "pl", "de", "fr")
+ROWS = 1000
+
+
+@pytest.mark.benchmark(group="import-translations")
+@pytest.mark.parametrize("mode", ["orm", "bulk-update", "bulk-upsert"])
+def test_import_translations(benchmark: BenchmarkFixture, engine: Engine, mode: str) -> None:
+    class Book(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+
+    translator = Translator(default_language="en", languages=LANGUAGES)
+
+    @translator.register(Book)
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title",)
+
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(Book.__table__.insert(), [{"id": i} for i in range(ROWS)])
+
+    def records() -> list[dict]:
+        return [
+            {"pk": i, "field": "title", "language": lang, "value": f"{lang} title {i}"}
+            for i in range(ROWS)
+            for lang in LANGUAGES
+        ]
+
+    def import_orm() -> None:
+        with Session(engine) as session:
+            for i in range(ROWS):
+                book = session.get(Book, i)
+                for lang in LANGUAGES:
+                    setattr(book, f"title_{lang}", f"{lang} title {i}")
+            session.commit()
+
+    def import_bulk() -> None:
+        with Session(engine) as session:
+            translator.bulk_import(session, Book, records(), upsert=mode == "bulk-upsert")
+            session.commit()
+
+    benchmark(import_orm if mode == "orm" else import_bulk)
+
+    with Session(engine) as session:
+        assert session.get(Book, ROWS - 1).title_fr == f"fr title {ROWS - 1}"
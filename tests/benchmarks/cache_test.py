@@ -0,0 +1,56 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlalchemy.engine import Engine
+from sqlmodel import Field, Session, SQLModel
+
+from src.modeltranslation.cache import MemoryCache
+from src.modeltranslation.translator import TranslationOptions, Translator
+
+LANGUAGES = ("en", "pl", "de", "fr", "es")
+ROWS = 2000
+
+
+@pytest.mark.benchmark(group="resolve-2k-pks")
+@pytest.mark.parametrize("mode", ["uncached", "cached"])
+def test_resolve_pks(benchmark: BenchmarkFixture, engine: Engine, mode: str) -> None:
+    """Resolve 2000 books by primary key in 5 languages, repeatedly, as a read-heavy endpoint would."""
+
+    class Book(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+        description: str
+
+    translator = Translator(default_language="en", languages=LANGUAGES, cache=MemoryCache())
+
+    @translator.register(Book)
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title", "description")
+
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            Book.__table__.insert(),
+            [
+                {
+                    "id": i,
+                    **{f"title_{language}": f"{language} title {i}" for language in LANGUAGES},
+                    # every other description falls back to english
+                    **{
+                        f"description_{language}": f"{language} description {i}"
+                        for language in LANGUAGES
+                        if i % 2 or language == "en"
+                    },
+                }
+                for i in range(ROWS)
+            ],
+        )
+
+    pks = list(range(ROWS))
+
+    def resolve() -> int:
+        if mode == "uncached":
+            translator.invalidate(Book)
+        with Session(engine) as session:
+            return sum(len(translator.resolve_pks(session, Book, pks, language)) for language in LANGUAGES)
+
+    assert benchmark(resolve) == ROWS * len(LANGUAGES)
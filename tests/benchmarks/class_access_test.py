@@ -0,0 +1,49 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlmodel import Field, SQLModel
+
+from src.modeltranslation.translator import TranslationOptions, Translator
+
+
+def register_models(translator: Translator, count: int) -> list[type[SQLModel]]:
+    """Create and register `count` independent translated models."""
+    models = []
+    for i in range(count):
+        model = type(
+            f"Model{i}",
+            (SQLModel,),
+            {
+                "__annotations__": {"id": int | None, "title": str},
+                "id": Field(default=None, primary_key=True),
+            },
+            table=True,
+        )
+        options = type(f"Model{i}TranslationOptions", (TranslationOptions,), {"fields": ("title",)})
+        translator.register(model)(options)
+        models.append(model)
+    return models
+
+
+@pytest.fixture(params=[1, 10, 100], ids=lambda count: f"{count}-models")
+def registered_models(request: pytest.FixtureRequest) -> list[type[SQLModel]]:
+    translator = Translator(default_language="en", languages=("en", "pl"))
+    return register_models(translator, request.param)
+
+
+@pytest.mark.benchmark(group="class-attribute-untranslated")
+@pytest.mark.usefixtures("registered_models")
+def test_untranslated_class_attribute(benchmark: BenchmarkFixture) -> None:
+    class Author(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+
+    assert benchmark(getattr, Author, "id").key == "id"
+
+
+@pytest.mark.benchmark(group="class-attribute-translated")
+def test_translated_class_attribute(
+    benchmark: BenchmarkFixture, registered_models: list[type[SQLModel]]
+) -> None:
+    model = registered_models[0]
+
+    assert benchmark(getattr, model, "title").key == "title_en"
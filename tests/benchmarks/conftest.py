@@ -0,0 +1,23 @@
+import pytest
+
+# the dimensions the translation hot paths are measured over, every benchmark requesting
+# the fixtures below runs for each combination
+LANGUAGE_COUNTS = (2, 8, 32)
+FIELD_COUNTS = (1, 4, 16)
+FALLBACK_DENSITIES = (0.0, 0.5, 1.0)
+
+
+@pytest.fixture(params=LANGUAGE_COUNTS, ids=lambda count: f"{count}-languages")
+def language_count(request: pytest.FixtureRequest) -> int:
+    return request.param
+
+
+@pytest.fixture(params=FIELD_COUNTS, ids=lambda count: f"{count}-fields")
+def field_count(request: pytest.FixtureRequest) -> int:
+    return request.param
+
+
+@pytest.fixture(params=FALLBACK_DENSITIES, ids=lambda density: f"{density:.0%}-fallbacks")
+def fallback_density(request: pytest.FixtureRequest) -> float:
+    """Share of the translated values that are missing in the active language."""
+    return request.param
@@ -0,0 +1,61 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlalchemy.engine import Engine
+from sqlmodel import Field, Session, SQLModel, select
+
+from src.modeltranslation.translator import TranslationOptions, Translator
+
+LANGUAGES = ("en", "pl", "de")
+ROWS = 20000
+
+
+@pytest.mark.benchmark(group="coverage-report")
+@pytest.mark.parametrize("mode", ["python", "sql"])
+def test_coverage_report(benchmark: BenchmarkFixture, engine: Engine, mode: str) -> None:
+    """Count the translated titles and descriptions of 20000 books in every language."""
+
+    class Book(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+        description: str
+
+    translator = Translator(default_language="en", languages=LANGUAGES)
+
+    @translator.register(Book)
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title", "description")
+        fallback_languages = {"default": ("en",), "de": ("pl", "en")}
+
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            Book.__table__.insert(),
+            [
+                {
+                    "id": i,
+                    "title_en": f"title {i}",
+                    "title_pl": f"tytuł {i}" if i % 2 else None,
+                    "title_de": f"Titel {i}" if i % 5 == 0 else None,
+                    "description_en": f"description {i}",
+                }
+                for i in range(ROWS)
+            ],
+        )
+
+    def count_in_python() -> int:
+        # the report without it, loading every book to count its translations
+        with Session(engine) as session:
+            books = session.exec(select(Book)).all()
+            return sum(
+                getattr(book, f"{field}_{language}") is not None
+                for book in books
+                for field in ("title", "description")
+                for language in LANGUAGES
+            )
+
+    def count_in_sql() -> int:
+        # a single connection, the in-memory database is shared by the static pool
+        return sum(entry.translated for entry in translator.coverage_report(engine, max_workers=1))
+
+    translated = benchmark(count_in_python if mode == "python" else count_in_sql)
+    assert translated == ROWS * 2 + ROWS // 2 + ROWS // 5
@@ -0,0 +1,75 @@
+from sqlalchemy.engine import Engine
+from sqlmodel import Field, Session, SQLModel, select
+
+from src.modeltranslation.translator import TranslationOptions, Translator
+
+ROWS = 200
+
+
+def make_languages(count: int) -> tuple[str, ...]:
+    return tuple(f"l{i}" for i in range(count))
+
+
+def make_field_names(count: int) -> tuple[str, ...]:
+    return tuple(f"field{i}" for i in range(count))
+
+
+def make_model(field_count: int, name: str = "Book") -> type[SQLModel]:
+    """Return a table model with an id and `field_count` string fields."""
+    fields = make_field_names(field_count)
+    return type(
+        name,
+        (SQLModel,),
+        {
+            "__annotations__": {"id": int | None, **dict.fromkeys(fields, str)},
+            "id": Field(default=None, primary_key=True),
+        },
+        table=True,
+    )
+
+
+def register(translator: Translator, model: type[SQLModel], field_count: int) -> None:
+    options = type(
+        f"{model.__name__}TranslationOptions",
+        (TranslationOptions,),
+        {"fields": make_field_names(field_count)},
+    )
+    translator.register(model)(options)
+
+
+def make_translated_model(
+    language_count: int, field_count: int, *, collect_stats: bool = False
+) -> tuple[Translator, type[SQLModel]]:
+    """Return a registered model with `field_count` translated fields in `language_count` languages.
+
+    The default language is the first one, the active language is the last one
+    and falls back to the default language.
+    """
+    languages = make_languages(language_count)
+    translator = Translator(default_language=languages[0], languages=languages, collect_stats=collect_stats)
+    model = make_model(field_count)
+    register(translator, model, field_count)
+    translator.set_active_language(languages[-1])
+    return translator, model
+
+
+def make_instances(
+    engine: Engine, translator: Translator, model: type[SQLModel], field_count: int, fallback_density: float
+) -> list[SQLModel]:
+    """Store and load `ROWS` instances, with `fallback_density` of the active language values missing."""
+    default_language, active_language = translator.get_default_language(), translator.get_active_language()
+    missing = round(ROWS * fallback_density)
+
+    rows = []
+    for i in range(ROWS):
+        row = {"id": i}
+        for field in make_field_names(field_count):
+            row[f"{field}_{default_language}"] = f"{field} {i}"
+            row[f"{field}_{active_language}"] = None if i < missing else f"{field} {i} translated"
+        rows.append(row)
+
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(model.__table__.insert(), rows)  # pyright: ignore[reportAttributeAccessIssue]
+    with Session(engine) as session:
+        return list(session.exec(select(model)).all())
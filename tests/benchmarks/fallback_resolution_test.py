@@ -0,0 +1,54 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlalchemy.engine import Engine
+
+from .factories import ROWS, make_field_names, make_instances, make_translated_model
+
+
+@pytest.mark.benchmark(group="resolve-translated-fields")
+def test_read_translated_fields(
+    benchmark: BenchmarkFixture,
+    engine: Engine,
+    language_count: int,
+    field_count: int,
+    fallback_density: float,
+) -> None:
+    translator, model = make_translated_model(language_count, field_count)
+    instances = make_instances(engine, translator, model, field_count, fallback_density)
+    fields = make_field_names(field_count)
+
+    def read() -> list[list[str]]:
+        return [[getattr(instance, field) for field in fields] for instance in instances]
+
+    assert len(benchmark(read)) == ROWS
+
+
+@pytest.mark.benchmark(group="resolve-translated-fields-batch")
+def test_resolve_many(
+    benchmark: BenchmarkFixture,
+    engine: Engine,
+    language_count: int,
+    field_count: int,
+    fallback_density: float,
+) -> None:
+    translator, model = make_translated_model(language_count, field_count)
+    instances = make_instances(engine, translator, model, field_count, fallback_density)
+
+    assert len(benchmark(translator.resolve_many, instances, as_tuples=True)) == ROWS
+
+
+@pytest.mark.benchmark(group="resolve-translated-fields-stats")
+@pytest.mark.parametrize("collect_stats", [False, True], ids=["stats-off", "stats-on"])
+def test_read_translated_fields_stats(
+    benchmark: BenchmarkFixture,
+    engine: Engine,
+    collect_stats: bool,  # noqa: FBT001
+) -> None:
+    translator, model = make_translated_model(8, 4, collect_stats=collect_stats)
+    instances = make_instances(engine, translator, model, 4, 0.5)
+    fields = make_field_names(4)
+
+    def read() -> list[list[str]]:
+        return [[getattr(instance, field) for field in fields] for instance in instances]
+
+    assert len(benchmark(read)) == ROWS
@@ -0,0 +1,38 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+ROOT = Path(__file__).parents[2]
+
+# frameworks of the web integrations, only imported when an integration is used
+WEB_FRAMEWORKS = ("fastapi", "starlette")
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Return the cumulative import time in microseconds of each module imported by `module`."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.benchmark(group="import-package")
+def test_import_package(benchmark: BenchmarkFixture) -> None:
+    times = benchmark.pedantic(import_times, args=("src.modeltranslation",), rounds=5)
+
+    assert "src.modeltranslation.translator" in times
+    assert not [name for name in times if name.split(".")[0] in WEB_FRAMEWORKS]
@@ -0,0 +1,141 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlalchemy.engine import Engine
+from sqlmodel import Field, Session, SQLModel, select
+
+from src.modeltranslation.translator import TranslationOptions, Translator
+
+LANGUAGES = ("en", "pl", "de", "fr", "es", "it", "pt", "nl", "sv", "cs", "uk", "ja")
+ROWS = 1000
+
+
+@pytest.mark.benchmark(group="load-rows-12-languages")
+@pytest.mark.parametrize("mode", ["all-languages", "defer-option", "defer-policy"])
+def test_load_rows(benchmark: BenchmarkFixture, engine: Engine, mode: str) -> None:
+    class Book(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+        description: str
+
+    translator = Translator(default_language="en", languages=LANGUAGES)
+
+    @translator.register(Book)
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title", "description")
+        defer_unused_languages = mode == "defer-policy"
+
+    SQLModel.metadata.create_all(engine)
+
+    rows = []
+    for i in range(ROWS):
+        row = {"id": i}
+        for lang in LANGUAGES:
+            row[f"title_{lang}"] = f"{lang} title {i}"
+            row[f"description_{lang}"] = f"{lang} description {i}" * 10
+        rows.append(row)
+    with engine.begin() as connection:
+        connection.execute(Book.__table__.insert(), rows)
+
+    translator.set_active_language("pl")
+    statement = select(Book)
+    if mode == "defer-option":
+        statement = statement.options(translator.defer_unused_languages(Book))
+
+    def load() -> list[str]:
+        with Session(engine) as session:
+            return [book.title for book in session.exec(statement).all()]
+
+    assert len(benchmark(load)) == ROWS
+
+
+@pytest.mark.benchmark(group="load-rows-40-languages-sparse")
+@pytest.mark.parametrize("storage", ["columns", "table", "json", "partitioned"])
+def test_load_rows_storage(benchmark: BenchmarkFixture, engine: Engine, storage: str) -> None:
+    """Load 1000 rows translated in 40 languages, of which each row has 3.
+
+    Partitioned translations load the partitions of the fallback chain only, all on one database here.
+    """
+    languages = tuple(f"l{i}" for i in range(40))
+
+    class Book(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+        description: str
+
+    translator = Translator(default_language="l0", languages=languages)
+
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title", "description")
+
+    BookTranslationOptions.storage = "table" if storage == "partitioned" else storage
+    BookTranslationOptions.partitioned = storage == "partitioned"
+    translator.register(Book)(BookTranslationOptions)
+
+    SQLModel.metadata.create_all(engine)
+    translator.create_partitions(dict.fromkeys(languages, engine))
+    partition_tables = {
+        model.__tablename__: model.__table__
+        for model in translator.partition_binds(dict.fromkeys(languages, engine))
+    }
+    translated = {i: languages[:1] + languages[1 + i % 13 :][:2] for i in range(ROWS)}
+    with engine.begin() as connection:
+        if storage == "columns":
+            rows = []
+            for i in range(ROWS):
+                row = dict.fromkeys(
+                    f"{field}_{lang}" for field in ("title", "description") for lang in languages
+                )
+                row["id"] = i
+                for lang in translated[i]:
+                    row[f"title_{lang}"] = f"{lang} title {i}"
+                    row[f"description_{lang}"] = f"{lang} description {i}"
+                rows.append(row)
+            connection.execute(Book.__table__.insert(), rows)
+        elif storage == "json":
+            connection.execute(
+                Book.__table__.insert(),
+                [
+                    {
+                        "id": i,
+                        "title_i18n": {lang: f"{lang} title {i}" for lang in translated[i]},
+                        "description_i18n": {lang: f"{lang} description {i}" for lang in translated[i]},
+                    }
+                    for i in range(ROWS)
+                ],
+            )
+        elif storage == "partitioned":
+            connection.execute(Book.__table__.insert(), [{"id": i} for i in range(ROWS)])
+            for lang in languages:
+                partition_rows = [
+                    {"parent_id": i, "title": f"{lang} title {i}", "description": f"{lang} description {i}"}
+                    for i, langs in translated.items()
+                    if lang in langs
+                ]
+                if partition_rows:
+                    connection.execute(partition_tables[f"book_translation_{lang}"].insert(), partition_rows)
+        else:
+            connection.execute(Book.__table__.insert(), [{"id": i} for i in range(ROWS)])
+            connection.execute(
+                SQLModel.metadata.tables["book_translation"].insert(),
+                [
+                    {
+                        "parent_id": i,
+                        "language": lang,
+                        "title": f"{lang} title {i}",
+                        "description": f"{lang} description {i}",
+                    }
+                    for i, langs in translated.items()
+                    for lang in langs
+                ],
+            )
+
+    translator.set_active_language("l5")
+    statement = select(Book)
+    if storage == "partitioned":
+        statement = statement.options(translator.defer_unused_languages(Book))
+
+    def load() -> list[str]:
+        with Session(engine) as session:
+            return [book.title for book in session.exec(statement).all()]
+
+    assert len(benchmark(load)) == ROWS
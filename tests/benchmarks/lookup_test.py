@@ -0,0 +1,48 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlalchemy.engine import Engine
+from sqlmodel import Field, Session, SQLModel, select
+
+from src.modeltranslation.translator import TranslationOptions, Translator
+
+LANGUAGES = ("en", "pl", "de")
+ROWS = 20000
+
+
+@pytest.mark.benchmark(group="lookup-translated-field")
+@pytest.mark.parametrize("mode", ["no-index", "column-index", "fallback-index"])
+def test_lookup_translated_field(benchmark: BenchmarkFixture, engine: Engine, mode: str) -> None:
+    """Find a row by its title with `sql_fallbacks` in a table of 20000 rows, half of them untranslated."""
+
+    class Book(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+
+    translator = Translator(default_language="en", languages=LANGUAGES)
+
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title",)
+        sql_fallbacks = True
+
+    BookTranslationOptions.indexed_fields = () if mode == "no-index" else ("title",)
+    BookTranslationOptions.fallback_indexes = mode == "fallback-index"
+    translator.register(Book)(BookTranslationOptions)
+
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            Book.__table__.insert(),
+            [
+                {"id": i, "title_en": f"en {i}", "title_pl": f"pl {i}" if i % 2 else None}
+                for i in range(ROWS)
+            ],
+        )
+
+    translator.set_active_language("pl")
+    statement = select(Book.id).where(Book.title == f"en {ROWS - 2}")
+
+    def lookup() -> list[int]:
+        with Session(engine) as session:
+            return session.exec(statement).all()
+
+    assert benchmark(lookup) == [ROWS - 2]
@@ -0,0 +1,76 @@
+import asyncio
+from collections.abc import Callable, Generator
+from typing import Any
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request, Response
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from src.modeltranslation.fastapi_middleware import LanguageNegotiator, apply_translation
+from src.modeltranslation.translator import Translator
+
+REQUESTS_PER_ROUND = 100
+
+
+def apply_base_http_translation(app: FastAPI, translator: Translator) -> None:
+    """Apply translation like the previous `apply_translation`, with `@app.middleware("http")`."""
+
+    @app.middleware("http")
+    async def set_locale_context(request: Request, call_next: Callable) -> Response:
+        header = request.headers.get("accept-language")
+        locale = header.split(",") if header else None
+        if locale:
+            for entry in locale:
+                lang = entry.split(";")
+                if lang[0] in translator.get_languages():
+                    translator.set_active_language(str(lang[0]))
+                    break
+        return await call_next(request)
+
+
+@pytest.fixture
+def loop() -> Generator[asyncio.AbstractEventLoop, Any, None]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.mark.benchmark(group="middleware-throughput")
+@pytest.mark.parametrize(
+    "apply",
+    [apply_base_http_translation, apply_translation],
+    ids=["base-http-middleware", "asgi-middleware"],
+)
+def test_middleware_throughput(
+    benchmark: BenchmarkFixture, loop: asyncio.AbstractEventLoop, apply: Callable
+) -> None:
+    translator = Translator(default_language="en", languages=("en", "pl"))
+    app = FastAPI()
+    apply(app, translator)
+
+    @app.get("/language")
+    async def get_language() -> str:
+        return translator.get_active_language()
+
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+    headers = {"accept-language": "fr-FR,pl;q=0.9,en;q=0.8"}
+
+    async def send_requests() -> list[httpx.Response]:
+        return [await client.get("/language", headers=headers) for _ in range(REQUESTS_PER_ROUND)]
+
+    responses = benchmark(lambda: loop.run_until_complete(send_requests()))
+    assert all(response.json() == "pl" for response in responses)
+
+    loop.run_until_complete(client.aclose())
+
+
+@pytest.mark.benchmark(group="accept-language-negotiation")
+@pytest.mark.parametrize("cache_size", [0, 1024], ids=["uncached", "cached"])
+def test_accept_language_negotiation(benchmark: BenchmarkFixture, cache_size: int) -> None:
+    negotiator = LanguageNegotiator(
+        languages=("en", "pl", "de", "fr", "es"), default_language="en", cache_size=cache_size
+    )
+    header = b"it-IT,it;q=0.9,pl-PL;q=0.8,pl;q=0.7,en-US;q=0.6,en;q=0.5"
+
+    assert benchmark(negotiator, header) == "pl"
@@ -0,0 +1,45 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlalchemy.orm import clear_mappers
+from sqlmodel import SQLModel
+
+from src.modeltranslation.translator import TranslationOptions, Translator
+
+from .factories import make_field_names, make_languages, make_model, register
+
+
+@pytest.mark.benchmark(group="register-model")
+def test_register(benchmark: BenchmarkFixture, language_count: int, field_count: int) -> None:
+    languages = make_languages(language_count)
+
+    def setup() -> tuple[tuple[Translator, type[SQLModel], int], dict]:
+        # every round registers a new model, as registering changes it
+        clear_mappers()
+        SQLModel.metadata.clear()
+        translator = Translator(default_language=languages[0], languages=languages)
+        return (translator, make_model(field_count), field_count), {}
+
+    benchmark.pedantic(register, setup=setup, rounds=10)
+
+
+@pytest.mark.benchmark(group="register-models")
+@pytest.mark.parametrize("mode", ["register", "register-many"])
+def test_register_models(benchmark: BenchmarkFixture, mode: str) -> None:
+    """Startup of an application with 50 models of 4 translated fields in 10 languages."""
+    languages = make_languages(10)
+    options = type("TranslationOptions", (TranslationOptions,), {"fields": make_field_names(4)})
+
+    def setup() -> tuple[tuple[Translator, list[type[SQLModel]]], dict]:
+        clear_mappers()
+        SQLModel.metadata.clear()
+        translator = Translator(default_language=languages[0], languages=languages)
+        return (translator, [make_model(4, name=f"Model{i}") for i in range(50)]), {}
+
+    def register_models(translator: Translator, models: list[type[SQLModel]]) -> None:
+        if mode == "register-many":
+            translator.register_many(dict.fromkeys(models, options))
+        else:
+            for model in models:
+                translator.register(model)(options)
+
+    benchmark.pedantic(register_models, setup=setup, rounds=5)
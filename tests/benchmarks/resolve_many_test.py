@@ -0,0 +1,55 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlalchemy.engine import Engine
+from sqlmodel import Field, Session, SQLModel, select
+
+from src.modeltranslation.translator import TranslationOptions, Translator
+
+ROWS = 5000
+
+
+@pytest.mark.benchmark(group="resolve-5k-rows")
+@pytest.mark.parametrize("mode", ["getattr", "resolve-many-dicts", "resolve-many-tuples"])
+def test_resolve_rows(benchmark: BenchmarkFixture, engine: Engine, mode: str) -> None:
+    class Book(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+        description: str
+
+    translator = Translator(
+        default_language="en",
+        languages=("en", "pl", "de"),
+        fallback_languages={"pl": ("de",), "default": ("en",)},
+    )
+
+    @translator.register(Book)
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title", "description")
+
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            Book.__table__.insert(),
+            [
+                {
+                    "id": i,
+                    "title_en": f"title {i}",
+                    # every tenth title falls back to english
+                    "title_pl": None if i % 10 == 0 else f"tytuł {i}",
+                    "description_en": f"description {i}",
+                }
+                for i in range(ROWS)
+            ],
+        )
+
+    translator.set_active_language("pl")
+    with Session(engine) as session:
+        books = session.exec(select(Book)).all()
+
+    fields = ("id", "title", "description")
+    if mode == "getattr":
+        result = benchmark(lambda: [{field: getattr(book, field) for field in fields} for book in books])
+    else:
+        result = benchmark(translator.resolve_many, books, fields, as_tuples=mode == "resolve-many-tuples")
+
+    assert len(result) == ROWS
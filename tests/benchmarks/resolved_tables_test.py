@@ -0,0 +1,63 @@
+from typing import Any
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlalchemy.engine import Engine
+from sqlmodel import Field, Session, SQLModel, select
+
+from src.modeltranslation.translator import TranslationOptions, Translator
+
+LANGUAGES = ("en", "pl", "de")
+ROWS = 20000
+
+
+@pytest.mark.benchmark(group="catalog-page")
+@pytest.mark.parametrize("mode", ["sql-fallbacks", "resolved-table"])
+def test_catalog_page(benchmark: BenchmarkFixture, engine: Engine, mode: str) -> None:
+    """Read a page of 50 books ordered by title in a table of 20000 rows, half of them untranslated."""
+
+    class Book(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str = Field(index=True)
+        description: str
+
+    translator = Translator(default_language="en", languages=LANGUAGES)
+
+    @translator.register(Book)
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title", "description")
+        fallback_languages = {"default": ("en",), "de": ("pl", "en")}
+        fallback_values = "No translation"
+        sql_fallbacks = True
+        resolved_tables = True
+
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            Book.__table__.insert(),
+            [
+                {
+                    "id": i,
+                    "title_en": f"title {i:05}",
+                    "title_pl": f"tytuł {i:05}" if i % 2 else None,
+                    "description_en": f"description {i}",
+                }
+                for i in range(ROWS)
+            ],
+        )
+        translator.rebuild_resolved_tables(connection, Book)
+
+    if mode == "sql-fallbacks":
+        statement = select(Book.id, Book.title, Book.description)
+        statement = statement.order_by(translator.fallback_expression(Book, "title", "de"))
+    else:
+        books = translator.resolved_table(Book, "de")
+        statement = select(books).order_by(books.c.title)
+    statement = statement.offset(5000).limit(50)
+
+    def read_page() -> list[Any]:
+        translator.set_active_language("de")
+        with Session(engine) as session:
+            return session.exec(statement).all()
+
+    assert len(benchmark(read_page)) == 50
@@ -0,0 +1,55 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlalchemy.engine import Engine
+from sqlmodel import Field, Session, SQLModel, or_, select
+
+from src.modeltranslation.translator import TranslationOptions, Translator
+
+LANGUAGES = ("en", "pl", "de")
+ROWS = 20000
+
+
+@pytest.mark.benchmark(group="search-translated-text")
+@pytest.mark.parametrize("mode", ["like", "fts5"])
+def test_search_translated_text(benchmark: BenchmarkFixture, engine: Engine, mode: str) -> None:
+    """Find the rows with a word in any fallback language of 20000 rows, half of them untranslated."""
+
+    class Book(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+
+    translator = Translator(default_language="en", languages=LANGUAGES)
+
+    @translator.register(Book)
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title",)
+        search_fields = ("title",)
+
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            Book.__table__.insert(),
+            [
+                {
+                    "id": i,
+                    "title_en": f"english title {i}",
+                    "title_pl": f"polski tytuł {i}" if i % 2 else None,
+                }
+                for i in range(ROWS)
+            ],
+        )
+    with Session(engine) as session:
+        translator.rebuild_search_index(session, Book)
+        session.commit()
+
+    translator.set_active_language("pl")
+    word = f"{ROWS - 2}"
+    statement = select(Book.id).where(or_(Book.title_pl.like(f"%{word}%"), Book.title_en.like(f"%{word}%")))
+
+    def search() -> list[int]:
+        with Session(engine) as session:
+            if mode == "like":
+                return list(session.exec(statement).all())
+            return translator.search(session, Book, word)
+
+    assert benchmark(search) == [ROWS - 2]
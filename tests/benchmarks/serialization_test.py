@@ -0,0 +1,85 @@
+import json
+
+import pytest
+from pydantic import TypeAdapter
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlalchemy.engine import Engine
+from sqlmodel import Field, Session, SQLModel, select
+
+from src.modeltranslation.translator import TranslationOptions, Translator
+
+from .factories import make_instances, make_translated_model
+
+ROWS = 10_000
+
+
+@pytest.fixture
+def books(engine: Engine) -> list[SQLModel]:
+    class Book(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+        description: str
+        author: str
+        year: int
+
+    translator = Translator(default_language="en", languages=("en", "pl", "de", "fr"))
+
+    @translator.register(Book)
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title", "description")
+
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            Book.__table__.insert(),
+            [
+                {
+                    "id": i,
+                    "title_en": f"title {i}",
+                    "title_pl": f"tytuł {i}",
+                    "description_en": f"description {i}",
+                    "author": "J.R.R. Tolkien",
+                    "year": 1937,
+                }
+                for i in range(ROWS)
+            ],
+        )
+
+    translator.set_active_language("pl")
+    with Session(engine) as session:
+        return list(session.exec(select(Book)).all())
+
+
+@pytest.mark.benchmark(group="serialize-10k-rows")
+def test_model_dump_json(benchmark: BenchmarkFixture, books: list[SQLModel]) -> None:
+    result = benchmark(lambda: [book.model_dump_json() for book in books])
+
+    assert json.loads(result[0]) == {
+        "id": 0,
+        "title": "tytuł 0",
+        "description": "description 0",
+        "author": "J.R.R. Tolkien",
+        "year": 1937,
+    }
+
+
+@pytest.mark.benchmark(group="serialize-10k-rows")
+def test_dump_json_list(benchmark: BenchmarkFixture, books: list[SQLModel]) -> None:
+    adapter = TypeAdapter(list[type(books[0])])
+
+    assert len(benchmark(adapter.dump_json, books)) > 0
+
+
+@pytest.mark.benchmark(group="serialize-translated-fields")
+def test_dump_json_matrix(
+    benchmark: BenchmarkFixture,
+    engine: Engine,
+    language_count: int,
+    field_count: int,
+    fallback_density: float,
+) -> None:
+    translator, model = make_translated_model(language_count, field_count)
+    instances = make_instances(engine, translator, model, field_count, fallback_density)
+    adapter = TypeAdapter(list[model])
+
+    assert len(json.loads(benchmark(adapter.dump_json, instances))) == len(instances)
@@ -0,0 +1,215 @@
+import json
+from collections.abc import Callable, Iterator
+from datetime import date
+from pathlib import Path
+
+import pytest
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel, select
+
+from src.modeltranslation.bulk import TranslationRecord, read_csv, read_json_lines
+from src.modeltranslation.exceptions import ImproperlyConfiguredError
+from src.modeltranslation.translator import Translator
+
+
+@pytest.fixture
+def translator() -> Translator:
+    return Translator(default_language="en", languages=("en", "pl"))
+
+
+def test_bulk_import_updates_translation_columns(
+    engine: Engine, translator: Translator, register_book: Callable[..., type[SQLModel]]
+) -> None:
+    book_cls = register_book(fields=("title", "author"))
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add_all([book_cls(id=pk, title_en=f"Book {pk}") for pk in range(1, 6)])
+        session.commit()
+
+    def records() -> Iterator[TranslationRecord]:
+        for pk in range(1, 6):
+            yield {"pk": pk, "field": "title", "language": "pl", "value": f"Książka {pk}"}
+        yield {"pk": 1, "field": "author", "language": "en", "value": "J.R.R. Tolkien"}
+        # the last record for a column wins
+        yield {"pk": 2, "field": "title", "language": "pl", "value": "Hobbit"}
+
+    with Session(engine) as session:
+        result = translator.bulk_import(session, book_cls, records(), batch_size=2)
+        session.commit()
+
+    assert result.rows == 7
+    assert result.rows_per_second > 0
+
+    with Session(engine) as session:
+        books = session.exec(select(book_cls).order_by(book_cls.id)).all()
+
+        assert [book.title_en for book in books] == [f"Book {pk}" for pk in range(1, 6)]
+        assert [book.title_pl for book in books] == [
+            "Książka 1",
+            "Hobbit",
+            "Książka 3",
+            "Książka 4",
+            "Książka 5",
+        ]
+        assert books[0].author_en == "J.R.R. Tolkien"
+
+
+def test_bulk_import_upsert(
+    engine: Engine, translator: Translator, register_book: Callable[..., type[SQLModel]]
+) -> None:
+    book_cls = register_book(fields=("title", "author"))
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(book_cls(id=1, title_en="The Hobbit"))
+        session.commit()
+
+    records = [
+        {"pk": 1, "field": "title", "language": "pl", "value": "Hobbit"},
+        {"pk": 2, "field": "title", "language": "en", "value": "1984"},
+        {"pk": 2, "field": "title", "language": "pl", "value": "Rok 1984"},
+    ]
+
+    with engine.begin() as connection:
+        assert translator.bulk_import(connection, book_cls, records, upsert=True).rows == 3
+
+    with Session(engine) as session:
+        books = session.exec(select(book_cls).order_by(book_cls.id)).all()
+
+        assert [(book.id, book.title_en, book.title_pl) for book in books] == [
+            (1, "The Hobbit", "Hobbit"),
+            (2, "1984", "Rok 1984"),
+        ]
+
+
+def test_bulk_import_upsert_with_not_null_columns(
+    engine: Engine, translator: Translator, register_book: Callable[..., type[SQLModel]]
+) -> None:
+    book_cls = register_book(required_languages=("en",))
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(book_cls(id=1, title_en="The Hobbit", author="J.R.R. Tolkien"))
+        session.commit()
+
+    # existing rows are updated, whatever the other columns are
+    with engine.begin() as connection:
+        records = [{"pk": 1, "field": "title", "language": "pl", "value": "Hobbit"}]
+        assert translator.bulk_import(connection, book_cls, records, upsert=True).rows == 1
+
+    # `author` is not translated, a new row can't have a value for it
+    records = [{"pk": 2, "field": "title", "language": "en", "value": "1984"}]
+    with (
+        engine.begin() as connection,
+        pytest.raises(ImproperlyConfiguredError, match="without a value for author"),
+    ):
+        translator.bulk_import(connection, book_cls, records, upsert=True)
+
+    with Session(engine) as session:
+        books = session.exec(select(book_cls)).all()
+        assert [(book.id, book.title_pl) for book in books] == [(1, "Hobbit")]
+
+
+def test_bulk_import_upsert_required_languages(
+    engine: Engine, translator: Translator, register_book: Callable[..., type[SQLModel]]
+) -> None:
+    book_cls = register_book(columns={"title": str}, required_languages=("en",))
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        with pytest.raises(ImproperlyConfiguredError, match="without a value for title_en"):
+            translator.bulk_import(
+                connection,
+                book_cls,
+                [{"pk": 1, "field": "title", "language": "pl", "value": "Hobbit"}],
+                upsert=True,
+            )
+        # a row is inserted with all its values in the batch, whatever the order of the records
+        records = [
+            {"pk": 1, "field": "title", "language": "pl", "value": "Hobbit"},
+            {"pk": 1, "field": "title", "language": "en", "value": "The Hobbit"},
+        ]
+        translator.bulk_import(connection, book_cls, records, upsert=True)
+
+    with Session(engine) as session:
+        book = session.exec(select(book_cls)).one()
+        assert (book.title_en, book.title_pl) == ("The Hobbit", "Hobbit")  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def test_bulk_import_converts_text_values(
+    engine: Engine, translator: Translator, tmp_path: Path, register_book: Callable[..., type[SQLModel]]
+) -> None:
+    book_cls = register_book(
+        columns={"pages": int, "published": date, "in_print": bool},
+        fields=("pages", "published", "in_print"),
+    )
+    SQLModel.metadata.create_all(engine)
+    csv_path = tmp_path / "editions.csv"
+    csv_path.write_text(
+        "pk,field,language,value\n1,pages,pl,320\n1,published,pl,1960-01-01\n1,in_print,pl,false\n",
+        encoding="utf-8",
+    )
+
+    with engine.begin() as connection:
+        translator.bulk_import(connection, book_cls, read_csv(csv_path), upsert=True)
+
+    with Session(engine) as session:
+        book = session.exec(select(book_cls)).one()
+        assert (book.pages_pl, book.published_pl, book.in_print_pl) == (320, date(1960, 1, 1), False)  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def test_bulk_import_from_files(
+    engine: Engine, translator: Translator, tmp_path: Path, register_book: Callable[..., type[SQLModel]]
+) -> None:
+    book_cls = register_book(fields=("title", "author"))
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add_all([book_cls(id=1), book_cls(id=2)])
+        session.commit()
+
+    csv_path = tmp_path / "titles.csv"
+    csv_path.write_text(
+        "pk,field,language,value\n1,title,en,The Hobbit\n2,title,en,1984\n", encoding="utf-8"
+    )
+
+    json_lines_path = tmp_path / "titles.jsonl"
+    json_lines_path.write_text(
+        "\n".join(
+            json.dumps({"pk": pk, "field": "title", "language": "pl", "value": value})
+            for pk, value in ((1, "Hobbit"), (2, "Rok 1984"))
+        ),
+        encoding="utf-8",
+    )
+
+    with Session(engine) as session:
+        translator.bulk_import(session, book_cls, read_csv(csv_path))
+        translator.bulk_import(session, book_cls, read_json_lines(json_lines_path))
+        session.commit()
+
+    with Session(engine) as session:
+        books = session.exec(select(book_cls).order_by(book_cls.id)).all()
+
+        assert [(book.title_en, book.title_pl) for book in books] == [
+            ("The Hobbit", "Hobbit"),
+            ("1984", "Rok 1984"),
+        ]
+
+
+def test_bulk_import_invalid_record(
+    engine: Engine, translator: Translator, register_book: Callable[..., type[SQLModel]]
+) -> None:
+    book_cls = register_book(fields=("title", "author"))
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session, pytest.raises(ValueError, match="'title' in 'de'"):
+        translator.bulk_import(
+            session, book_cls, [{"pk": 1, "field": "title", "language": "de", "value": "Der Hobbit"}]
+        )
+
+
+def test_bulk_import_not_registered(
+    engine: Engine, translator: Translator, book_cls: type[SQLModel]
+) -> None:
+
+    with Session(engine) as session, pytest.raises(ImproperlyConfiguredError):
+        translator.bulk_import(session, book_cls, [])
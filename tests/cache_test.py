@@ -0,0 +1,287 @@
+import gc
+import json
+import weakref
+from collections.abc import Callable, Generator, Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+import pytest
+from sqlalchemy import create_engine, text, update
+from sqlalchemy.engine import Engine
+from sqlmodel import Field, Session, SQLModel
+
+from src.modeltranslation import cache as cache_module
+from src.modeltranslation.cache import CacheKey, MemoryCache, TranslationCache
+from src.modeltranslation.exceptions import ImproperlyConfiguredError
+from src.modeltranslation.translator import TranslationOptions, Translator
+
+
+class JSONCache:
+    """A cache storing serialized values, like a Redis backed one would."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+
+    def get_many(self, keys: Sequence[CacheKey]) -> list[dict[str, Any] | None]:
+        return [json.loads(value) if (value := self.values.get(repr(key))) else None for key in keys]
+
+    def set_many(self, values: Mapping[CacheKey, dict[str, Any]]) -> None:
+        self.values.update((repr(key), json.dumps(value)) for key, value in values.items())
+
+    def delete_many(self, keys: Iterable[CacheKey]) -> None:
+        for key in keys:
+            self.values.pop(repr(key), None)
+
+    def clear(self) -> None:
+        self.values.clear()
+
+
+CACHE_OPTIONS: dict[str, Any] = {"fallback_languages": {"default": ("en",), "de": ("pl", "en")}}
+
+BOOKS = [
+    {"title": {"en": "The Hobbit", "pl": "Hobbit"}, "author": "J.R.R. Tolkien"},
+    {"title": {"en": "Dune"}, "author": "Frank Herbert"},
+]
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> Generator[Engine, Any, None]:
+    # each session has its own connection, reading only what the others committed
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def cache() -> TranslationCache | None:
+    return MemoryCache()
+
+
+@pytest.fixture
+def translator(cache: TranslationCache | None) -> Translator:
+    return Translator(default_language="en", languages=("en", "pl", "de"), cache=cache)
+
+
+def test_memory_cache_lru() -> None:
+    cache = MemoryCache(maxsize=2)
+    cache.set_many({("Book", 1, "en"): {"title": "a"}, ("Book", 2, "en"): {"title": "b"}})
+    # reading a value makes it the most recently used
+    assert cache.get_many([("Book", 1, "en")]) == [{"title": "a"}]
+    cache.set_many({("Book", 3, "en"): {"title": "c"}})
+
+    assert cache.get_many([("Book", 1, "en"), ("Book", 2, "en"), ("Book", 3, "en")]) == [
+        {"title": "a"},
+        None,
+        {"title": "c"},
+    ]
+    cache.delete_many([("Book", 1, "en"), ("Book", 4, "en")])
+    assert len(cache) == 1
+
+
+def test_memory_cache_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 100.0
+    monkeypatch.setattr(cache_module, "monotonic", lambda: now)
+    cache = MemoryCache(ttl=10)
+    cache.set_many({("Book", 1, "en"): {"title": "a"}})
+
+    now = 109.0
+    assert cache.get_many([("Book", 1, "en")]) == [{"title": "a"}]
+    now = 111.0
+    assert cache.get_many([("Book", 1, "en")]) == [None]
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize("cache", [MemoryCache(), JSONCache()], ids=["memory", "json"])
+def test_resolve_pks(
+    engine: Engine,
+    translator: Translator,
+    register_book: Callable[..., type[SQLModel]],
+    seed_books: Callable[..., None],
+    count_queries: Callable[..., list[str]],
+) -> None:
+    book_cls = register_book(**CACHE_OPTIONS)
+    seed_books(book_cls, BOOKS)
+
+    statements = count_queries()
+    with Session(engine) as session:
+        expected = {1: {"title": "Hobbit"}, 2: {"title": "Dune"}}
+        assert translator.resolve_pks(session, book_cls, [1, 2, 3], language="de") == expected
+        assert len(statements) == 1
+        # read from the cache
+        assert translator.resolve_pks(session, book_cls, [1, 2], language="de") == expected
+        assert translator.resolve_pk(session, book_cls, 2, language="de") == {"title": "Dune"}
+        assert len(statements) == 1
+
+        # a missing instance is not cached
+        assert translator.resolve_pk(session, book_cls, 3, language="de") is None
+        translator.set_active_language("fr")
+        assert translator.resolve_pk(session, book_cls, 1) == {"title": "The Hobbit"}
+        assert len(statements) == 3
+
+
+def test_cache_invalidated_on_commit(
+    engine: Engine,
+    translator: Translator,
+    register_book: Callable[..., type[SQLModel]],
+    seed_books: Callable[..., None],
+) -> None:
+    book_cls = register_book(**CACHE_OPTIONS)
+    seed_books(book_cls, BOOKS)
+
+    with Session(engine) as session, Session(engine) as other_session:
+        assert translator.resolve_pk(session, book_cls, 1, language="pl") == {"title": "Hobbit"}
+
+        book = other_session.get(book_cls, 1)
+        translator.set_active_language("pl")
+        book.title = "Hobbit, czyli tam i z powrotem"  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
+        other_session.flush()
+        # not committed yet, other sessions still read the cached value
+        assert translator.resolve_pk(session, book_cls, 1, language="pl") == {"title": "Hobbit"}
+
+        other_session.commit()
+        session.rollback()
+        assert translator.resolve_pk(session, book_cls, 1, language="pl") == {
+            "title": "Hobbit, czyli tam i z powrotem"
+        }
+
+
+def test_cache_invalidated_on_rollback(
+    engine: Engine,
+    translator: Translator,
+    register_book: Callable[..., type[SQLModel]],
+    seed_books: Callable[..., None],
+) -> None:
+    book_cls = register_book(**CACHE_OPTIONS)
+    seed_books(book_cls, BOOKS)
+
+    with Session(engine) as session:
+        book = session.get(book_cls, 2)
+        book.title = "Diuna"  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
+        session.flush()
+        # the session reads its own uncommitted changes
+        assert translator.resolve_pk(session, book_cls, 2, language="en") == {"title": "Diuna"}
+        session.rollback()
+        assert translator.resolve_pk(session, book_cls, 2, language="en") == {"title": "Dune"}
+
+
+@pytest.mark.parametrize("savepoint_end", ["commit", "rollback"])
+def test_cache_invalidated_after_savepoints(
+    engine: Engine,
+    translator: Translator,
+    savepoint_end: str,
+    register_book: Callable[..., type[SQLModel]],
+    seed_books: Callable[..., None],
+) -> None:
+    book_cls = register_book(**CACHE_OPTIONS)
+    seed_books(book_cls, BOOKS)
+
+    with Session(engine) as session, Session(engine) as other_session:
+        hobbit, dune = session.get(book_cls, 1), session.get(book_cls, 2)
+        hobbit.title = "The Hobbit, or There and Back Again"  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
+        session.flush()
+        savepoint = session.begin_nested()
+        dune.title = "Dune Messiah"  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
+        session.flush()
+        getattr(savepoint, savepoint_end)()
+
+        # other sessions cache the committed values until the outermost transaction ends
+        expected = {1: {"title": "The Hobbit"}, 2: {"title": "Dune"}}
+        assert translator.resolve_pks(other_session, book_cls, [1, 2], language="en") == expected
+        session.commit()
+
+    with Session(engine) as session:
+        assert translator.resolve_pks(session, book_cls, [1, 2], language="en") == {
+            1: {"title": "The Hobbit, or There and Back Again"},
+            2: {"title": "Dune Messiah" if savepoint_end == "commit" else "Dune"},
+        }
+
+
+def test_cache_invalidated_by_statements(
+    engine: Engine,
+    translator: Translator,
+    register_book: Callable[..., type[SQLModel]],
+    seed_books: Callable[..., None],
+) -> None:
+    book_cls = register_book(**CACHE_OPTIONS)
+    seed_books(book_cls, BOOKS)
+
+    with Session(engine) as session:
+        assert translator.resolve_pk(session, book_cls, 2, language="en") == {"title": "Dune"}
+        session.execute(update(book_cls).where(book_cls.id == 2).values(title_en="Dune Messiah"))  # pyright: ignore[reportArgumentType]
+        session.commit()
+        assert translator.resolve_pk(session, book_cls, 2, language="en") == {"title": "Dune Messiah"}
+
+        # changes made outside of the session are invalidated explicitly
+        with engine.begin() as connection:
+            connection.execute(update(book_cls).where(book_cls.id == 2).values(title_en="Children of Dune"))  # pyright: ignore[reportArgumentType]
+        translator.invalidate(book_cls, [2])
+        assert translator.resolve_pk(session, book_cls, 2, language="en") == {"title": "Children of Dune"}
+
+
+def test_cache_models_with_the_same_name(
+    engine: Engine,
+    translator: Translator,
+    register_book: Callable[..., type[SQLModel]],
+    seed_books: Callable[..., None],
+) -> None:
+    book_cls = register_book(**CACHE_OPTIONS)
+
+    class Book(SQLModel, table=True):
+        __tablename__ = "archived_book"  # pyright: ignore[reportAssignmentType]
+
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+
+    @translator.register(Book)
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title",)
+
+    seed_books(book_cls, BOOKS)
+    with Session(engine) as session:
+        session.add(Book(id=1, title="The Silmarillion"))
+        session.commit()
+
+        assert translator.resolve_pk(session, book_cls, 1, language="en") == {"title": "The Hobbit"}
+        assert translator.resolve_pk(session, Book, 1, language="en") == {"title": "The Silmarillion"}
+
+
+def test_cache_translation_table(
+    engine: Engine,
+    translator: Translator,
+    register_book: Callable[..., type[SQLModel]],
+    seed_books: Callable[..., None],
+) -> None:
+    book_cls = register_book(**CACHE_OPTIONS, storage="table")
+    seed_books(book_cls, BOOKS)
+
+    with Session(engine) as session:
+        assert translator.resolve_pk(session, book_cls, 2, language="pl") == {"title": "Dune"}
+        book = session.get(book_cls, 2)
+        translator.set_active_language("pl")
+        # only adds a row to the translation table
+        book.title = "Diuna"  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
+        session.commit()
+        assert translator.resolve_pk(session, book_cls, 2, language="pl") == {"title": "Diuna"}
+
+
+def test_cache_listeners_release_the_translator(engine: Engine) -> None:
+    translator = Translator(default_language="en", languages=("en", "pl"), cache=MemoryCache())
+    reference = weakref.ref(translator)
+    del translator
+    gc.collect()
+
+    assert reference() is None
+    # the sessions don't call the collected translator
+    with Session(engine) as session:
+        session.execute(text("SELECT 1"))
+        session.commit()
+
+
+@pytest.mark.parametrize("cache", [None])
+def test_cache_not_configured(
+    engine: Engine, translator: Translator, register_book: Callable[..., type[SQLModel]]
+) -> None:
+    book_cls = register_book(**CACHE_OPTIONS)
+
+    with Session(engine) as session, pytest.raises(ImproperlyConfiguredError):
+        translator.resolve_pk(session, book_cls, 1)
@@ -1,7 +1,8 @@
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Mapping
 from typing import Any
 
 import pytest
+from sqlalchemy import event
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import clear_mappers
 from sqlmodel import Field, Session, SQLModel, create_engine, select
@@ -27,6 +28,29 @@ def engine() -> Generator[Engine, Any, None]:
     engine.dispose()
 
 
+@pytest.fixture
+def count_queries(engine: Engine) -> Generator[Callable[..., list[str]], Any, None]:
+    """Yield a function returning the list the statements executed by an engine are appended to.
+
+    The engine is the `engine` fixture by default. The listeners are removed when the test ends.
+    """
+    listeners: list[tuple[Engine, Callable[..., None]]] = []
+
+    def count(bind: Engine = engine) -> list[str]:
+        statements: list[str] = []
+
+        def record(*args: Any) -> None:  # noqa: ANN401
+            statements.append(args[2])
+
+        event.listen(bind, "before_cursor_execute", record)
+        listeners.append((bind, record))
+        return statements
+
+    yield count
+    for bind, listener in listeners:
+        event.remove(bind, "before_cursor_execute", listener)
+
+
 @pytest.fixture
 def book_cls() -> type[SQLModel]:
     class Book(SQLModel, table=True):
@@ -37,6 +61,73 @@ def book_cls() -> type[SQLModel]:
     return Book
 
 
+def make_model(name: str, columns: Mapping[str, Any]) -> type[SQLModel]:
+    """Return a table model `name` with an integer `id` primary key and `columns`.
+
+    Each column is an annotation, or an `(annotation, Field(...))` pair.
+    """
+    annotations: dict[str, Any] = {"id": int | None}
+    namespace: dict[str, Any] = {"__annotations__": annotations, "id": Field(default=None, primary_key=True)}
+    for column, spec in columns.items():
+        annotation, field = spec if isinstance(spec, tuple) else (spec, None)
+        annotations[column] = annotation
+        if field is not None:
+            namespace[column] = field
+    return type(name, (SQLModel,), namespace, table=True)
+
+
+@pytest.fixture
+def translator() -> Translator:
+    return Translator(default_language="en", languages=("en", "pl", "de"))
+
+
+@pytest.fixture
+def register_book(translator: Translator) -> Callable[..., type[SQLModel]]:
+    """Return a function registering a new `Book` model in `translator`.
+
+    Its keyword arguments are the `TranslationOptions` of the model, `fields = ("title",)` by default,
+    and `columns` those of the model, `title` and `author` by default, see `make_model`.
+    """
+
+    def register(columns: Mapping[str, Any] | None = None, **options: Any) -> type[SQLModel]:  # noqa: ANN401
+        book_cls = make_model("Book", columns or {"title": str, "author": str})
+        options.setdefault("fields", ("title",))
+        translator.register(book_cls)(type("BookTranslationOptions", (TranslationOptions,), options))
+        return book_cls
+
+    return register
+
+
+@pytest.fixture
+def seed_books(engine: Engine, translator: Translator) -> Callable[..., None]:
+    """Return a function creating the tables and adding books, whatever the storage of their translations.
+
+    Each book is a mapping of its values, translated fields map languages to the values written
+    in them, e.g. `{"title": {"en": "The Hobbit", "pl": "Hobbit"}, "author": "J.R.R. Tolkien"}`,
+    and `binds` those of the session, like `Translator.partition_binds`.
+    """
+
+    def seed(
+        book_cls: type[SQLModel], books: list[Mapping[str, Any]], binds: Mapping[Any, Engine] | None = None
+    ) -> None:
+        SQLModel.metadata.create_all(engine)
+        with Session(engine, binds=binds) as session:
+            for values in books:
+                translations = {field: value for field, value in values.items() if isinstance(value, dict)}
+                book = book_cls(
+                    **{field: value for field, value in values.items() if field not in translations}
+                )
+                for field, by_language in translations.items():
+                    for language, value in by_language.items():
+                        token = translator.set_active_language(language)
+                        setattr(book, field, value)
+                        translator.reset_active_language(token)
+                session.add(book)
+            session.commit()
+
+    return seed
+
+
 @pytest.fixture
 def create_db_and_tables(engine: Engine) -> Generator[None, Any, None]:
     SQLModel.metadata.create_all(engine)
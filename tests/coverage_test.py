@@ -0,0 +1,196 @@
+import csv
+import io
+import json
+import sys
+from collections.abc import Callable, Generator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from sqlalchemy import Engine, create_engine
+from sqlmodel import Field, SQLModel
+
+from src.modeltranslation.__main__ import main
+from src.modeltranslation.coverage import CSV_HEADER, FieldCoverage, to_csv, to_json
+from src.modeltranslation.exceptions import ImproperlyConfiguredError
+from src.modeltranslation.translator import TranslationOptions, Translator
+
+MODELS_MODULE = """
+from sqlmodel import Field, SQLModel
+
+from src.modeltranslation.translator import TranslationOptions, Translator
+
+translator = Translator(default_language="en", languages=("en", "pl"))
+
+
+class Book(SQLModel, table=True):
+    id: int | None = Field(default=None, primary_key=True)
+    title: str
+
+
+@translator.register(Book)
+class BookTranslationOptions(TranslationOptions):
+    fields = ("title",)
+"""
+
+
+COVERAGE_OPTIONS: dict[str, Any] = {
+    "columns": {"title": str, "description": str},
+    "fields": ("title", "description"),
+    "fallback_languages": {"default": ("en",), "de": ("pl", "en")},
+    "fallback_undefined": {"description": ""},
+}
+
+BOOKS = [
+    {
+        "title": {"en": "The Hobbit", "pl": "Hobbit", "de": "Der Hobbit"},
+        "description": {"en": "An adventure", "pl": "Przygoda", "de": ""},
+    },
+    {"title": {"en": "The Doll", "pl": "Lalka"}, "description": {"en": "", "pl": "Powieść"}},
+    {"title": {"en": "Dune"}, "description": {"en": "A novel"}},
+    {"title": {"pl": "Solaris"}, "description": {"pl": ""}},
+]
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> Generator[Engine, Any, None]:
+    # the report queries from several threads, each with its own connection
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    yield engine
+    engine.dispose()
+
+
+def by_key(report: list[FieldCoverage]) -> dict[tuple[str, str], FieldCoverage]:
+    return {(entry.field, entry.language): entry for entry in report}
+
+
+@pytest.mark.parametrize("storage", ["columns", "json", "table"])
+def test_coverage_report(
+    engine: Engine,
+    translator: Translator,
+    storage: str,
+    register_book: Callable[..., type[SQLModel]],
+    seed_books: Callable[..., None],
+) -> None:
+    book_cls = register_book(**COVERAGE_OPTIONS, storage=storage)
+    seed_books(book_cls, BOOKS)
+
+    report = translator.coverage_report(engine)
+
+    assert [(entry.field, entry.language) for entry in report] == [
+        ("description", "de"),
+        ("description", "en"),
+        ("description", "pl"),
+        ("title", "de"),
+        ("title", "en"),
+        ("title", "pl"),
+    ]
+    entries = by_key(report)
+    assert entries["title", "en"] == FieldCoverage(
+        model="Book", field="title", language="en", rows=4, translated=3, fallbacks={}, fallback_values=1
+    )
+    assert entries["title", "pl"].fallbacks == {1: 1}
+    # de falls back to pl, then en
+    assert entries["title", "de"] == FieldCoverage(
+        model="Book", field="title", language="de", rows=4, translated=1, fallbacks={1: 2, 2: 1}
+    )
+    # empty descriptions are undefined
+    assert entries["description", "en"].translated == 2
+    assert entries["description", "de"].translated == 0
+    assert entries["description", "de"].fallbacks == {1: 2, 2: 1}
+    assert entries["description", "de"].fallback_values == 1
+    assert entries["title", "de"].coverage == 0.25
+
+
+def test_coverage_report_of_models(
+    engine: Engine,
+    translator: Translator,
+    register_book: Callable[..., type[SQLModel]],
+    seed_books: Callable[..., None],
+) -> None:
+    book_cls = register_book(**COVERAGE_OPTIONS)
+
+    class Author(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+
+    @translator.register(Author)
+    class AuthorTranslationOptions(TranslationOptions):
+        fields = ("name",)
+
+    seed_books(book_cls, BOOKS)
+
+    report = translator.coverage_report(engine, max_workers=2)
+    assert [entry.model for entry in report] == ["Author"] * 3 + ["Book"] * 6
+    # a model without rows is fully covered
+    assert [entry.coverage for entry in report[:3]] == [1.0] * 3
+    assert {entry.model for entry in translator.coverage_report(engine, [book_cls])} == {"Book"}
+
+
+def test_coverage_report_errors(engine: Engine, translator: Translator, book_cls: type[SQLModel]) -> None:
+    with pytest.raises(ImproperlyConfiguredError):
+        translator.coverage_report(engine, [book_cls])
+
+    @translator.register(book_cls)
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title",)
+        storage = "table"
+        partitioned = True
+
+    with pytest.raises(ImproperlyConfiguredError, match="its translations are partitioned"):
+        translator.coverage_report(engine)
+
+
+def test_export() -> None:
+    report = [
+        FieldCoverage(
+            model="Book",
+            field="title",
+            language="de",
+            rows=3,
+            translated=1,
+            fallbacks={1: 1},
+            fallback_values=1,
+        )
+    ]
+
+    assert json.loads(to_json(report)) == [
+        {
+            "model": "Book",
+            "field": "title",
+            "language": "de",
+            "rows": 3,
+            "translated": 1,
+            "fallbacks": {"1": 1},
+            "fallback_values": 1,
+            "coverage": 1 / 3,
+        }
+    ]
+    assert list(csv.reader(io.StringIO(to_csv(report)))) == [
+        list(CSV_HEADER),
+        ["Book", "title", "de", "3", "1", "0.3333", '{"1": 1}', "1"],
+    ]
+
+
+@pytest.fixture
+def models_module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[str, Any, None]:
+    (tmp_path / "coverage_models.py").write_text(MODELS_MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "coverage_models"
+    sys.modules.pop("coverage_models", None)
+
+
+def test_cli(models_module: str, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    url = f"sqlite:///{tmp_path / 'cli.db'}"
+    assert main(["migrate", models_module, "--url", url]) == 0
+    capsys.readouterr()
+
+    assert main(["coverage", models_module, "--url", url]) == 0
+    assert [entry["language"] for entry in json.loads(capsys.readouterr().out)] == ["en", "pl"]
+    assert main(["coverage", models_module, "--url", url, "--format", "csv", "--workers", "1"]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        ",".join(CSV_HEADER),
+        "Book,title,en,0,0,1.0,{},0",
+        # every fallback depth is reported, with no rows
+        'Book,title,pl,0,0,1.0,"{""1"": 0}",0',
+    ]
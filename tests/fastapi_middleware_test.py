@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI, WebSocket
+from fastapi.testclient import TestClient
+from starlette.types import Receive, Scope, Send
+
+from src.modeltranslation.fastapi_middleware import (
+    LanguageNegotiator,
+    TranslationMiddleware,
+    apply_translation,
+)
+from src.modeltranslation.translator import Translator
+
+
+@pytest.fixture
+def translator() -> Translator:
+    return Translator(
+        default_language="en",
+        languages=("en", "pl"),
+    )
+
+
+@pytest.fixture
+def client(translator: Translator) -> TestClient:
+    app = FastAPI()
+    apply_translation(app, translator)
+
+    @app.get("/language")
+    def get_language() -> str:
+        return translator.get_active_language()
+
+    @app.websocket("/language")
+    async def websocket_language(websocket: WebSocket) -> None:
+        await websocket.accept()
+        await websocket.send_text(translator.get_active_language())
+        await websocket.close()
+
+    return TestClient(app)
+
+
+def test_language_set_from_header(client: TestClient) -> None:
+    response = client.get("/language", headers={"accept-language": "pl"})
+
+    assert response.json() == "pl"
+
+
+def test_first_supported_language_used(client: TestClient) -> None:
+    response = client.get("/language", headers={"accept-language": "fr,pl;q=0.9,en;q=0.8"})
+
+    assert response.json() == "pl"
+
+
+def test_region_subtag_matches_language(client: TestClient) -> None:
+    response = client.get("/language", headers={"accept-language": "pl-PL,en-US;q=0.5"})
+
+    assert response.json() == "pl"
+
+
+def test_default_language_without_header(client: TestClient) -> None:
+    response = client.get("/language")
+
+    assert response.json() == "en"
+
+
+def test_default_language_for_unsupported_header(client: TestClient) -> None:
+    response = client.get("/language", headers={"accept-language": "fr"})
+
+    assert response.json() == "en"
+
+
+def test_language_set_for_websocket(client: TestClient) -> None:
+    with client.websocket_connect("/language", headers={"accept-language": "pl"}) as websocket:
+        assert websocket.receive_text() == "pl"
+
+
+def test_language_reset_after_request(translator: Translator) -> None:
+    languages = []
+
+    async def app(_scope: Scope, _receive: Receive, _send: Send) -> None:
+        languages.append(translator.get_active_language())
+
+    async def request() -> str:
+        middleware = TranslationMiddleware(app, translator)
+        await middleware({"type": "http", "headers": [(b"accept-language", b"pl")]}, None, None)
+        return translator.get_active_language()
+
+    assert asyncio.run(request()) == "en"
+    assert languages == ["pl"]
+
+
+@pytest.mark.parametrize(
+    ("header", "language"),
+    [
+        ("pl", "pl"),
+        ("en;q=0.5, pl", "pl"),
+        ("en;q=0.8, pl;q=0.8", "en"),
+        ("fr-FR,pl-PL;q=0.9,en;q=0.8", "pl"),
+        ("EN-us", "en"),
+        ("pt", "pt-BR"),
+        ("zh-Hant-TW", "zh-Hant"),
+        ("fr, *;q=0.1", "en"),
+        ("en;q=0, *", "pl"),
+        ("pl;q=0", None),
+        ("pl;q=abc, en;q=0.5", "en"),
+        ("fr", None),
+        ("", None),
+    ],
+)
+def test_language_negotiation(header: str, language: str | None) -> None:
+    negotiator = LanguageNegotiator(languages=("en", "pl", "pt-BR", "zh-Hant"), default_language="en")
+
+    assert negotiator(header) == language
+    assert negotiator(header.encode()) == language
+
+
+def test_language_negotiation_memoized() -> None:
+    negotiator = LanguageNegotiator(languages=("en", "pl"), default_language="en", cache_size=2)
+
+    for header in ("pl", "pl", "en", "fr", "pl"):
+        negotiator(header)
+
+    cache_info = negotiator.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.currsize == 2
@@ -0,0 +1,108 @@
+from collections.abc import Callable
+
+import pytest
+from sqlalchemy import Engine, create_mock_engine
+from sqlmodel import Field, Session, SQLModel, select
+
+from src.modeltranslation.exceptions import ImproperlyConfiguredError
+from src.modeltranslation.translator import Translator
+
+INDEXED_COLUMNS = {"title": (str, Field(index=True)), "author": str}
+
+
+def index_names(model: type[SQLModel]) -> list[str]:
+    return sorted(index.name for index in model.__table__.indexes)  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def query_plan(session: Session, statement: object) -> str:
+    compiled = statement.compile(session.get_bind(), compile_kwargs={"literal_binds": True})  # pyright: ignore[reportAttributeAccessIssue]
+    return " ".join(
+        row[-1] for row in session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}")
+    )
+
+
+def test_indexes_inherited_from_field(register_book: Callable[..., type[SQLModel]]) -> None:
+    book_cls = register_book(columns=INDEXED_COLUMNS, fields=("title", "author"))
+
+    assert index_names(book_cls) == [
+        "ix_book_title",
+        "ix_book_title_de",
+        "ix_book_title_en",
+        "ix_book_title_pl",
+    ]
+
+
+def test_indexed_fields(
+    engine: Engine, translator: Translator, register_book: Callable[..., type[SQLModel]]
+) -> None:
+    book_cls = register_book(columns=INDEXED_COLUMNS, fields=("title", "author"), indexed_fields=("author",))
+
+    assert index_names(book_cls) == [
+        "ix_book_author_de",
+        "ix_book_author_en",
+        "ix_book_author_pl",
+        "ix_book_title",
+    ]
+
+    SQLModel.metadata.create_all(engine)
+    translator.set_active_language("pl")
+    with Session(engine) as session:
+        plan = query_plan(session, select(book_cls.id).where(book_cls.author == "Tolkien"))
+    assert "INDEX ix_book_author_pl" in plan
+
+
+def test_fallback_indexes(
+    engine: Engine,
+    translator: Translator,
+    register_book: Callable[..., type[SQLModel]],
+    count_queries: Callable[..., list[str]],
+) -> None:
+    book_cls = register_book(
+        columns=INDEXED_COLUMNS,
+        fallback_languages={"default": ("en",), "de": ("pl", "en")},
+        fallback_values="No translation",
+        sql_fallbacks=True,
+        fallback_indexes=True,
+    )
+
+    assert "ix_book_title_de_fallback" in index_names(book_cls)
+
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            [book_cls(title="The Hobbit", author="Tolkien"), book_cls(title_pl="Lalka", author="Prus")]
+        )
+        session.commit()
+
+        statements = count_queries()
+        translator.set_active_language("de")
+        statement = select(book_cls.id).where(book_cls.title == "Lalka")
+        assert session.exec(statement).all() == [2]
+        # the fallback value is inlined, like in the index
+        assert "'No translation')" in statements[-1]
+        assert "INDEX ix_book_title_de_fallback" in query_plan(session, statement)
+        assert session.exec(select(book_cls.id).where(book_cls.title == "No translation")).all() == []
+
+
+def test_fallback_indexes_other_dialects(register_book: Callable[..., type[SQLModel]]) -> None:
+    register_book(columns=INDEXED_COLUMNS, fallback_indexes=True)
+
+    statements = []
+    engine = create_mock_engine(
+        "mysql://", lambda statement, *_: statements.append(str(statement.compile()))
+    )
+    SQLModel.metadata.create_all(engine, checkfirst=False)
+
+    assert any("ix_book_title_pl " in statement for statement in statements)
+    assert not any("_fallback" in statement for statement in statements)
+
+
+@pytest.mark.parametrize(
+    ("option", "value"),
+    [("indexed_fields", ("author",)), ("storage", "table"), ("storage", "json")],
+)
+def test_invalid_index_options(
+    option: str, value: object, register_book: Callable[..., type[SQLModel]]
+) -> None:
+    with pytest.raises(ImproperlyConfiguredError):
+        register_book(**{"columns": INDEXED_COLUMNS, "indexed_fields": ("title",), option: value})
@@ -0,0 +1,148 @@
+import json
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel, select
+
+from src.modeltranslation.exceptions import ImproperlyConfiguredError
+from src.modeltranslation.translator import Translator
+
+JSON_OPTIONS: dict[str, Any] = {
+    "columns": {"title": str, "pages": int},
+    "fields": ("title", "pages"),
+    "storage": "json",
+    "fallback_values": {"title": "No translation"},
+    "fallback_languages": {"default": ("en",), "de": ("pl", "en")},
+}
+
+BOOKS = [
+    {"title": {"en": "The Hobbit", "pl": "Hobbit"}, "pages": 310},
+    {"title": {"en": "Dune", "de": "Der Wüstenplanet"}, "pages": {"en": 412}},
+]
+
+
+def test_json_column_schema(register_book: Callable[..., type[SQLModel]]) -> None:
+    book_cls = register_book(**JSON_OPTIONS)
+
+    assert [column.name for column in book_cls.__table__.columns] == [  # pyright: ignore[reportAttributeAccessIssue]
+        "id",
+        "title",
+        "pages",
+        "title_i18n",
+        "pages_i18n",
+    ]
+
+
+def test_json_column_read_write(
+    engine: Engine,
+    translator: Translator,
+    register_book: Callable[..., type[SQLModel]],
+    seed_books: Callable[..., None],
+) -> None:
+    book_cls = register_book(**JSON_OPTIONS)
+    seed_books(book_cls, BOOKS)
+
+    with Session(engine) as session:
+        hobbit, dune = session.exec(select(book_cls).order_by(book_cls.id)).all()  # pyright: ignore[reportArgumentType]
+        # only the present translations are stored
+        assert hobbit.title_i18n == {"en": "The Hobbit", "pl": "Hobbit"}  # pyright: ignore[reportAttributeAccessIssue]
+
+        translator.set_active_language("de")
+        # de falls back to pl, then to the default language
+        assert (hobbit.title, dune.title) == ("Hobbit", "Der Wüstenplanet")  # pyright: ignore[reportAttributeAccessIssue]
+        assert hobbit.pages == 310  # pyright: ignore[reportAttributeAccessIssue]
+        hobbit.title = "Der Hobbit"  # pyright: ignore[reportAttributeAccessIssue]
+        dune.title = None  # pyright: ignore[reportAttributeAccessIssue]
+        session.commit()
+
+    with Session(engine) as session:
+        hobbit, dune = session.exec(select(book_cls).order_by(book_cls.id)).all()  # pyright: ignore[reportArgumentType]
+        assert hobbit.title_i18n == {"en": "The Hobbit", "pl": "Hobbit", "de": "Der Hobbit"}  # pyright: ignore[reportAttributeAccessIssue]
+        assert dune.title_i18n == {"en": "Dune"}  # pyright: ignore[reportAttributeAccessIssue]
+        translator.set_active_language("de")
+        assert json.loads(hobbit.model_dump_json())["title"] == "Der Hobbit"
+
+
+def test_json_column_fallback_value(register_book: Callable[..., type[SQLModel]]) -> None:
+    book_cls = register_book(**JSON_OPTIONS)
+
+    book = book_cls(pages=1)
+    assert book.title == "No translation"  # pyright: ignore[reportAttributeAccessIssue]
+    book.title = None  # pyright: ignore[reportAttributeAccessIssue]
+    assert book.title_i18n is None  # pyright: ignore[reportAttributeAccessIssue]
+
+
+@pytest.mark.parametrize("sql_fallbacks", [False, True])
+def test_json_column_queries(  # noqa: PLR0913, PLR0917
+    engine: Engine,
+    translator: Translator,
+    sql_fallbacks: bool,  # noqa: FBT001
+    register_book: Callable[..., type[SQLModel]],
+    seed_books: Callable[..., None],
+    count_queries: Callable[..., list[str]],
+) -> None:
+    book_cls = register_book(**JSON_OPTIONS, sql_fallbacks=sql_fallbacks)
+    seed_books(book_cls, BOOKS)
+    translator.set_active_language("pl")
+
+    statements = count_queries()
+    with Session(engine) as session:
+        assert session.exec(select(book_cls.id).where(book_cls.title == "Hobbit")).all() == [1]
+        titles = session.exec(select(book_cls.title).order_by(book_cls.id)).all()
+        assert session.exec(select(book_cls.id).where(book_cls.pages > 400)).all() == (
+            [2] if sql_fallbacks else []
+        )
+
+    assert titles == (["Hobbit", "Dune"] if sql_fallbacks else ["Hobbit", None])
+    assert "JSON_EXTRACT(book.title_i18n" in statements[0]
+
+
+@pytest.mark.parametrize("defer_unused_languages", [False, True])
+def test_json_column_resolve_query(  # noqa: PLR0913, PLR0917
+    engine: Engine,
+    translator: Translator,
+    defer_unused_languages: bool,  # noqa: FBT001
+    register_book: Callable[..., type[SQLModel]],
+    seed_books: Callable[..., None],
+    count_queries: Callable[..., list[str]],
+) -> None:
+    book_cls = register_book(**JSON_OPTIONS, defer_unused_languages=defer_unused_languages)
+    seed_books(book_cls, BOOKS)
+
+    statements = count_queries()
+    with Session(engine) as session:
+        rows = translator.resolve_query(session, select(book_cls).order_by(book_cls.id), language="de")
+
+    assert rows == [
+        {"title": "Hobbit", "pages": 310},
+        {"title": "Der Wüstenplanet", "pages": 412},
+    ]
+    # a single query, extracting the languages of the chain instead of loading the JSON columns
+    assert len(statements) == 1
+    assert statements[0].count("JSON_EXTRACT(book.title_i18n") == 3
+    assert "book.title_i18n" not in statements[0].replace("JSON_EXTRACT(book.title_i18n", "")
+
+
+@pytest.mark.parametrize(
+    ("option", "value"),
+    [("storage", "json_blob"), ("required_languages", ("en",))],
+)
+def test_json_column_invalid_options(
+    register_book: Callable[..., type[SQLModel]], option: str, value: object
+) -> None:
+    with pytest.raises(ImproperlyConfiguredError):
+        register_book(**{"storage": "json", option: value})
+
+
+def test_json_column_bulk_import(
+    engine: Engine, translator: Translator, register_book: Callable[..., type[SQLModel]]
+) -> None:
+    book_cls = register_book(**JSON_OPTIONS)
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session, pytest.raises(ImproperlyConfiguredError):
+        translator.bulk_import(
+            session, book_cls, [{"pk": 1, "field": "title", "language": "pl", "value": "x"}]
+        )
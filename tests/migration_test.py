@@ -0,0 +1,277 @@
+import sys
+from collections.abc import Callable, Generator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from sqlalchemy import Engine, create_engine, text
+from sqlmodel import Field, SQLModel
+
+from src.modeltranslation.__main__ import main
+from src.modeltranslation.exceptions import ImproperlyConfiguredError
+from src.modeltranslation.translator import Translator
+
+# the schema of a database created when the translator had the languages ("en", "pl")
+OLD_SCHEMA = (
+    (
+        "CREATE TABLE book (id INTEGER PRIMARY KEY, title VARCHAR, author VARCHAR, "
+        "title_en VARCHAR, title_pl VARCHAR)"
+    ),
+    "CREATE INDEX ix_book_title ON book (title)",
+    "CREATE INDEX ix_book_title_en ON book (title_en)",
+    "CREATE INDEX ix_book_title_pl ON book (title_pl)",
+)
+
+MIGRATION_OPTIONS: dict[str, Any] = {
+    "columns": {"title": (str, Field(index=True)), "author": str},
+    "fallback_languages": {"default": ("en",), "de": ("pl", "en")},
+}
+
+MODELS_MODULE = """
+from sqlmodel import Field, SQLModel
+
+from src.modeltranslation.translator import TranslationOptions, Translator
+
+translator = Translator(default_language="en", languages=("en", "pl", "de"))
+
+
+class Book(SQLModel, table=True):
+    id: int | None = Field(default=None, primary_key=True)
+    title: str = Field(index=True)
+    author: str
+
+
+@translator.register(Book)
+class BookTranslationOptions(TranslationOptions):
+    fields = ("title",)
+    fallback_languages = {"default": ("en",), "de": ("pl", "en")}
+"""
+
+EDITIONS_MODULE = """
+from sqlmodel import Field, SQLModel
+
+from src.modeltranslation.translator import TranslationOptions, Translator
+
+translator = Translator(default_language="en", languages=("en", "pl"))
+
+
+class Edition(SQLModel, table=True):
+    isbn: str = Field(primary_key=True)
+    title: str
+
+
+@translator.register(Edition)
+class EditionTranslationOptions(TranslationOptions):
+    fields = ("title",)
+"""
+
+
+@pytest.fixture
+def old_engine(tmp_path: Path) -> Generator[Engine, Any, None]:
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    with engine.begin() as connection:
+        for statement in OLD_SCHEMA:
+            connection.exec_driver_sql(statement)
+        connection.execute(
+            text(
+                "INSERT INTO book (id, title_en, title_pl, author) VALUES (:id, :title_en, :title_pl, 'x')"
+            ),
+            [
+                {"id": i, "title_en": f"title {i}", "title_pl": f"tytuł {i}" if i % 2 else None}
+                for i in range(1, 8)
+            ],
+        )
+    yield engine
+    engine.dispose()
+
+
+def titles(engine: Engine, language: str) -> list[Any]:
+    with engine.connect() as connection:
+        statement = text(f"SELECT title_{language} FROM book ORDER BY id")  # noqa: S608
+        return list(connection.scalars(statement))
+
+
+def test_schema_changes(
+    old_engine: Engine, translator: Translator, register_book: Callable[..., type[SQLModel]]
+) -> None:
+    register_book(**MIGRATION_OPTIONS)
+
+    with old_engine.begin() as connection:
+        statements = [
+            str(statement.compile(connection)).strip() for statement in translator.schema_changes(connection)
+        ]
+        assert statements == [
+            "ALTER TABLE book ADD COLUMN title_de VARCHAR",
+            "CREATE INDEX ix_book_title_de ON book (title_de)",
+        ]
+        assert len(translator.migrate_schema(connection)) == 2
+        assert translator.schema_changes(connection) == []
+
+    assert titles(old_engine, "de") == [None] * 7
+
+
+def test_schema_changes_create_missing_tables(
+    engine: Engine, translator: Translator, register_book: Callable[..., type[SQLModel]]
+) -> None:
+    register_book(**MIGRATION_OPTIONS, storage="table")
+
+    with engine.begin() as connection:
+        statements = [
+            str(statement.compile(connection)).split("(")[0].strip()
+            for statement in translator.schema_changes(connection)
+        ]
+        assert statements == [
+            "CREATE TABLE book",
+            "CREATE INDEX ix_book_title ON book",
+            "CREATE TABLE book_translation",
+        ]
+        translator.migrate_schema(connection)
+        assert translator.schema_changes(connection) == []
+
+
+@pytest.mark.parametrize(
+    ("source", "expected"),
+    [
+        # de falls back to pl, then en
+        ("fallback", ["tytuł 1", "title 2", "tytuł 3", "title 4", "tytuł 5", "title 6", "tytuł 7"]),
+        ("default", [f"title {i}" for i in range(1, 8)]),
+    ],
+)
+def test_backfill_language(
+    old_engine: Engine,
+    translator: Translator,
+    source: str,
+    expected: list[str],
+    register_book: Callable[..., type[SQLModel]],
+) -> None:
+    book_cls = register_book(**MIGRATION_OPTIONS)
+    with old_engine.begin() as connection:
+        translator.migrate_schema(connection)
+        connection.execute(text("UPDATE book SET title_de = 'Titel 4' WHERE id = 4"))
+
+    progress: list[int] = []
+    rows = translator.backfill_language(
+        old_engine, book_cls, "de", source=source, batch_size=3, progress=progress.append
+    )
+
+    assert rows == 7
+    assert progress == [3, 6, 7]
+    # existing translations are kept
+    expected[3] = "Titel 4"
+    assert titles(old_engine, "de") == expected
+    assert titles(old_engine, "pl")[:2] == ["tytuł 1", None]
+
+
+def test_backfill_resumes_after_pk(
+    old_engine: Engine, translator: Translator, register_book: Callable[..., type[SQLModel]]
+) -> None:
+    book_cls = register_book(**MIGRATION_OPTIONS)
+    with old_engine.begin() as connection:
+        translator.migrate_schema(connection)
+
+    assert translator.backfill_language(old_engine, book_cls, "de", source="default", after=5) == 2
+    assert titles(old_engine, "de") == [None] * 5 + ["title 6", "title 7"]
+    assert translator.backfill_language(old_engine, book_cls, "en", source="default") == 0
+
+
+def test_backfill_undefined_translations(
+    old_engine: Engine, translator: Translator, register_book: Callable[..., type[SQLModel]]
+) -> None:
+    book_cls = register_book(**MIGRATION_OPTIONS, fallback_undefined={"title": ""})
+    with old_engine.begin() as connection:
+        translator.migrate_schema(connection)
+        connection.execute(text("UPDATE book SET title_de = CASE id WHEN 1 THEN '' ELSE 'Titel' END"))
+
+    assert translator.backfill_language(old_engine, book_cls, "de") == 7
+    # the undefined value is replaced, like a missing one
+    assert titles(old_engine, "de") == ["tytuł 1"] + ["Titel"] * 6
+
+
+def test_backfill_language_errors(
+    engine: Engine, translator: Translator, register_book: Callable[..., type[SQLModel]]
+) -> None:
+    book_cls = register_book(**MIGRATION_OPTIONS)
+
+    with pytest.raises(ValueError, match="'fr' is not one of the translator languages"):
+        translator.backfill_language(engine, book_cls, "fr")
+    with pytest.raises(ValueError, match="'source' must be 'fallback' or 'default'"):
+        translator.backfill_language(engine, book_cls, "de", source="pl")
+
+
+def test_backfill_needs_columns_storage(
+    engine: Engine, translator: Translator, register_book: Callable[..., type[SQLModel]]
+) -> None:
+    book_cls = register_book(**MIGRATION_OPTIONS, storage="json")
+
+    with pytest.raises(ImproperlyConfiguredError, match="backfill requires the 'columns' storage"):
+        translator.backfill_language(engine, book_cls, "de")
+
+
+@pytest.fixture
+def models_module(
+    request: pytest.FixtureRequest, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[str, Any, None]:
+    (tmp_path / "cli_models.py").write_text(getattr(request, "param", MODELS_MODULE))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "cli_models"
+    sys.modules.pop("cli_models", None)
+
+
+def test_cli(
+    old_engine: Engine, models_module: str, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    url = f"sqlite:///{tmp_path / 'app.db'}"
+
+    assert main(["migrate", f"{models_module}:translator", "--url", url, "--dry-run"]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "ALTER TABLE book ADD COLUMN title_de VARCHAR;",
+        "CREATE INDEX ix_book_title_de ON book (title_de);",
+    ]
+    assert main(["migrate", models_module, "--url", url]) == 0
+    assert main(["migrate", models_module, "--url", url]) == 0
+    assert capsys.readouterr().out.splitlines()[-1] == "-- the schema is up to date"
+
+    args = ["backfill", models_module, "--url", url, "--language", "de", "--batch-size", "4"]
+    assert main([*args, "--model", "Book", "--after", "4"]) == 0
+    assert capsys.readouterr().out.splitlines() == ["Book: filled up to 7", "Book: 3 rows"]
+    assert titles(old_engine, "de") == [None] * 4 + ["tytuł 5", "title 6", "tytuł 7"]
+    assert main(args) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "Book: filled up to 4",
+        "Book: filled up to 7",
+        "Book: 7 rows",
+    ]
+    assert titles(old_engine, "de")[:2] == ["tytuł 1", "title 2"]
+
+    assert main([*args, "--model", "Author"]) == 1
+    assert "'Author' is not registered" in capsys.readouterr().err
+    assert main([*args, "--model", "Book", "--after", "four"]) == 1
+    assert "--after 'four' is not a valid int primary key of 'Book'" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        main([*args, "--after", "4"])
+    with pytest.raises(SystemExit):
+        main(["migrate", f"{models_module}:missing", "--url", url])
+
+
+@pytest.mark.parametrize("models_module", [EDITIONS_MODULE], ids=["editions"], indirect=True)
+def test_cli_string_primary_keys(
+    models_module: str, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    url = f"sqlite:///{tmp_path / 'editions.db'}"
+    assert main(["migrate", models_module, "--url", url]) == 0
+    engine = create_engine(url)
+    with engine.begin() as connection:
+        connection.execute(
+            text("INSERT INTO edition (isbn, title, title_en) VALUES (:isbn, '', :isbn)"),
+            [{"isbn": f"00{i}"} for i in range(1, 8)],
+        )
+    capsys.readouterr()
+
+    args = ["backfill", models_module, "--url", url, "--language", "pl", "--model", "Edition"]
+    # "005" stays a string, it isn't the integer 5
+    assert main([*args, "--after", "005"]) == 0
+    assert capsys.readouterr().out.splitlines() == ["Edition: filled up to 007", "Edition: 2 rows"]
+    with engine.connect() as connection:
+        statement = text("SELECT title_pl FROM edition ORDER BY isbn")
+        assert list(connection.scalars(statement)) == [None] * 5 + ["006", "007"]
+    engine.dispose()
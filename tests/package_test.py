@@ -0,0 +1,19 @@
+import sys
+
+import pytest
+
+import src.modeltranslation
+
+
+def test_web_integrations_imported_on_access() -> None:
+    from src.modeltranslation.fastapi_middleware import TranslationMiddleware, apply_translation  # noqa: PLC0415
+
+    assert src.modeltranslation.apply_translation is apply_translation
+    assert src.modeltranslation.TranslationMiddleware is TranslationMiddleware
+    assert "fastapi" in sys.modules
+    assert set(src.modeltranslation.__all__) <= set(dir(src.modeltranslation))
+
+
+def test_unknown_attribute() -> None:
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        src.modeltranslation.missing  # noqa: B018
@@ -0,0 +1,173 @@
+from collections.abc import Callable, Generator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from sqlalchemy import Engine, create_engine, inspect
+from sqlmodel import Session, SQLModel, select
+
+from src.modeltranslation.exceptions import ImproperlyConfiguredError
+from src.modeltranslation.translator import Translator
+
+LANGUAGES = ("en", "pl", "de")
+
+PARTITION_OPTIONS: dict[str, Any] = {
+    "storage": "table",
+    "partitioned": True,
+    "fallback_languages": {"default": ("en",), "de": ("pl", "en")},
+}
+
+BOOKS = [
+    {"title": {"en": "The Hobbit", "pl": "Hobbit"}, "author": "J.R.R. Tolkien"},
+    {"title": {"en": "Dune"}, "author": "Frank Herbert"},
+]
+
+
+@pytest.fixture
+def partitions(tmp_path: Path) -> Generator[dict[str, Engine], Any, None]:
+    engines = {language: create_engine(f"sqlite:///{tmp_path / language}.db") for language in LANGUAGES}
+    yield engines
+    for engine in engines.values():
+        engine.dispose()
+
+
+@pytest.fixture
+def seeded_book(
+    partitions: dict[str, Engine],
+    translator: Translator,
+    register_book: Callable[..., type[SQLModel]],
+    seed_books: Callable[..., None],
+) -> type[SQLModel]:
+    book_cls = register_book(**PARTITION_OPTIONS)
+    translator.create_partitions(partitions)
+    seed_books(book_cls, BOOKS, binds=translator.partition_binds(partitions))
+    return book_cls
+
+
+def take_counts(statements: dict[str, list[str]]) -> dict[str, int]:
+    """Return the number of statements executed in each queried partition, and start counting again."""
+    counts = {language: len(executed) for language, executed in statements.items() if executed}
+    for executed in statements.values():
+        executed.clear()
+    return counts
+
+
+def test_partition_tables(
+    engine: Engine,
+    partitions: dict[str, Engine],
+    translator: Translator,
+    register_book: Callable[..., type[SQLModel]],
+) -> None:
+    book_cls = register_book(**PARTITION_OPTIONS)
+    SQLModel.metadata.create_all(engine)
+    translator.create_partitions(partitions)
+
+    # the partitions are only created in their own database
+    assert inspect(engine).get_table_names() == ["book"]
+    for language, partition in partitions.items():
+        table_name = f"book_translation_{language}"
+        assert inspect(partition).get_table_names() == [table_name]
+        assert [column["name"] for column in inspect(partition).get_columns(table_name)] == [
+            "parent_id",
+            "title",
+        ]
+
+    binds = translator.partition_binds(partitions)
+    assert {model.__tablename__: bind for model, bind in binds.items()} == {
+        f"book_translation_{language}": partition for language, partition in partitions.items()
+    }
+    assert book_cls not in binds
+
+
+def test_partitioned_read_write(
+    engine: Engine, partitions: dict[str, Engine], translator: Translator, seeded_book: type[SQLModel]
+) -> None:
+    book_cls = seeded_book
+
+    with partitions["pl"].connect() as connection:
+        assert connection.exec_driver_sql("SELECT parent_id, title FROM book_translation_pl").all() == [
+            (1, "Hobbit")
+        ]
+
+    with Session(engine, binds=translator.partition_binds(partitions)) as session:
+        hobbit, dune = session.exec(select(book_cls).order_by(book_cls.id)).all()  # pyright: ignore[reportArgumentType]
+        assert (hobbit.title, dune.title) == ("The Hobbit", "Dune")
+        translator.set_active_language("de")
+        assert (hobbit.title, dune.title) == ("Hobbit", "Dune")
+        assert translator.resolve_many([hobbit, dune], fields=("id", "title")) == [
+            {"id": 1, "title": "Hobbit"},
+            {"id": 2, "title": "Dune"},
+        ]
+
+        dune.title = "Der Wüstenplanet"
+        session.delete(hobbit)
+        session.commit()
+
+    with Session(engine, binds=translator.partition_binds(partitions)) as session:
+        dune = session.exec(select(book_cls)).one()
+        assert dune.title == "Der Wüstenplanet"
+        translator.set_active_language("pl")
+        assert dune.title == "Dune"
+    # translation rows are deleted with their parent in every partition
+    with partitions["pl"].connect() as connection:
+        assert connection.exec_driver_sql("SELECT count(*) FROM book_translation_pl").scalar() == 0
+
+
+def test_only_chain_partitions_are_queried(
+    engine: Engine,
+    partitions: dict[str, Engine],
+    translator: Translator,
+    seeded_book: type[SQLModel],
+    count_queries: Callable[..., list[str]],
+) -> None:
+    book_cls = seeded_book
+    statements = {language: count_queries(partition) for language, partition in partitions.items()}
+
+    translator.set_active_language("pl")
+    with Session(engine, binds=translator.partition_binds(partitions)) as session:
+        statement = select(book_cls).options(translator.defer_unused_languages(book_cls))
+        books = session.exec(statement).all()
+        assert [book.title for book in books] == ["Hobbit", "Dune"]
+    # pl falls back to the default `en`, `de` is never reached
+    assert take_counts(statements) == {"pl": 1, "en": 1}
+
+    with Session(engine, binds=translator.partition_binds(partitions)) as session:
+        rows = translator.resolve_query(session, select(book_cls), fields=("title",), language="de")
+        assert rows == [{"title": "Hobbit"}, {"title": "Dune"}]
+    assert take_counts(statements) == {"de": 1, "pl": 1, "en": 1}
+
+    with Session(engine, binds=translator.partition_binds(partitions)) as session:
+        books = session.exec(select(book_cls).options(translator.load_languages(book_cls, ("en",)))).all()
+        translator.set_active_language("en")
+        assert [book.title for book in books] == ["The Hobbit", "Dune"]
+    assert take_counts(statements) == {"en": 1}
+
+
+def test_partitioned_fields_not_queryable(register_book: Callable[..., type[SQLModel]]) -> None:
+    book_cls = register_book(**PARTITION_OPTIONS)
+
+    with pytest.raises(ImproperlyConfiguredError, match="its translations are partitioned"):
+        select(book_cls).where(book_cls.title == "Hobbit")
+
+
+def test_partition_binds_need_every_language(
+    partitions: dict[str, Engine], translator: Translator, register_book: Callable[..., type[SQLModel]]
+) -> None:
+    register_book(**PARTITION_OPTIONS)
+
+    with pytest.raises(ImproperlyConfiguredError, match=r"no partition for the languages \('de',\)"):
+        translator.partition_binds({"en": partitions["en"], "pl": partitions["pl"]})
+
+
+@pytest.mark.parametrize(
+    ("options", "error"),
+    [
+        ({"storage": "columns"}, "'partitioned' is only supported with 'table' storage"),
+        ({"storage": "table", "sql_fallbacks": True}, "'sql_fallbacks' is not supported"),
+    ],
+)
+def test_partitioned_options_validation(
+    register_book: Callable[..., type[SQLModel]], options: dict[str, Any], error: str
+) -> None:
+    with pytest.raises(ImproperlyConfiguredError, match=error):
+        register_book(partitioned=True, **options)
@@ -0,0 +1,155 @@
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from sqlalchemy import Engine, inspect, select, update
+from sqlmodel import Field, Session, SQLModel
+
+from src.modeltranslation.exceptions import ImproperlyConfiguredError
+from src.modeltranslation.translator import Translator
+
+RESOLVED_OPTIONS: dict[str, Any] = {
+    "columns": {"title": (str, Field(index=True)), "description": str, "year": int},
+    "fields": ("title", "description"),
+    "fallback_languages": {"default": ("en",), "de": ("pl", "en")},
+    "fallback_values": {"description": "No translation"},
+    "resolved_tables": True,
+}
+
+BOOKS = [
+    {"title": {"en": "The Hobbit"}, "description": {"en": "An adventure"}, "year": 1937},
+    {"title": {"pl": "Lalka", "en": "The Doll"}, "year": 1890},
+]
+
+
+@pytest.fixture
+def resolved_book(register_book: Callable[..., type[SQLModel]]) -> type[SQLModel]:
+    return register_book(**RESOLVED_OPTIONS)
+
+
+@pytest.fixture
+def seeded_book(resolved_book: type[SQLModel], seed_books: Callable[..., None]) -> type[SQLModel]:
+    seed_books(resolved_book, BOOKS)
+    return resolved_book
+
+
+def read(engine: Engine, translator: Translator, book_cls: type[SQLModel], language: str) -> list[tuple]:
+    table = translator.resolved_table(book_cls, language)
+    with engine.connect() as connection:
+        return [tuple(row) for row in connection.execute(select(table).order_by(table.c.id))]
+
+
+def test_resolved_tables_created_with_model(
+    engine: Engine, translator: Translator, resolved_book: type[SQLModel]
+) -> None:
+    book_cls = resolved_book
+    SQLModel.metadata.create_all(engine)
+
+    inspector = inspect(engine)
+    assert {"book_en_resolved", "book_pl_resolved", "book_de_resolved"} <= set(inspector.get_table_names())
+    assert [column["name"] for column in inspector.get_columns("book_pl_resolved")] == [
+        "id",
+        "title",
+        "description",
+    ]
+    # fields indexed on the model are indexed in every resolved table
+    assert [index["column_names"] for index in inspector.get_indexes("book_pl_resolved")] == [["title"]]
+
+    SQLModel.metadata.drop_all(engine)
+    assert not any(name.endswith("_resolved") for name in inspect(engine).get_table_names())
+    assert translator.resolved_table(book_cls, "pl").name == "book_pl_resolved"
+
+
+def test_resolved_values(engine: Engine, translator: Translator, seeded_book: type[SQLModel]) -> None:
+    book_cls = seeded_book
+
+    assert read(engine, translator, book_cls, "en") == [
+        (1, "The Hobbit", "An adventure"),
+        (2, "The Doll", "No translation"),
+    ]
+    assert read(engine, translator, book_cls, "pl") == [
+        (1, "The Hobbit", "An adventure"),
+        (2, "Lalka", "No translation"),
+    ]
+    # de falls back to pl, then en
+    assert read(engine, translator, book_cls, "de") == read(engine, translator, book_cls, "pl")
+
+    translator.set_active_language("fr")
+    assert translator.resolved_table(book_cls) is translator.resolved_table(book_cls, "en")
+
+
+def test_resolved_tables_follow_flushes(
+    engine: Engine, translator: Translator, seeded_book: type[SQLModel]
+) -> None:
+    book_cls = seeded_book
+
+    with Session(engine) as session:
+        hobbit = session.get(book_cls, 1)
+        doll = session.get(book_cls, 2)
+        translator.set_active_language("pl")
+        hobbit.title = "Hobbit"  # pyright: ignore[reportOptionalMemberAccess]
+        session.delete(doll)
+        session.add(book_cls(title_en="Dune", description_de="Ein Roman", year=1965))
+        session.commit()
+
+    assert read(engine, translator, book_cls, "pl") == [
+        (1, "Hobbit", "An adventure"),
+        (3, "Dune", "No translation"),
+    ]
+    assert read(engine, translator, book_cls, "de") == [
+        (1, "Hobbit", "An adventure"),
+        (3, "Dune", "Ein Roman"),
+    ]
+    assert read(engine, translator, book_cls, "en")[0] == (1, "The Hobbit", "An adventure")
+
+
+def test_rollback_discards_refresh(
+    engine: Engine, translator: Translator, seeded_book: type[SQLModel]
+) -> None:
+    book_cls = seeded_book
+
+    with Session(engine) as session:
+        session.get(book_cls, 1).title_en = "Changed"  # pyright: ignore[reportOptionalMemberAccess]
+        session.flush()
+        session.rollback()
+
+    assert read(engine, translator, book_cls, "en")[0] == (1, "The Hobbit", "An adventure")
+
+
+def test_rebuild_resolved_tables(
+    engine: Engine, translator: Translator, seeded_book: type[SQLModel]
+) -> None:
+    book_cls = seeded_book
+
+    with Session(engine) as session:
+        session.exec(update(book_cls).where(book_cls.id == 1).values(title_pl="Hobbit"))  # pyright: ignore[reportCallIssue, reportArgumentType]
+        session.commit()
+    # statements bypass the flush
+    assert read(engine, translator, book_cls, "pl")[0] == (1, "The Hobbit", "An adventure")
+
+    with Session(engine) as session:
+        translator.rebuild_resolved_tables(session, book_cls)
+        session.commit()
+    assert read(engine, translator, book_cls, "pl") == [
+        (1, "Hobbit", "An adventure"),
+        (2, "Lalka", "No translation"),
+    ]
+
+    translator.resolved_table(book_cls, "en").drop(engine)
+    with engine.begin() as connection:
+        translator.rebuild_resolved_tables(connection, book_cls)
+    assert read(engine, translator, book_cls, "en")[1] == (2, "The Doll", "No translation")
+
+
+def test_resolved_tables_not_enabled(
+    translator: Translator, register_book: Callable[..., type[SQLModel]]
+) -> None:
+    book_cls = register_book()
+
+    with pytest.raises(ImproperlyConfiguredError, match="has no 'resolved_tables'"):
+        translator.resolved_table(book_cls)
+
+
+def test_resolved_tables_need_columns_storage(register_book: Callable[..., type[SQLModel]]) -> None:
+    with pytest.raises(ImproperlyConfiguredError, match="'resolved_tables' is not supported"):
+        register_book(storage="json", resolved_tables=True)
@@ -0,0 +1,181 @@
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from sqlalchemy import Engine, text, update
+from sqlmodel import Field, Session, SQLModel
+
+from src.modeltranslation.exceptions import ImproperlyConfiguredError
+from src.modeltranslation.translator import TranslationOptions, Translator
+
+SEARCH_OPTIONS: dict[str, Any] = {
+    "columns": {"title": str, "description": str},
+    "fields": ("title", "description"),
+    "fallback_languages": {"default": ("en",), "de": ("pl", "en")},
+    "fallback_values": "No translation",
+    "search_fields": ("title", "description"),
+}
+
+BOOKS = [
+    {"title": {"en": "The Hobbit"}, "description": {"en": "A hobbit goes on an adventure"}},
+    {"title": {"pl": "Lalka"}, "description": {"pl": "Powieść o kupcu i arystokratce"}},
+    {
+        "title": {"en": "Café stories"},
+        "description": {"en": "Stories of a hobbit and other people in a café"},
+    },
+]
+
+
+@pytest.fixture
+def searchable_book(
+    register_book: Callable[..., type[SQLModel]], seed_books: Callable[..., None]
+) -> type[SQLModel]:
+    book_cls = register_book(**SEARCH_OPTIONS)
+    seed_books(book_cls, BOOKS)
+    return book_cls
+
+
+@pytest.mark.usefixtures("searchable_book")
+def test_search_tables(engine: Engine) -> None:
+    with engine.connect() as connection:
+        tables = connection.execute(text("SELECT name FROM sqlite_master WHERE name LIKE 'book_search_%'"))
+        assert {"book_search_en", "book_search_pl", "book_search_de"} <= set(tables.scalars())
+
+    SQLModel.metadata.drop_all(engine)
+    with engine.connect() as connection:
+        assert (
+            connection.execute(text("SELECT name FROM sqlite_master WHERE name LIKE 'book_search%'")).all()
+            == []
+        )
+
+
+def test_search_fallbacks_and_ranking(
+    engine: Engine, translator: Translator, searchable_book: type[SQLModel]
+) -> None:
+    book_cls = searchable_book
+
+    with Session(engine) as session:
+        # the title and the description match the first book
+        assert translator.search(session, book_cls, "hobbit", language="en") == [1, 3]
+        assert translator.search(session, book_cls, "lalka", language="en") == []
+        # de falls back to pl, then en, fallback values are not indexed
+        assert sorted(
+            translator.search(session, book_cls, "lalka OR adventure", language="de", raw=True)
+        ) == [1, 2]
+        assert translator.search(session, book_cls, "translation", language="de") == []
+        assert translator.search(session, book_cls, "cafe", language="de", limit=1) == [3]
+
+        translator.set_active_language("pl")
+        assert translator.search(session, book_cls, "powieść") == [2]
+        translator.set_active_language("fr")
+        assert translator.search(session, book_cls, "adv*", raw=True) == [1]
+
+
+def test_search_user_input(engine: Engine, translator: Translator, searchable_book: type[SQLModel]) -> None:
+    book_cls = searchable_book
+
+    with Session(engine) as session:
+        translator.set_active_language("en")
+        # punctuation, quotes and operators are matched as text
+        for query in ("hobbit's", "hobbit-", '"', "hobbit AND", "NOT", "adv*", ""):
+            translator.search(session, book_cls, query)
+        assert translator.search(session, book_cls, "Hobbit, adventure!") == [1]
+        assert translator.search(session, book_cls, "hobbit OR lalka") == []
+
+        with pytest.raises(ValueError, match="invalid full-text query"):
+            translator.search(session, book_cls, "hobbit AND", raw=True)
+
+
+def test_search_region_languages(engine: Engine) -> None:
+    translator = Translator(default_language="en", languages=("en", "pt-BR"))
+
+    class Book(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+
+    @translator.register(Book)
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title",)
+        search_fields = ("title",)
+
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        translator.set_active_language("pt-BR")
+        session.add(Book(title="O Hobbit"))
+        session.commit()
+
+        assert translator.search(session, Book, "hobbit") == [1]
+        translator.rebuild_search_index(session, Book)
+        assert translator.search(session, Book, "hobbit", language="en") == []
+
+    SQLModel.metadata.drop_all(engine)
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT name FROM sqlite_master WHERE name LIKE 'book%'")).all() == []
+
+
+def test_search_follows_flushes(
+    engine: Engine, translator: Translator, searchable_book: type[SQLModel]
+) -> None:
+    book_cls = searchable_book
+
+    with Session(engine) as session:
+        hobbit, lalka = session.get(book_cls, 1), session.get(book_cls, 2)
+        translator.set_active_language("de")
+        hobbit.title = "Der kleine Hobbit"  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
+        session.delete(lalka)
+        session.flush()
+
+        assert translator.search(session, book_cls, "kleine") == [1]
+        assert translator.search(session, book_cls, "lalka") == []
+
+        session.rollback()
+        # the search tables are written in the transaction of the session
+        assert translator.search(session, book_cls, "kleine") == []
+        assert translator.search(session, book_cls, "lalka") == [2]
+
+
+def test_rebuild_search_index(
+    engine: Engine, translator: Translator, searchable_book: type[SQLModel]
+) -> None:
+    book_cls = searchable_book
+
+    with Session(engine) as session:
+        session.execute(update(book_cls).where(book_cls.id == 2).values(title_en="The Doll"))  # pyright: ignore[reportArgumentType]
+        assert translator.search(session, book_cls, "doll", language="en") == []
+
+        translator.rebuild_search_index(session, book_cls)
+        assert translator.search(session, book_cls, "doll", language="en") == [2]
+        assert translator.search(session, book_cls, "adventure", language="en") == [1]
+
+
+def test_search_not_enabled(
+    engine: Engine, translator: Translator, register_book: Callable[..., type[SQLModel]]
+) -> None:
+    book_cls = register_book()
+
+    with Session(engine) as session, pytest.raises(ImproperlyConfiguredError):
+        translator.search(session, book_cls, "hobbit")
+
+
+@pytest.mark.parametrize(
+    ("option", "value"),
+    [("search_fields", ("author",)), ("storage", "json")],
+)
+def test_invalid_search_options(
+    register_book: Callable[..., type[SQLModel]], option: str, value: object
+) -> None:
+    with pytest.raises(ImproperlyConfiguredError):
+        register_book(**{"search_fields": ("title",), option: value})
+
+
+def test_search_integer_primary_key(translator: Translator) -> None:
+    class Edition(SQLModel, table=True):
+        isbn: str = Field(primary_key=True)
+        title: str
+
+    with pytest.raises(ImproperlyConfiguredError):
+
+        @translator.register(Edition)
+        class EditionTranslationOptions(TranslationOptions):
+            fields = ("title",)
+            search_fields = ("title",)
@@ -0,0 +1,182 @@
+import json
+import sys
+import threading
+
+import pytest
+from sqlalchemy.engine import Engine
+from sqlmodel import Field, Session, SQLModel, select
+
+from src.modeltranslation.exceptions import ImproperlyConfiguredError
+from src.modeltranslation.stats import ResolutionStats, TranslationStats, to_prometheus
+from src.modeltranslation.translator import TranslationOptions, Translator
+
+
+@pytest.fixture
+def translator() -> Translator:
+    return Translator(default_language="en", languages=("en", "pl", "de"), collect_stats=True)
+
+
+@pytest.fixture
+def books(engine: Engine, translator: Translator) -> list[SQLModel]:
+    class Book(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+        author: str
+
+    @translator.register(Book)
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title",)
+        fallback_languages = {"default": ("de", "en")}
+        fallback_values = "No translation"
+
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            Book.__table__.insert(),  # pyright: ignore[reportAttributeAccessIssue]
+            [
+                {"id": pk, "title_en": en, "title_pl": pl, "title_de": de, "author": "Unknown"}
+                for pk, en, pl, de in (
+                    (1, "The Hobbit", "Hobbit", None),
+                    (2, "1984", None, "Neunzehnhundertvierundachtzig"),
+                    (3, "Dune", None, None),
+                    (4, None, None, None),
+                )
+            ],
+        )
+    with Session(engine) as session:
+        return list(session.exec(select(Book).order_by(Book.id)).all())  # pyright: ignore[reportArgumentType]
+
+
+def test_get_stats_counts_reads_by_depth(translator: Translator, books: list[SQLModel]) -> None:
+    translator.set_active_language("pl")
+    assert [book.title for book in books] == [
+        "Hobbit",
+        "Neunzehnhundertvierundachtzig",
+        "Dune",
+        "No translation",
+    ]
+
+    assert translator.get_stats() == [
+        ResolutionStats(
+            model="Book", field="title", language="pl", direct=1, fallbacks={1: 1, 2: 1}, fallback_values=1
+        )
+    ]
+    assert translator.get_stats()[0].total == 4
+
+
+def test_get_stats_language_outside_languages(translator: Translator, books: list[SQLModel]) -> None:
+    translator.set_active_language("fr")
+    assert books[0].title == "The Hobbit"
+
+    assert translator.get_stats() == [
+        ResolutionStats(model="Book", field="title", language="fr", direct=0, fallbacks={2: 1})
+    ]
+
+
+def test_get_stats_counts_serialization_and_resolve_many(
+    translator: Translator, books: list[SQLModel]
+) -> None:
+    translator.set_active_language("pl")
+    assert json.loads(books[0].model_dump_json())["title"] == "Hobbit"
+    assert translator.get_stats() == [ResolutionStats(model="Book", field="title", language="pl", direct=1)]
+
+    translator.reset_stats()
+    assert translator.get_stats() == []
+
+    translator.resolve_many(books, language="pl")
+    translator.resolve_many(books, fields=("author",), language="pl")
+
+    assert translator.get_stats() == [
+        ResolutionStats(
+            model="Book", field="title", language="pl", direct=1, fallbacks={1: 1, 2: 1}, fallback_values=1
+        )
+    ]
+
+
+@pytest.mark.parametrize("storage", ["table", "json"])
+def test_get_stats_stored_translations(engine: Engine, translator: Translator, storage: str) -> None:
+    class Book(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title",)
+        fallback_languages = {"default": ("de", "en")}
+
+    BookTranslationOptions.storage = storage
+    translator.register(Book)(BookTranslationOptions)
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        book = Book(title="The Hobbit")
+        session.add(book)
+        session.commit()
+
+        translator.set_active_language("pl")
+        assert book.title == "The Hobbit"
+        translator.set_active_language("en")
+        assert json.loads(book.model_dump_json())["title"] == "The Hobbit"
+
+    assert translator.get_stats() == [
+        ResolutionStats(model="Book", field="title", language="en", direct=1),
+        ResolutionStats(model="Book", field="title", language="pl", direct=0, fallbacks={2: 1}),
+    ]
+
+
+def test_snapshot_while_counting() -> None:
+    stats = TranslationStats()
+    done = threading.Event()
+
+    def count() -> None:
+        # keys are added and cleared again, so the snapshots stay small
+        while not done.is_set():
+            for depth in range(100):
+                stats.record("Book", "title", "pl", depth)
+            stats.reset()
+
+    # switch threads as often as possible, in the middle of taking snapshots
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    thread = threading.Thread(target=count)
+    thread.start()
+    try:
+        for _ in range(2000):
+            stats.snapshot()
+    finally:
+        done.set()
+        thread.join()
+        sys.setswitchinterval(switch_interval)
+
+
+def test_get_stats_disabled(translator_en_pl_instance: tuple[Translator, type[SQLModel]]) -> None:
+    translator, _ = translator_en_pl_instance
+
+    with pytest.raises(ImproperlyConfiguredError):
+        translator.get_stats()
+    with pytest.raises(ImproperlyConfiguredError):
+        translator.reset_stats()
+
+
+def test_to_prometheus() -> None:
+    stats = [
+        ResolutionStats(model="Book", field="title", language="pl", direct=3, fallbacks={1: 2, 2: 1}),
+    ]
+
+    assert to_prometheus(stats) == (
+        "# HELP modeltranslation_reads_total Reads of translated fields by how they were resolved.\n"
+        "# TYPE modeltranslation_reads_total counter\n"
+        'modeltranslation_reads_total{model="Book",field="title",language="pl",outcome="direct"} 3\n'
+        'modeltranslation_reads_total{model="Book",field="title",language="pl",outcome="fallback"} 3\n'
+        'modeltranslation_reads_total{model="Book",field="title",language="pl",outcome="fallback_value"} 0\n'
+        "# HELP modeltranslation_fallback_reads_total "
+        "Reads of translated fields resolved by a fallback language.\n"
+        "# TYPE modeltranslation_fallback_reads_total counter\n"
+        'modeltranslation_fallback_reads_total{model="Book",field="title",language="pl",depth="1"} 2\n'
+        'modeltranslation_fallback_reads_total{model="Book",field="title",language="pl",depth="2"} 1\n'
+    )
+
+
+def test_to_prometheus_escapes_label_values() -> None:
+    stats = [ResolutionStats(model='Book"s', field="title", language="pl")]
+
+    assert 'model="Book\\"s"' in to_prometheus(stats)
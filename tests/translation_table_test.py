@@ -0,0 +1,162 @@
+import json
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from sqlalchemy.engine import Engine
+from sqlmodel import Field, Session, SQLModel, select
+
+from src.modeltranslation.exceptions import ImproperlyConfiguredError
+from src.modeltranslation.translation_table import TRANSLATIONS
+from src.modeltranslation.translator import TranslationOptions, Translator
+
+TABLE_OPTIONS: dict[str, Any] = {"storage": "table", "fallback_values": "No translation"}
+
+BOOKS = [
+    {"title": {"en": "The Hobbit", "pl": "Hobbit"}, "author": "J.R.R. Tolkien"},
+    {"title": {"en": "Dune"}, "author": "Frank Herbert"},
+]
+
+
+def test_translation_table_schema(register_book: Callable[..., type[SQLModel]]) -> None:
+    book_cls = register_book(**TABLE_OPTIONS)
+
+    assert [column.name for column in book_cls.__table__.columns] == ["id", "title", "author"]  # pyright: ignore[reportAttributeAccessIssue]
+    translation_table = SQLModel.metadata.tables["book_translation"]
+    assert [column.name for column in translation_table.columns] == ["parent_id", "language", "title"]
+    assert [column.name for column in translation_table.primary_key.columns] == ["parent_id", "language"]
+
+
+def test_translation_table_read_write(
+    engine: Engine,
+    translator: Translator,
+    register_book: Callable[..., type[SQLModel]],
+    seed_books: Callable[..., None],
+) -> None:
+    book_cls = register_book(**TABLE_OPTIONS)
+    seed_books(book_cls, BOOKS)
+
+    with Session(engine) as session:
+        hobbit, dune = session.exec(select(book_cls).order_by(book_cls.id)).all()  # pyright: ignore[reportArgumentType]
+        assert sorted(getattr(hobbit, TRANSLATIONS)) == ["en", "pl"]
+
+        translator.set_active_language("pl")
+        assert (hobbit.title, dune.title) == ("Hobbit", "Dune")  # pyright: ignore[reportAttributeAccessIssue]
+
+        translator.set_active_language("de")
+        assert hobbit.title == "The Hobbit"  # pyright: ignore[reportAttributeAccessIssue]
+        dune.title = "Der Wüstenplanet"  # pyright: ignore[reportAttributeAccessIssue]
+        session.commit()
+
+    with Session(engine) as session:
+        dune = session.get(book_cls, 2)
+        assert dune.title == "Der Wüstenplanet"  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
+        assert json.loads(dune.model_dump_json())["title"] == "Der Wüstenplanet"  # pyright: ignore[reportOptionalMemberAccess]
+
+
+def test_translation_table_fallback_value(register_book: Callable[..., type[SQLModel]]) -> None:
+    book_cls = register_book(**TABLE_OPTIONS)
+
+    book = book_cls(author="Anonymous")
+    assert book.title == "No translation"  # pyright: ignore[reportAttributeAccessIssue]
+    # writing None where there is no translation doesn't create a row
+    book.title = None  # pyright: ignore[reportAttributeAccessIssue]
+    assert getattr(book, TRANSLATIONS) == {}
+
+
+def test_translation_table_selectin_loading(
+    engine: Engine,
+    translator: Translator,
+    register_book: Callable[..., type[SQLModel]],
+    seed_books: Callable[..., None],
+    count_queries: Callable[..., list[str]],
+) -> None:
+    book_cls = register_book(**TABLE_OPTIONS)
+    seed_books(book_cls, BOOKS)
+
+    statements = count_queries()
+    with Session(engine) as session:
+        books = session.exec(select(book_cls)).all()
+        translator.set_active_language("pl")
+        assert [book.title for book in books] == ["Hobbit", "Dune"]  # pyright: ignore[reportAttributeAccessIssue]
+
+    assert len(statements) == 2
+    assert "book_translation.parent_id IN" in statements[1]
+
+
+@pytest.mark.parametrize("sql_fallbacks", [False, True])
+def test_translation_table_queries(
+    engine: Engine,
+    translator: Translator,
+    sql_fallbacks: bool,  # noqa: FBT001
+    register_book: Callable[..., type[SQLModel]],
+    seed_books: Callable[..., None],
+) -> None:
+    book_cls = register_book(**TABLE_OPTIONS, sql_fallbacks=sql_fallbacks)
+    seed_books(book_cls, BOOKS)
+    translator.set_active_language("pl")
+
+    with Session(engine) as session:
+        assert session.exec(select(book_cls.id).where(book_cls.title == "Hobbit")).all() == [1]
+        titles = session.exec(select(book_cls.title).order_by(book_cls.id)).all()
+
+    assert titles == (["Hobbit", "Dune"] if sql_fallbacks else ["Hobbit", None])
+
+
+def test_translation_table_delete_and_resolve_many(
+    engine: Engine,
+    translator: Translator,
+    register_book: Callable[..., type[SQLModel]],
+    seed_books: Callable[..., None],
+) -> None:
+    book_cls = register_book(**TABLE_OPTIONS)
+    seed_books(book_cls, BOOKS)
+
+    with Session(engine) as session:
+        books = session.exec(select(book_cls).order_by(book_cls.id)).all()  # pyright: ignore[reportArgumentType]
+        assert translator.resolve_many(books, fields=("id", "title"), language="pl") == [
+            {"id": 1, "title": "Hobbit"},
+            {"id": 2, "title": "Dune"},
+        ]
+
+        session.delete(books[0])
+        session.commit()
+        translation_model = type(next(iter(getattr(books[1], TRANSLATIONS).values())))
+        assert [row.parent_id for row in session.exec(select(translation_model)).all()] == [2]
+
+
+@pytest.mark.parametrize(
+    ("option", "value"),
+    [("storage", "json_blob"), ("required_languages", ("en",)), ("defer_unused_languages", True)],
+)
+def test_translation_table_invalid_options(
+    register_book: Callable[..., type[SQLModel]], option: str, value: object
+) -> None:
+    with pytest.raises(ImproperlyConfiguredError):
+        register_book(**{**TABLE_OPTIONS, option: value})
+
+
+def test_translation_table_composite_primary_key(translator: Translator) -> None:
+    class Edition(SQLModel, table=True):
+        isbn: str = Field(primary_key=True)
+        year: int = Field(primary_key=True)
+        title: str
+
+    with pytest.raises(ImproperlyConfiguredError):
+
+        @translator.register(Edition)
+        class EditionTranslationOptions(TranslationOptions):
+            fields = ("title",)
+            storage = "table"
+
+
+def test_translation_table_bulk_import(
+    engine: Engine, translator: Translator, register_book: Callable[..., type[SQLModel]]
+) -> None:
+    book_cls = register_book(**TABLE_OPTIONS)
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session, pytest.raises(ImproperlyConfiguredError):
+        translator.bulk_import(
+            session, book_cls, [{"pk": 1, "field": "title", "language": "pl", "value": "x"}]
+        )
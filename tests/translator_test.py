@@ -1,9 +1,13 @@
-from typing import Annotated
+import json
+from collections.abc import Callable
+from typing import Annotated, Any
 
 import pytest
-from pydantic import StringConstraints, ValidationError
+from pydantic import StringConstraints, ValidationError, field_serializer
+from sqlalchemy import inspect
 from sqlalchemy.engine import Engine
-from sqlmodel import Field, Session, SQLModel, select, update
+from sqlalchemy.orm import joinedload, selectinload
+from sqlmodel import Field, Relationship, Session, SQLModel, select, update
 
 from src.modeltranslation.exceptions import ImproperlyConfiguredError
 from src.modeltranslation.translator import TranslationOptions, Translator
@@ -230,6 +234,77 @@ def test_translation_register_undefined_lang(book_cls: type[SQLModel]) -> None:
             required_languages = ("fr",)
 
 
+def test_register_many(book_cls: type[SQLModel]) -> None:
+    class Author(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        biography: str
+
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title",)
+
+    class AuthorTranslationOptions(TranslationOptions):
+        fields = ("biography",)
+
+    translator = Translator(default_language="en", languages=("en", "pl"))
+    translator.register_many({book_cls: BookTranslationOptions, Author: AuthorTranslationOptions})
+    translator.set_active_language("pl")
+
+    book = book_cls(title="Hobbit", author="J.R.R. Tolkien")
+    author = Author(name="J.R.R. Tolkien", biography="Pisarz")
+    assert (book.title_pl, book.title) == ("Hobbit", "Hobbit")  # pyright: ignore[reportAttributeAccessIssue]
+    assert (author.biography_pl, author.biography) == ("Pisarz", "Pisarz")  # pyright: ignore[reportAttributeAccessIssue]
+    assert "title_pl" in book_cls.model_fields
+    assert "biography_pl" in Author.model_fields
+
+
+def test_register_many_invalid_options_change_no_model(book_cls: type[SQLModel]) -> None:
+    class Author(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        biography: str
+
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title",)
+
+    class AuthorTranslationOptions(TranslationOptions):
+        fields = ("biography",)
+        required_languages = ("fr",)
+
+    translator = Translator(default_language="en", languages=("en", "pl"))
+
+    with pytest.raises(ImproperlyConfiguredError):
+        translator.register_many({book_cls: BookTranslationOptions, Author: AuthorTranslationOptions})
+
+    assert "title_en" not in book_cls.model_fields
+    assert "title_en" not in book_cls.__table__.columns  # pyright: ignore[reportAttributeAccessIssue]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"storage": "table"}, {"storage": "table", "partitioned": True}, {"search_fields": ("title",)}],
+)
+def test_register_many_invalid_model_change_no_model(
+    engine: Engine, book_cls: type[SQLModel], options: dict[str, Any]
+) -> None:
+    class Tag(SQLModel, table=True):
+        slug: str = Field(primary_key=True)
+        language: str = Field(primary_key=True)
+        title: str
+
+    options = {"fields": ("title",), **options}
+    book_options = type("BookTranslationOptions", (TranslationOptions,), options)
+    tag_options = type("TagTranslationOptions", (TranslationOptions,), options)
+    translator = Translator(default_language="en", languages=("en", "pl"))
+
+    with pytest.raises(ImproperlyConfiguredError, match=r"on '(Tag|tag)'"):
+        translator.register_many({book_cls: book_options, Tag: tag_options})
+
+    assert not hasattr(book_cls, "translations")
+    assert not hasattr(book_cls, "translations_en")
+    SQLModel.metadata.create_all(engine)
+    assert set(inspect(engine).get_table_names()) == {"book", "tag"}
+
+
 def test_translation_required_lang_annotations() -> None:
     class Book(SQLModel, table=True):
         id: int | None = Field(default=None, primary_key=True)
@@ -850,3 +925,445 @@ def test_set_active_language_not_in_languages(engine: Engine) -> None:
     assert books[0].title == "en The Hobbit"
     assert books[1].title == "pl 1984"
     assert books[2].title == "en To Kill a Mockingbird"
+
+
+def test_class_routing_scoped_to_registered_model(
+    translator_en_pl_instance: tuple[Translator, type[SQLModel]],
+) -> None:
+    translator, book_cls = translator_en_pl_instance
+
+    class Magazine(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+
+    translator.set_active_language("pl")
+
+    assert book_cls.title.key == "title_pl"
+    assert Magazine.title.key == "title"
+    assert Magazine(title="Vogue").title == "Vogue"
+
+
+def test_required_languages_as_dict_annotations() -> None:
+    class Book(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+        author: str
+
+    translator = Translator(
+        default_language="en",
+        languages=("en", "pl", "fr"),
+    )
+
+    @translator.register(Book)
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title", "author")
+        required_languages = {"en": ("title", "author"), "default": ("title",)}
+
+    annotations = Book.__annotations__
+    assert annotations["title_en"] is str
+    assert annotations["author_en"] is str
+    assert annotations["title_pl"] is str
+    assert annotations["author_pl"] == (str | None)
+    assert annotations["title_fr"] is str
+    assert annotations["author_fr"] == (str | None)
+
+
+def test_sql_fallbacks_in_queries(engine: Engine) -> None:
+    class Book(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+
+    translator = Translator(
+        default_language="en",
+        languages=("en", "pl", "fr"),
+    )
+
+    @translator.register(Book)
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title",)
+        fallback_languages = {"fr": ("pl",), "default": ("en",)}
+        fallback_undefined = {"title": "no title"}
+        fallback_values = {"title": "Does not exist"}
+        sql_fallbacks = True
+
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add_all(
+            [
+                Book(id=1, title_en="en The Hobbit", title_pl="no title"),
+                Book(id=2, title_en="en 1984", title_pl="pl 1984"),
+                Book(id=3, title_fr="fr TKaM"),
+                Book(id=4),
+            ]
+        )
+        session.commit()
+
+        translator.set_active_language("fr")
+
+        titles = session.exec(select(Book.title).order_by(Book.id)).all()
+        assert titles == ["en The Hobbit", "pl 1984", "fr TKaM", "Does not exist"]
+
+        book = session.exec(select(Book).where(Book.title == "pl 1984")).one()
+        assert book.id == 2
+
+        ids = session.exec(select(Book.id).order_by(Book.title)).all()
+        assert ids == [4, 1, 3, 2]
+
+        translator.set_active_language("pl")
+
+        titles = session.exec(select(Book.title).order_by(Book.id)).all()
+        assert titles == ["en The Hobbit", "pl 1984", "Does not exist", "Does not exist"]
+        assert titles == [book.title for book in session.exec(select(Book).order_by(Book.id)).all()]
+
+
+def test_fallback_expression(engine: Engine) -> None:
+    class Book(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+
+    translator = Translator(
+        default_language="en",
+        languages=("en", "pl"),
+    )
+
+    @translator.register(Book)
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title",)
+
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add_all(
+            [Book(id=1, title_en="en The Hobbit"), Book(id=2, title_en="en 1984", title_pl="pl 1984")]
+        )
+        session.commit()
+
+        translator.set_active_language("pl")
+
+        # without sql_fallbacks the class attribute is the column of the active language
+        assert session.exec(select(Book.title).order_by(Book.id)).all() == [None, "pl 1984"]
+
+        titles = session.exec(select(translator.fallback_expression(Book, "title")).order_by(Book.id)).all()
+        assert titles == ["en The Hobbit", "pl 1984"]
+
+        titles = session.exec(
+            select(translator.fallback_expression(Book, "title", "en")).order_by(Book.id)
+        ).all()
+        assert titles == ["en The Hobbit", "en 1984"]
+
+        # languages outside of `languages` share the expression of the `default` chain
+        expression = translator.fallback_expression(Book, "title", "fr")
+        assert translator.fallback_expression(Book, "title", "es") is expression
+        assert session.exec(select(expression).order_by(Book.id)).all() == ["en The Hobbit", "en 1984"]
+
+
+def test_fallback_expression_not_registered(book_cls: type[SQLModel]) -> None:
+    translator = Translator(
+        default_language="en",
+        languages=("en", "pl"),
+    )
+
+    with pytest.raises(ImproperlyConfiguredError):
+        translator.fallback_expression(book_cls, "title")
+
+
+def test_defer_unused_languages(engine: Engine) -> None:
+    class Book(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+
+    translator = Translator(
+        default_language="en",
+        languages=("en", "pl", "de", "fr"),
+        fallback_languages={"pl": ("de",), "default": ("en",)},
+    )
+
+    @translator.register(Book)
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title",)
+
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(Book(id=1, title_en="en The Hobbit", title_fr="fr Le Hobbit"))
+        session.commit()
+
+    translator.set_active_language("pl")
+
+    with Session(engine) as session:
+        book = session.exec(select(Book).options(translator.defer_unused_languages(Book))).one()
+
+        assert inspect(book).unloaded == {"title_fr"}
+        assert book.title == "en The Hobbit"
+        # deferred columns are loaded when touched
+        assert book.title_fr == "fr Le Hobbit"
+
+    with Session(engine) as session:
+        book = session.exec(select(Book).options(translator.defer_unused_languages(Book, "fr"))).one()
+
+        assert inspect(book).unloaded == {"title_pl", "title_de"}
+
+    # languages outside of `languages` share the option of the `default` chain
+    option = translator.defer_unused_languages(Book, "es")
+    assert translator.defer_unused_languages(Book, "it") is option
+    with Session(engine) as session:
+        book = session.exec(select(Book).options(option)).one()
+
+        assert inspect(book).unloaded == {"title_pl", "title_de", "title_fr"}
+
+
+def test_defer_unused_languages_policy(engine: Engine) -> None:
+    class Book(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+        author: str
+
+    translator = Translator(
+        default_language="en",
+        languages=("en", "pl", "de"),
+    )
+
+    @translator.register(Book)
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title", "author")
+        defer_unused_languages = True
+
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(Book(id=1, title_en="The Hobbit", title_pl="Hobbit", author_en="J.R.R. Tolkien"))
+        session.commit()
+
+    translator.set_active_language("pl")
+
+    with Session(engine) as session:
+        book = session.exec(select(Book)).one()
+        assert inspect(book).unloaded == {"title_de", "author_de"}
+        assert book.title == "Hobbit"
+        assert book.author == "J.R.R. Tolkien"
+
+        assert session.exec(select(Book.title)).all() == ["Hobbit"]
+
+    with Session(engine) as session:
+        book = session.get(Book, 1)
+        assert inspect(book).unloaded == {"title_de", "author_de"}
+
+
+@pytest.mark.parametrize("storage", ["columns", "json"])
+@pytest.mark.parametrize(
+    ("load", "queries"),
+    [(None, 2), (selectinload, 2), (joinedload, 1)],
+    ids=["lazy", "selectin", "joined"],
+)
+def test_defer_unused_languages_relationship_loads(  # noqa: PLR0913, PLR0917
+    engine: Engine,
+    translator: Translator,
+    count_queries: Callable[..., list[str]],
+    storage: str,
+    load: Callable[..., Any] | None,
+    queries: int,
+) -> None:
+    class Author(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        name: str
+        books: list["Book"] = Relationship(back_populates="author")
+
+    class Book(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+        author_id: int | None = Field(default=None, foreign_key="author.id")
+        author: Author | None = Relationship(back_populates="books")
+
+    options = {"fields": ("title",), "defer_unused_languages": True, "storage": storage}
+    translator.register(Book)(type("BookTranslationOptions", (TranslationOptions,), options))
+
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        books = [Book(id=i, title=f"Book {i}") for i in range(1, 6)]
+        translator.set_active_language("pl")
+        for i, book in enumerate(books, 1):
+            book.title = f"Ksiazka {i}"
+        session.add(Author(id=1, name="J.R.R. Tolkien", books=books))
+        session.commit()
+
+    statements = count_queries()
+
+    # the related books load the columns of the active language with them, not one by one
+    with Session(engine) as session:
+        statement = select(Author) if load is None else select(Author).options(load(Author.books))
+        author = session.exec(statement).unique().one()
+        assert [book.title for book in author.books] == [f"Ksiazka {i}" for i in range(1, 6)]
+    assert len(statements) == queries
+
+    # and so do models loaded through a relationship of a model loaded through a relationship
+    statements.clear()
+    with Session(engine) as session:
+        book = session.exec(select(Book).where(Book.id == 1)).one()
+        assert [book.title for book in book.author.books] == [f"Ksiazka {i}" for i in range(1, 6)]
+    assert len(statements) == 3
+
+
+def test_model_dump_json(engine: Engine) -> None:
+    class Book(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+        author: str | None = None
+
+    translator = Translator(
+        default_language="en",
+        languages=("en", "pl", "de"),
+    )
+
+    @translator.register(Book)
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title", "author")
+        fallback_values = {"author": "Unknown"}
+
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add_all([Book(id=1, title_en="The Hobbit", title_pl="Hobbit"), Book(id=2, title_en="1984")])
+        session.commit()
+
+    translator.set_active_language("pl")
+
+    with Session(engine) as session:
+        books = session.exec(select(Book).order_by(Book.id)).all()
+
+        assert [json.loads(book.model_dump_json()) for book in books] == [
+            {"id": 1, "title": "Hobbit", "author": "Unknown"},
+            {"id": 2, "title": "1984", "author": "Unknown"},
+        ]
+        assert json.loads(books[0].model_dump_json(include={"title"})) == {"title": "Hobbit"}
+
+        translator.set_active_language("de")
+        assert json.loads(books[0].model_dump_json()) == {
+            "id": 1,
+            "title": "The Hobbit",
+            "author": "Unknown",
+        }
+
+
+def test_model_dump_json_custom_serializer(engine: Engine) -> None:
+    class Book(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+        author: str
+
+        @field_serializer("author", when_used="json")
+        def serialize_author(self, author: str) -> str:
+            return author.upper()
+
+    translator = Translator(
+        default_language="en",
+        languages=("en", "pl"),
+    )
+
+    @translator.register(Book)
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title",)
+
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(Book(id=1, title_en="The Hobbit", title_pl="Hobbit", author="J.R.R. Tolkien"))
+        session.commit()
+
+    translator.set_active_language("pl")
+
+    with Session(engine) as session:
+        book = session.exec(select(Book)).one()
+
+        assert json.loads(book.model_dump_json()) == {"id": 1, "title": "Hobbit", "author": "J.R.R. TOLKIEN"}
+
+
+def test_resolve_many(engine: Engine) -> None:
+    class Book(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+        author: str
+
+    translator = Translator(
+        default_language="en",
+        languages=("en", "pl", "de"),
+        fallback_languages={"pl": ("de",), "default": ("en",)},
+    )
+
+    @translator.register(Book)
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title", "author")
+        fallback_undefined = {"title": ""}
+        fallback_values = {"author": "Unknown"}
+
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add_all(
+            [
+                Book(id=1, title_en="The Hobbit", title_pl="Hobbit", author_en="J.R.R. Tolkien"),
+                Book(id=2, title_en="1984", title_pl="", title_de="Neunzehnhundertvierundachtzig"),
+                Book(id=3, title_en="Dune"),
+            ]
+        )
+        session.commit()
+
+    translator.set_active_language("pl")
+
+    with Session(engine) as session:
+        books = session.exec(select(Book).order_by(Book.id)).all()
+
+        assert translator.resolve_many(books) == [
+            {"title": "Hobbit", "author": "J.R.R. Tolkien"},
+            {"title": "Neunzehnhundertvierundachtzig", "author": "Unknown"},
+            {"title": "Dune", "author": "Unknown"},
+        ]
+        assert translator.resolve_many(books) == [
+            {"title": book.title, "author": book.author} for book in books
+        ]
+        assert translator.resolve_many(books, fields=("id", "title"), language="en", as_tuples=True) == [
+            (1, "The Hobbit"),
+            (2, "1984"),
+            (3, "Dune"),
+        ]
+        assert translator.resolve_many([]) == []
+
+        with pytest.raises(ImproperlyConfiguredError):
+            translator.resolve_many(books, fields=("isbn",))
+
+
+def test_resolve_query(engine: Engine, count_queries: Callable[..., list[str]]) -> None:
+    class Book(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        title: str
+
+    translator = Translator(
+        default_language="en",
+        languages=("en", "pl", "de"),
+    )
+
+    @translator.register(Book)
+    class BookTranslationOptions(TranslationOptions):
+        fields = ("title",)
+
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add_all([Book(id=1, title_en="The Hobbit", title_pl="Hobbit"), Book(id=2, title_en="1984")])
+        session.commit()
+
+    queries = count_queries()
+
+    with Session(engine) as session:
+        statement = select(Book).order_by(Book.id.desc())
+
+        assert translator.resolve_query(session, statement, fields=("id", "title"), language="pl") == [
+            {"id": 2, "title": "1984"},
+            {"id": 1, "title": "Hobbit"},
+        ]
+
+    # the columns of other languages were not loaded
+    assert len(queries) == 1
+    assert "title_pl" in queries[0]
+    assert "title_de" not in queries[0]